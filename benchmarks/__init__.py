@@ -0,0 +1,9 @@
+"""
+End-to-end benchmarks of the query -> API -> consumer pipeline.
+
+All suites run against the simulator backend, so no GPU is needed:
+
+    python -m benchmarks                                # every suite, writes bench_results.json
+    python -m benchmarks --suites query,logger --gpus 64
+    python -m benchmarks --output new.json --compare old.json
+"""
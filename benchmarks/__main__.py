@@ -0,0 +1,112 @@
+import sys
+import json
+import time
+import argparse
+import platform
+import importlib
+import subprocess
+
+from benchmarks.common import ROOT
+
+SUITES = ["query", "api", "logger", "dashboard", "parser", "plot"]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Returns the metrics that got worse than the baseline by more than `threshold` (a fraction)."""
+    old, new = _flatten(baseline["suites"]), _flatten(current["suites"])
+    regressions = []
+    for name, before in old.items():
+        after = new.get(name)
+        if after is None or before <= 0:
+            continue
+        if name.endswith("_ms"):
+            change = (after - before) / before
+        elif name.endswith("_per_sec"):
+            change = (before - after) / before
+        else:
+            continue
+        if change > threshold:
+            regressions.append({"metric": name, "baseline": before, "current": after, "worse_by": change})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="GPU Monitor benchmark suite")
+    parser.add_argument("--suites", default=",".join(SUITES), help=f"Comma-separated subset of {SUITES}")
+    parser.add_argument("--gpus", type=int, default=8, help="Simulated GPU count")
+    parser.add_argument("--seed", type=int, default=0, help="Simulator seed")
+    parser.add_argument("--profile", default="steady", help="Simulator load profile(s)")
+    parser.add_argument("--backends", default="sim", help="Backends for the query suite, e.g. sim,nvml")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed iterations per measurement")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent API clients")
+    parser.add_argument("--requests", type=int, default=200, help="API requests per endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--rounds", type=int, default=500, help="Logger insert rounds")
+    parser.add_argument("--recording", help="Dashboard recording to replay instead of simulating (dashboard suite)")
+    parser.add_argument("--plots", type=int, default=10, help="Desktop plots on screen (plot suite)")
+    parser.add_argument("--points", type=int, default=10000, help="Points per desktop plot (plot suite)")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the results")
+    parser.add_argument("--compare", metavar="BASELINE", help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed regression (fraction)")
+    opts = parser.parse_args()
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "gpus": opts.gpus,
+            "seed": opts.seed,
+            "profile": opts.profile,
+        },
+        "suites": {},
+    }
+
+    for suite in opts.suites.split(","):
+        if suite not in SUITES:
+            parser.error(f"unknown suite '{suite}'")
+        print(f"Running {suite}...", file=sys.stderr)
+        try:
+            module = importlib.import_module(f"benchmarks.bench_{suite}")
+            report["suites"][suite] = module.run(opts)
+        except ImportError as e:
+            report["suites"][suite] = {"skipped": f"missing dependency: {e.name}"}
+        except RuntimeError as e:
+            report["suites"][suite] = {"skipped": str(e)}
+
+    with open(opts.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+    if opts.compare:
+        with open(opts.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, opts.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['metric']}: {r['baseline']:.3f} -> {r['current']:.3f} "
+                  f"({r['worse_by']:+.0%})", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""`core_api` endpoint latency percentiles and throughput under concurrent clients."""
+import os
+import sys
+import time
+import socket
+import tempfile
+import subprocess
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import CORE_DIR, sim_env, summarize
+
+# The first simulated GPU always has this UUID
+SIM_UUID = "GPU-0a1b2c3d-4e5f-6172-8192-334455667788"
+
+ENDPOINTS = [
+    "/gpu/list?method=sim",
+    "/gpu/metric?method=sim",
+    "/gpu/metrics/json?method=sim",
+    f"/gpu/metrics/json/{SIM_UUID}?method=sim",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _get(url: str) -> float:
+    start = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=30) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def _log_tail(log, lines: int = 20) -> str:
+    log.seek(0)
+    return "\n".join(log.read().decode(errors="replace").splitlines()[-lines:])
+
+
+def _wait_ready(base_url: str, server: subprocess.Popen, log, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"API server exited with code {server.returncode}:\n{_log_tail(log)}")
+        try:
+            _get(base_url + ENDPOINTS[0])
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("API server did not become ready")
+
+
+def run(opts) -> dict:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    # A file rather than a pipe: nobody reads the server's log while the benchmark runs,
+    # and a full pipe would block the server mid-run
+    log = tempfile.TemporaryFile()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "core_api:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(opts.workers), "--log-level", "warning"],
+        cwd=CORE_DIR, env={**os.environ, **sim_env(opts)},
+        stdout=subprocess.DEVNULL, stderr=log,
+    )
+    try:
+        _wait_ready(base_url, server, log)
+        results = {"clients": opts.clients, "workers": opts.workers, "endpoints": {}}
+        for endpoint in ENDPOINTS:
+            url = base_url + endpoint
+            _get(url)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=opts.clients) as pool:
+                samples = list(pool.map(_get, [url] * opts.requests))
+            elapsed = time.perf_counter() - start
+            stats = summarize(samples)
+            stats["requests_per_sec"] = len(samples) / elapsed
+            results["endpoints"][endpoint.split("?")[0].replace(SIM_UUID, "{uuid}")] = stats
+        return results
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        log.close()
@@ -0,0 +1,101 @@
+"""Terminal dashboard per-frame cost: ingesting a scrape, chart rasterization and curses rendering."""
+import sys
+import time
+
+from benchmarks.common import METRIC_FLAGS, configure_sim, measure, summarize
+
+
+def _render(opts, main_dashboard, raw: str) -> dict:
+    import curses
+    from framebuffer import FrameBuffer
+
+    def frames(stdscr):
+        curses.curs_set(0)
+        main_dashboard.init_colors()
+        scrape = main_dashboard.EXPOSITION_PARSER.parse(raw)
+        data = main_dashboard.standard_view_data(scrape)
+        all_gpus = {}
+        for _ in range(main_dashboard.MAX_DATA_POINTS):
+            main_dashboard.update_gpu_data(scrape, all_gpus)
+        frame = FrameBuffer(*stdscr.getmaxyx())
+        results = {"terminal": "{1}x{0}".format(*stdscr.getmaxyx())}
+
+        for name, draw in (("standard_view", lambda: main_dashboard.draw_standard_view(frame, data, all_gpus)),
+                           ("detailed_view", lambda: main_dashboard.draw_detailed_view(frame, all_gpus, "benchmark"))):
+            frame.resize(*stdscr.getmaxyx())
+            stdscr.clear()
+            draw()
+            first_cells = frame.flush(stdscr)
+            stdscr.refresh()
+
+            def redraw():
+                draw()
+                frame.flush(stdscr)
+                stdscr.refresh()
+
+            results[name] = summarize(measure(redraw, opts.iterations))
+            results[name]["first_frame_cells"] = first_cells
+        return results
+
+    return curses.wrapper(frames)
+
+
+def _replay(opts, main_dashboard) -> tuple:
+    """Feeds every frame of a recording through the dashboard's ingest path; returns the results and the last scrape"""
+    import recording
+    rec = recording.Recording(opts.recording)
+    decode, ingest = [], []
+    all_gpus = {}
+    raw = None
+    for i in range(len(rec)):
+        start = time.perf_counter()
+        frame = rec[i]
+        decoded = time.perf_counter()
+        main_dashboard.apply_frame(frame, all_gpus)
+        ingest.append(time.perf_counter() - decoded)
+        decode.append(decoded - start)
+        raw = frame.metrics or raw
+    rec.close()
+    if raw is None:
+        raise RuntimeError(f"{opts.recording} has no successful polls")
+    return {"frames": len(decode), "decode_frame": summarize(decode), "apply_frame": summarize(ingest)}, raw
+
+
+def run(opts) -> dict:
+    from core import GPUQuery
+    try:
+        from core_api import _render_prometheus
+        import main_dashboard
+        import braille
+    except ImportError as e:
+        return {"skipped": f"missing dependency: {e.name}"}
+
+    # A recording replaces the simulator as a fixed, server-free workload
+    if opts.recording:
+        replay, raw = _replay(opts, main_dashboard)
+    else:
+        configure_sim(opts)
+        raw = _render_prometheus(GPUQuery("sim").query_gpu(-1, METRIC_FLAGS))
+
+    def poll_frame():
+        scrape = main_dashboard.EXPOSITION_PARSER.parse(raw)
+        main_dashboard.standard_view_data(scrape)
+        main_dashboard.update_gpu_data(scrape, all_gpus)
+
+    all_gpus = {}
+    series = [float(i % 100) for i in range(2000)]
+    results = {
+        "exposition_bytes": len(raw),
+        "poll_frame": summarize(measure(poll_frame, opts.iterations)),
+        "braille_chart_120x10": summarize(
+            measure(lambda: braille.to_rows(braille.rasterize(series, 120, 10)), opts.iterations)),
+    }
+    if opts.recording:
+        results["replay"] = replay
+
+    # Rendering needs a real terminal; CI runs only get the parsing numbers
+    if sys.stdout.isatty():
+        results["render"] = _render(opts, main_dashboard, raw)
+    else:
+        results["render"] = {"skipped": "no terminal"}
+    return results
@@ -0,0 +1,50 @@
+"""`gpu_sql_logger` insert throughput, with one metrics row per GPU per logging round."""
+import os
+import time
+import sqlite3
+import datetime
+import tempfile
+
+from benchmarks.common import METRIC_FLAGS, configure_sim, summarize
+
+
+def run(opts) -> dict:
+    import gpu_sql_logger
+    from core import GPUQuery
+
+    configure_sim(opts)
+    data = GPUQuery("sim").query_gpu(-1, METRIC_FLAGS)
+    # The logger stores what /gpu/metrics/json returns; reuse the API's conversion when available
+    try:
+        from core_api import _process_gpu_metrics
+    except ImportError:
+        return {"skipped": "core_api dependencies (fastapi) not installed"}
+    rows = [_process_gpu_metrics(idx, gpu) for idx, gpu in data["gpus"].items()]
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(db_path)
+        gpu_sql_logger.create_gpu_info_table(conn)
+        for row in rows:
+            gpu_sql_logger.create_metrics_table_if_not_exists(conn, row["uuid"])
+
+        base = datetime.datetime(2024, 1, 1)
+        round_samples = []
+        start = time.perf_counter()
+        for i in range(opts.rounds):
+            timestamp = (base + datetime.timedelta(seconds=i)).isoformat()
+            round_start = time.perf_counter()
+            for row in rows:
+                gpu_sql_logger.insert_metrics(conn, row["uuid"], row["metrics"], timestamp)
+            round_samples.append(time.perf_counter() - round_start)
+        elapsed = time.perf_counter() - start
+        conn.close()
+
+        stats = summarize(round_samples)
+        stats["rows_per_sec"] = len(rows) * opts.rounds / elapsed
+        stats["gpus"] = len(rows)
+        stats["db_bytes"] = os.path.getsize(db_path)
+        return {"insert_round": stats}
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,107 @@
+"""
+Exposition parsing: the shared single-pass parser against the parsers it
+replaced (kept here verbatim, minus logging, as the comparison baseline).
+"""
+import re
+from collections import defaultdict
+
+from benchmarks.common import measure, summarize
+
+METRICS = [
+    "gpu_power_watts", "gpu_temperature_celsius", "gpu_clock_mhz", "gpu_memory_clock_mhz",
+    "gpu_utilization_percent", "gpu_memory_utilization_percent", "gpu_memory_used_mib",
+    "gpu_memory_total_mib", "gpu_memory_usage_percent", "gpu_fan_speed", "gpu_health_status",
+]
+
+
+def exposition(gpus: int) -> str:
+    """A /gpu/metric response for `gpus` GPUs, without going through the API."""
+    lines = []
+    for metric in METRICS:
+        lines += [f"# HELP {metric} {metric}", f"# TYPE {metric} gauge"]
+    for idx in range(gpus):
+        labels = f'gpu_uuid="GPU-{idx:08x}-0000-0000-0000-000000000000",gpu_index="{idx}",' \
+                 f'gpu_name="SIM-RTX4090",gpu_health="healthy"'
+        for n, metric in enumerate(METRICS):
+            lines.append(f"{metric}{{{labels}}} {(idx * 7 + n * 13) % 100 + 0.5}")
+    return "\n".join(lines) + "\n"
+
+
+_LEGACY_METRIC_LINE_RE = re.compile(r'^([\w:]+)\{([^}]*)\}\s+([0-9.eE+-]+)$')
+
+
+def legacy_tui_parse(text: str) -> None:
+    # main_dashboard.parse_prometheus_metrics
+    gpu_metrics = defaultdict(dict)
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        match = _LEGACY_METRIC_LINE_RE.match(line)
+        if match:
+            metric, labels_str, value = match.groups()
+            labels = dict(part.split('=') for part in labels_str.split(',') if '=' in part)
+            labels = {k.strip(): v.strip('"') for k, v in labels.items()}
+            gpu_index = labels.get("gpu_index", "?")
+            key = f"{gpu_index} - {labels.get('gpu_name', 'Unknown')}"
+            gpu_metrics[key][metric] = value
+            gpu_metrics[key]["uuid"] = labels.get("gpu_uuid", f"gpu_{gpu_index}")
+            gpu_metrics[key]["gpu_health"] = labels.get("gpu_health", "")
+
+    # main_dashboard.parse_all_gpu_data
+    metric_pattern = re.compile(r'([^\{]+)\{([^}]+)\}\s+([0-9.]+)')
+    name_pattern = re.compile(r'name="([^"]*)"')
+    uuid_pattern = re.compile(r'uuid="([^"]*)"')
+    gpu_index_pattern = re.compile(r'gpu_index="([^"]*)"')
+    all_gpus = {}
+    for line in text.strip().split('\n'):
+        metric_match = metric_pattern.search(line)
+        if metric_match:
+            labels_block = metric_match.group(2)
+            value = float(metric_match.group(3))
+            uuid_match = uuid_pattern.search(labels_block)
+            if uuid_match:
+                uuid = uuid_match.group(1)
+            else:
+                index_match = gpu_index_pattern.search(labels_block)
+                if not index_match:
+                    continue
+                uuid = f"gpu_{index_match.group(1)}"
+            if uuid not in all_gpus:
+                name_match = name_pattern.search(labels_block)
+                all_gpus[uuid] = {"name": name_match.group(1) if name_match else uuid}
+            all_gpus[uuid][metric_match.group(1)] = value
+
+
+def legacy_desktop_parse(text: str) -> None:
+    # GPUMonitor._parse_metrics
+    history = {}
+    for line in text.split('\n'):
+        if line.startswith('#') or not line.strip():
+            continue
+        try:
+            metric_name, rest = line.split('{', 1)
+            labels_part, value_part = rest.split('}', 1)
+            value = float(value_part.strip())
+            labels = {}
+            for label in labels_part.split(','):
+                key, val = label.split('=')
+                labels[key.strip()] = val.strip('"')
+            history.setdefault(int(labels['gpu_index']), {}).setdefault(metric_name, []).append(value)
+        except (ValueError, KeyError):
+            continue
+
+
+def run(opts) -> dict:
+    from shared.exposition import ExpositionParser
+
+    text = exposition(opts.gpus)
+    warm = ExpositionParser()
+    return {
+        "gpus": opts.gpus,
+        "exposition_bytes": len(text),
+        "legacy_tui": summarize(measure(lambda: legacy_tui_parse(text), opts.iterations)),
+        "legacy_desktop": summarize(measure(lambda: legacy_desktop_parse(text), opts.iterations)),
+        "shared_cold": summarize(measure(lambda: ExpositionParser().parse(text), opts.iterations)),
+        "shared_warm": summarize(measure(lambda: warm.parse(text), opts.iterations)),
+    }
@@ -0,0 +1,72 @@
+"""Desktop dashboard frame time: every Plot2D backend drawing `--plots` live plots of `--points` points."""
+import os
+import sys
+
+from benchmarks.common import DESKTOP_DIR, measure, summarize
+
+
+def _frames(app, cls, opts) -> dict:
+    import numpy as np
+    from PySide6.QtWidgets import QGridLayout, QWidget
+
+    window = QWidget()
+    grid = QGridLayout(window)
+    plots = []
+    for i in range(opts.plots):
+        plot = cls(title=f"Metric {i}", x_label="Time", y_label="value")
+        grid.addWidget(plot, i // 5, i % 5)
+        plots.append(plot)
+    window.show()
+
+    x = np.arange(opts.points, dtype=np.float64)
+    y = 50 + 20 * np.sin(x / 500) + np.random.default_rng(0).normal(0, 2, opts.points)
+    frame = [0]
+
+    def settle():
+        # Series updates, deferred redraws and paint events each take an event loop pass
+        for _ in range(3):
+            app.processEvents()
+
+    def stream():
+        # What the GPU page does per poll: shift every series by one sample and let the plot redraw
+        frame[0] += 1
+        for i, plot in enumerate(plots):
+            plot.set_series("metric", x + frame[0], np.roll(y, frame[0] + i), label="metric")
+        settle()
+
+    def redraw():
+        # A full redraw of every plot, as after a pan, zoom or resize
+        for plot in plots:
+            if hasattr(plot, "figure"):
+                plot.canvas.draw()
+            plot.canvas.repaint()
+
+    stream()
+    results = {
+        "stream_frame": summarize(measure(stream, opts.iterations)),
+        "redraw_frame": summarize(measure(redraw, opts.iterations)),
+    }
+    window.close()
+    window.deleteLater()
+    settle()
+    return results
+
+
+def run(opts) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    if str(DESKTOP_DIR) not in sys.path:
+        sys.path.insert(0, str(DESKTOP_DIR))
+    import App.widgets.Plots as Plots
+
+    app = QApplication.instance() or QApplication([])
+    results = {"plots": opts.plots, "points": opts.points}
+    for backend in Plots.BACKENDS:
+        Plots.set_backend(backend)
+        try:
+            cls = Plots.plot_class()
+        except ImportError as e:
+            results[backend] = {"skipped": f"missing dependency: {e.name}"}
+            continue
+        results[backend] = _frames(app, cls, opts)
+    return results
@@ -0,0 +1,32 @@
+"""`GPUQuery.query_gpu` latency per flag and per backend."""
+from benchmarks.common import configure_sim, measure, summarize
+
+
+def run(opts) -> dict:
+    from core import GPUQuery
+    from backends.common import QUERY_FLAGS
+
+    configure_sim(opts)
+    results = {}
+    for backend in opts.backends.split(","):
+        try:
+            tool = GPUQuery(backend)
+            if not tool.initialize():
+                results[backend] = {"skipped": "backend failed to initialize"}
+                continue
+        except RuntimeError as e:
+            results[backend] = {"skipped": str(e)}
+            continue
+
+        count = tool.get_gpu_count()
+        if count == 0:
+            results[backend] = {"skipped": "no GPUs found"}
+            continue
+
+        flags = {}
+        for flag in QUERY_FLAGS + ["--all"]:
+            samples = measure(lambda: tool.query_gpu(-1, [flag]), opts.iterations)
+            flags[flag] = summarize(samples)
+            flags[flag]["per_gpu_mean_ms"] = flags[flag]["mean_ms"] / count
+        results[backend] = {"gpus": count, "flags": flags}
+    return results
@@ -0,0 +1,70 @@
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+CORE_DIR = ROOT / "core"
+SQLLOGGER_DIR = ROOT / "logging-monitoring" / "sqllogger"
+TUI_DIR = ROOT / "terminal-dashboard"
+DESKTOP_DIR = ROOT / "desktop-dashboard"
+
+# The components are plain script directories (some with dashes in their
+# names), so make them importable as top-level modules.
+for _path in (CORE_DIR, SQLLOGGER_DIR, TUI_DIR):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+# ... and the repository-level `shared` package, at lowest priority
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+METRIC_FLAGS = ["--uuid", "--name", "--power", "--temp", "--clocks", "--util", "--mem", "--fan", "--health"]
+
+
+def configure_sim(opts) -> None:
+    """Points the in-process simulator at the benchmark's node size and seed."""
+    from backends.sim import SimMethod, SimConfig
+    SimMethod.configure(SimConfig(count=opts.gpus, seed=opts.seed, profiles=opts.profile))
+
+
+def sim_env(opts) -> Dict[str, str]:
+    """Same settings as `configure_sim`, for simulator processes spawned by the API."""
+    return {
+        "GPU_SIM_COUNT": str(opts.gpus),
+        "GPU_SIM_SEED": str(opts.seed),
+        "GPU_SIM_PROFILE": opts.profile,
+    }
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * q
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary (in milliseconds) of a list of durations in seconds."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "n": n,
+        "mean_ms": 1000 * sum(ordered) / n if n else 0.0,
+        "p50_ms": 1000 * percentile(ordered, 0.50),
+        "p90_ms": 1000 * percentile(ordered, 0.90),
+        "p99_ms": 1000 * percentile(ordered, 0.99),
+        "max_ms": 1000 * ordered[-1] if n else 0.0,
+    }
+
+
+def measure(func: Callable[[], object], iterations: int, warmup: int = 1) -> List[float]:
+    """Calls `func` `warmup` times untimed, then `iterations` times, returning each duration."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
@@ -0,0 +1,83 @@
+"""
+Registry of GPU query backends.
+
+Backends are referenced by "module:Class" paths and only imported the first
+time they are used, so a process never pays for importing a backend (and its
+dependencies, e.g. pynvml) it doesn't query with.
+
+Besides the built-in backends, more can be added without touching core.py:
+  * at runtime, with `register_backend("dcgm", "my_pkg.dcgm:DcgmMethod")`
+  * through the GPU_MONITOR_BACKENDS environment variable,
+    e.g. "dcgm=my_pkg.dcgm:DcgmMethod,rocm=my_pkg.rocm:RocmMethod"
+  * through the "gpu_monitor.backends" entry point group of installed packages
+"""
+import os
+import importlib
+from typing import Dict, List
+
+ENTRY_POINT_GROUP = "gpu_monitor.backends"
+
+BACKENDS: Dict[str, str] = {
+    "nvml": "backends.nvml:NvmlMethod",
+    "bash": "backends.bash:BashMethod",
+    "sim": "backends.sim:SimMethod",
+}
+
+_loaded: Dict[str, type] = {}
+_discovered = False
+
+
+def register_backend(name: str, target: str) -> None:
+    """Registers (or replaces) a backend by its "module:Class" path."""
+    BACKENDS[name] = target
+    _loaded.pop(name, None)
+
+
+def _discover() -> None:
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+
+    for spec in os.environ.get("GPU_MONITOR_BACKENDS", "").split(","):
+        name, _, target = spec.partition("=")
+        if name.strip() and target.strip():
+            BACKENDS.setdefault(name.strip(), target.strip())
+
+    # noinspection PyBroadException
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points()
+        group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, [])
+        for ep in group:
+            BACKENDS.setdefault(ep.name, ep.value)
+    except Exception:
+        pass
+
+
+def available_backends() -> List[str]:
+    _discover()
+    return list(BACKENDS)
+
+
+def load_backend(name: str) -> type:
+    """Imports (once) and returns the backend class registered as `name`."""
+    if name in _loaded:
+        return _loaded[name]
+    if name not in BACKENDS:
+        _discover()
+    if name not in BACKENDS:
+        raise RuntimeError(f"Unknown query method: {name}")
+
+    module_name, _, class_name = BACKENDS[name].partition(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise RuntimeError(str(e)) from e
+    try:
+        backend = getattr(module, class_name)
+    except AttributeError as e:
+        raise RuntimeError(f"Backend '{name}' not found: {BACKENDS[name]}") from e
+
+    _loaded[name] = backend
+    return backend
@@ -0,0 +1,309 @@
+import os
+import json
+import time
+import tempfile
+import threading
+import subprocess
+from typing import Dict, Callable, List, Optional
+
+from backends.common import Backend, CommandResult, GPUInfo, QUERY_FLAGS, make_result
+
+
+class BashMethod(Backend):
+    SUPPORTED_FLAGS = frozenset(QUERY_FLAGS) - {"--minor", "--pciegen", "--pciewidth", "--procs"}
+
+    @classmethod
+    def get_gpu_count(cls) -> int:
+        # noinspection PyBroadException
+        try:
+            cmd = "nvidia-smi --query-gpu=name --format=csv,noheader 2>/dev/null | wc -l"
+            res = subprocess.check_output(cmd, shell=True, text=True)
+            return int(res.strip())
+        except:
+            return 0
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Dict[str, int]]:
+        return {"health": HealthPoller.shared().stats()}
+
+    @staticmethod
+    def trim(s: str) -> str:
+        return s.strip()
+
+    @staticmethod
+    def execute(cmd: str) -> CommandResult:
+        try:
+            output = subprocess.check_output(
+                cmd, shell=True, stderr=subprocess.STDOUT, universal_newlines=True
+            ).strip()
+            return CommandResult(output, 0)
+        except subprocess.CalledProcessError as e:
+            return CommandResult(BashMethod.trim(e.output), e.returncode)
+
+    @staticmethod
+    def run(argv: List[str]) -> CommandResult:
+        """Like `execute`, for a command given as an argv list (no shell involved)."""
+        try:
+            proc = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+            return CommandResult(BashMethod.trim(proc.stdout), proc.returncode)
+        except OSError as e:
+            return CommandResult(str(e), 127)
+
+    @staticmethod
+    def create_json(attr_name: str, value: str, return_code: int) -> Dict:
+        success = return_code == 0 and value != "[N/A]"
+        return {
+            attr_name: make_result(
+                success,
+                value if success else "",
+                "Value not available" if value == "[N/A]" else value
+            )
+        }
+
+    @staticmethod
+    def create_json_from_json(attr_name: str, value_json: Dict) -> Dict:
+        return {attr_name: make_result(True, value_json)}
+
+    @staticmethod
+    def simple_query(query: str, attr_name: str) -> Callable[[int], Dict]:
+        def func(index: int) -> Dict:
+            cmd = f"nvidia-smi -i {index} --query-gpu={query} --format=csv,noheader,nounits"
+            res = BashMethod.execute(cmd)
+            return BashMethod.create_json(attr_name, res.output, res.exit_code)
+
+        return func
+
+    @staticmethod
+    def complex_query(parser: Callable, query: str, attr_name: str) -> Callable[[int], Dict]:
+        def func(index: int) -> Dict:
+            cmd = f"nvidia-smi -i {index} --query-gpu={query} --format=csv,noheader,nounits"
+            res = BashMethod.execute(cmd)
+            if res.exit_code != 0:
+                return BashMethod.create_json(attr_name, res.output, res.exit_code)
+            # noinspection PyBroadException
+            try:
+                parts = res.output.split(', ')
+                val1, val2 = parts[0].strip(), parts[1].strip()
+                return BashMethod.create_json_from_json(attr_name, parser(val1, val2))
+            except Exception:
+                return BashMethod.create_json(attr_name, f"Parse error: {res.output}", -1)
+
+        return func
+
+    @staticmethod
+    def register_query_functions(query_functions: Dict[str, Callable]) -> None:
+        def adapter(func: Callable) -> Callable:
+            return lambda info: func(info.idx)
+
+        query_functions["--name"] = adapter(BashMethod.simple_query("gpu_name", "name"))
+        query_functions["--uuid"] = adapter(BashMethod.simple_query("uuid", "uuid"))
+        query_functions["--vbios"] = adapter(BashMethod.simple_query("vbios_version", "vbios"))
+        query_functions["--temp"] = adapter(BashMethod.simple_query("temperature.gpu", "temp"))
+        query_functions["--serial"] = adapter(BashMethod.simple_query("serial", "serial"))
+        query_functions["--pstate"] = adapter(BashMethod.simple_query("pstate", "pstate"))
+        query_functions["--power"] = adapter(BashMethod.simple_query("power.draw", "power"))
+        query_functions["--plimit"] = adapter(BashMethod.simple_query("power.limit", "plimit"))
+        query_functions["--driver"] = adapter(BashMethod.simple_query("driver_version", "driver"))
+        query_functions["--ecc"] = adapter(BashMethod.simple_query("ecc.mode.current", "ecc"))
+        query_functions["--fan"] = adapter(BashMethod.simple_query("fan.speed", "fan"))
+
+        def not_supported(_: int) -> Dict:
+            return BashMethod.create_json("pciewidth", "Not Supported", 1)
+
+        query_functions["--pciewidth"] = adapter(not_supported)
+
+        def not_supported2(_: int) -> Dict:
+            return BashMethod.create_json("pciegen", "Not Supported", 1)
+
+        query_functions["--pciegen"] = adapter(not_supported2)
+
+        def not_supported3(_: int) -> Dict:
+            return BashMethod.create_json("minor", "Not Supported", 1)
+
+        query_functions["--minor"] = adapter(not_supported3)
+
+        def mem_parser(total: str, used: str) -> Dict:
+            total_val = float(total)
+            used_val = float(used)
+            usage_percent = (used_val / total_val) * 100.0 if total_val > 0 else 0.0
+            return {
+                "memory_total_mib": int(total_val),
+                "memory_used_mib": int(used_val),
+                "memory_usage_percent": usage_percent
+            }
+
+        query_functions["--mem"] = adapter(
+            BashMethod.complex_query(mem_parser, "memory.total,memory.used", "mem")
+        )
+
+        def clocks_parser(gpu: str, mem: str) -> Dict:
+            return {"gpu_clock_mhz": int(gpu), "memory_clock_mhz": int(mem)}
+
+        query_functions["--clocks"] = adapter(
+            BashMethod.complex_query(clocks_parser, "clocks.gr,clocks.mem", "clocks")
+        )
+
+        def util_parser(gpu: str, mem: str) -> Dict:
+            return {"gpu_utilization_percent": int(gpu), "memory_utilization_percent": int(mem)}
+
+        query_functions["--util"] = adapter(
+            BashMethod.complex_query(util_parser, "utilization.gpu,utilization.memory", "util")
+        )
+
+        def query_processes(info: GPUInfo) -> Dict:
+            return {
+                "processes": []
+            }
+
+        query_functions["--procs"] = query_processes
+
+        def query_health(info: GPUInfo) -> Dict:
+            return {"health": HealthPoller.shared().get(info.idx)}
+
+        query_functions["--health"] = query_health
+
+
+class HealthPoller:
+    """
+    Runs the DCGM health check on its own (slow) cadence and caches the parsed
+    report per GPU, so `--health` queries never wait on the host engine.
+
+    The cache is a small JSON file, shared between a long-lived poller thread
+    (started by the API) and the short-lived core.py processes it spawns.
+    Entries older than `max_age` are refreshed synchronously on read, so the
+    CLI still works when no poller is running.
+
+    Environment:
+      GPU_HEALTH_INTERVAL  poll interval in seconds (default 30)
+      GPU_HEALTH_CACHE     cache file path (default: per user, in $XDG_RUNTIME_DIR or the temp dir)
+      DCGMI                dcgmi executable, e.g. a fake script for tests
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, interval: float = None, cache_path: str = None, dcgmi: str = None) -> None:
+        self.interval = interval if interval is not None else float(os.environ.get("GPU_HEALTH_INTERVAL", "30"))
+        self.max_age = 2 * self.interval
+        self.cache_path = cache_path or os.environ.get("GPU_HEALTH_CACHE") or self.default_cache_path()
+        self.dcgmi = dcgmi or os.environ.get("DCGMI", "dcgmi")
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "HealthPoller":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def default_cache_path() -> str:
+        # Per user, so nobody else can plant a report in a shared, predictable file
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir and os.path.isdir(runtime_dir):
+            return os.path.join(runtime_dir, "gpu_monitor_health.json")
+        return os.path.join(tempfile.gettempdir(), f"gpu_monitor_health-{os.getuid()}.json")
+
+    def check(self, index: int) -> Dict:
+        """Runs a single `dcgmi health` check and returns a timestamped cache entry."""
+        out = BashMethod.run([self.dcgmi, "health", "--host", "localhost", "-g", str(index), "-c", "-j"])
+        entry = {"timestamp": time.time(), "has_error": True, "error": out.output, "value": ""}
+        if out.exit_code == 0:
+            try:
+                entry.update(has_error=False, error="", value=json.loads(out.output))
+            except json.JSONDecodeError:
+                entry["error"] = f"Parse error: {out.output}"
+        return entry
+
+    def _load(self) -> Dict[str, Dict]:
+        # noinspection PyBroadException
+        try:
+            with open(self.cache_path, "r") as f:
+                # A file someone else created in our place is not trusted
+                if os.fstat(f.fileno()).st_uid != os.getuid():
+                    return {}
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _store(self, cache: Dict[str, Dict]) -> None:
+        tmp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _update(self, entries: Dict[str, Dict]) -> None:
+        with self._lock:
+            cache = self._load()
+            cache.update(entries)
+            self._store(cache)
+
+    def poll(self, indices) -> None:
+        """Refreshes the cached report of every GPU in `indices`."""
+        self._update({str(idx): self.check(idx) for idx in indices})
+
+    def get(self, index: int) -> Dict:
+        """Returns the cached report of a GPU (refreshing it if missing or too old) with its age."""
+        entry = self._load().get(str(index))
+        if entry is None or time.time() - entry.get("timestamp", 0) > self.max_age:
+            entry = self.check(index)
+            self._update({str(index): entry})
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.hits += 1
+        return {
+            "value": entry["value"],
+            "has_error": entry["has_error"],
+            "error": entry["error"],
+            "age_seconds": round(max(0.0, time.time() - entry["timestamp"]), 3),
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def start(self, count_fn: Callable[[], int],
+              on_poll: Optional[Callable[[float, float], None]] = None) -> None:
+        """
+        Starts polling GPUs `0..count_fn()-1` every `interval` seconds on a daemon thread.
+        `on_poll(lag, duration)` is called after each round, `lag` being how late
+        the round started relative to its schedule.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def loop():
+            scheduled = time.monotonic()
+            while not self._stop.is_set():
+                started = time.monotonic()
+                # noinspection PyBroadException
+                try:
+                    self.poll(range(count_fn()))
+                except Exception:
+                    pass
+                if on_poll is not None:
+                    on_poll(max(0.0, started - scheduled), time.monotonic() - started)
+                # Fixed-rate schedule; a round that overran starts the next one
+                # right away (showing up as lag) but the backlog is not replayed
+                scheduled += self.interval
+                now = time.monotonic()
+                if scheduled < now - self.interval:
+                    scheduled = now
+                self._stop.wait(max(0.0, scheduled - now))
+
+        self._thread = threading.Thread(target=loop, name="dcgm-health-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
@@ -0,0 +1,63 @@
+from collections import namedtuple
+from typing import Dict, Callable, Any
+
+GPUInfo = namedtuple('GPUInfo', ['device', 'idx'])
+CommandResult = namedtuple('CommandResult', ['output', 'exit_code'])
+
+QUERY_FLAGS = [
+    "--name", "--temp", "--clocks", "--power", "--plimit", "--mem", "--util",
+    "--uuid", "--fan", "--minor", "--serial", "--vbios", "--driver", "--ecc",
+    "--pstate", "--pciegen", "--pciewidth", "--procs", "--health"
+]
+
+
+def make_result(success: bool, value: Any, error: str = "") -> Dict:
+    return {
+        "value": value,
+        "has_error": not success,
+        "error": error if not success else ""
+    }
+
+
+def make_error_json(msg: str) -> Dict:
+    return make_result(False, None, msg)
+
+
+class BackendError(Exception):
+    """Raised by a backend when a GPU cannot be addressed (e.g. invalid handle)."""
+
+
+class Backend:
+    """
+    Base class of the query backends loaded through the `backends` registry.
+
+    A backend registers one query function per flag it implements and declares
+    the flags it supports natively in `SUPPORTED_FLAGS`; the device lifecycle
+    hooks default to a backend that needs no setup.
+    """
+    SUPPORTED_FLAGS = frozenset()
+
+    @classmethod
+    def initialize(cls) -> bool:
+        return True
+
+    @classmethod
+    def shutdown(cls) -> None:
+        pass
+
+    @classmethod
+    def get_gpu_count(cls) -> int:
+        return 0
+
+    @classmethod
+    def get_device_info(cls, index: int) -> GPUInfo:
+        return GPUInfo(None, index)
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters of the backend's caches, by cache name."""
+        return {}
+
+    @staticmethod
+    def register_query_functions(query_functions: Dict[str, Callable]) -> None:
+        raise NotImplementedError
@@ -0,0 +1,209 @@
+from typing import Dict, Callable
+
+try:
+    import pynvml
+except ImportError as e:
+    raise ImportError("pynvml not installed for NVML method") from e
+
+from backends.common import Backend, BackendError, GPUInfo, QUERY_FLAGS, make_result
+
+
+class NvmlMethod(Backend):
+    SUPPORTED_FLAGS = frozenset(QUERY_FLAGS) - {"--health"}
+
+    @classmethod
+    def initialize(cls) -> bool:
+        try:
+            pynvml.nvmlInit()
+            return True
+        except pynvml.NVMLError:
+            return False
+
+    @classmethod
+    def shutdown(cls) -> None:
+        # noinspection PyBroadException
+        try:
+            pynvml.nvmlShutdown()
+        except:
+            pass
+
+    @classmethod
+    def get_gpu_count(cls) -> int:
+        try:
+            return pynvml.nvmlDeviceGetCount()
+        except pynvml.NVMLError:
+            return 0
+
+    @classmethod
+    def get_device_info(cls, index: int) -> GPUInfo:
+        try:
+            return GPUInfo(pynvml.nvmlDeviceGetHandleByIndex(index), index)
+        except pynvml.NVMLError as e:
+            raise BackendError(str(e)) from e
+
+    @staticmethod
+    def register_query_functions(query_functions: Dict[str, Callable]) -> None:
+        def nvml_str_query(func, key, buf_size):
+            def wrapper(info: GPUInfo) -> Dict:
+                try:
+                    buf = func(info.device)
+                    return {key: make_result(True, buf)}
+                except pynvml.NVMLError as e:
+                    return {key: make_result(False, "", str(e))}
+
+            return wrapper
+
+        def nvml_sys_str_query(func, key, buf_size):
+            def wrapper(info: GPUInfo) -> Dict:
+                try:
+                    buf = func()
+                    return {key: make_result(True, buf)}
+                except pynvml.NVMLError as e:
+                    return {key: make_result(False, "", str(e))}
+
+            return wrapper
+
+        def nvml_uint_query(func, key):
+            def wrapper(info: GPUInfo) -> Dict:
+                try:
+                    val = func(info.device)
+                    return {key: make_result(True, val)}
+                except pynvml.NVMLError as e:
+                    return {key: make_result(False, 0, str(e))}
+
+            return wrapper
+
+        def nvml_pwr_query(func, key):
+            def wrapper(info: GPUInfo) -> Dict:
+                try:
+                    raw = func(info.device)
+                    val = raw / 1000.0
+                    return {key: make_result(True, val)}
+                except pynvml.NVMLError as e:
+                    return {key: make_result(False, 0.0, str(e))}
+
+            return wrapper
+
+        query_functions["--name"] = nvml_str_query(pynvml.nvmlDeviceGetName, "name", 64)
+        query_functions["--serial"] = nvml_str_query(pynvml.nvmlDeviceGetSerial, "serial", 30)
+        query_functions["--uuid"] = nvml_str_query(pynvml.nvmlDeviceGetUUID, "uuid", 80)
+        query_functions["--vbios"] = nvml_str_query(pynvml.nvmlDeviceGetVbiosVersion, "vbios", 32)
+        query_functions["--driver"] = nvml_sys_str_query(pynvml.nvmlSystemGetDriverVersion, "driver", 80)
+
+        query_functions["--temp"] = lambda info: {
+            "temp": make_result(True, pynvml.nvmlDeviceGetTemperature(info.device, pynvml.NVML_TEMPERATURE_GPU))
+        } if pynvml else {"temp": make_result(False, 0, "NVML not available")}
+
+        query_functions["--fan"] = nvml_uint_query(pynvml.nvmlDeviceGetFanSpeed, "fan")
+        query_functions["--minor"] = nvml_uint_query(pynvml.nvmlDeviceGetMinorNumber, "minor")
+
+        def query_pstate(info: GPUInfo) -> Dict:
+            try:
+                st = pynvml.nvmlDeviceGetPerformanceState(info.device)
+                ps = int(st)
+                return {"pstate": make_result(True, ps)}
+            except pynvml.NVMLError as e:
+                return {"pstate": make_result(False, -1, str(e))}
+
+        query_functions["--pstate"] = query_pstate
+
+        query_functions["--pciegen"] = nvml_uint_query(pynvml.nvmlDeviceGetMaxPcieLinkGeneration, "pciegen")
+        query_functions["--pciewidth"] = nvml_uint_query(pynvml.nvmlDeviceGetMaxPcieLinkWidth, "pciewidth")
+        query_functions["--power"] = nvml_pwr_query(pynvml.nvmlDeviceGetPowerUsage, "power")
+        query_functions["--plimit"] = nvml_pwr_query(pynvml.nvmlDeviceGetPowerManagementLimit, "plimit")
+
+        def query_clocks(info: GPUInfo) -> Dict:
+            err_msgs = []
+            clocks = {"gpu_clock_mhz": 0, "memory_clock_mhz": 0}
+            try:
+                sm = pynvml.nvmlDeviceGetClockInfo(info.device, pynvml.NVML_CLOCK_SM)
+                clocks["gpu_clock_mhz"] = sm
+            except pynvml.NVMLError as e:
+                err_msgs.append(f"SM Clock: {str(e)}")
+            try:
+                mem = pynvml.nvmlDeviceGetClockInfo(info.device, pynvml.NVML_CLOCK_MEM)
+                clocks["memory_clock_mhz"] = mem
+            except pynvml.NVMLError as e:
+                err_msgs.append(f"Memory Clock: {str(e)}")
+            return {"clocks": make_result(len(err_msgs) == 0, clocks, "; ".join(err_msgs))}
+
+        query_functions["--clocks"] = query_clocks
+
+        def query_mem(info: GPUInfo) -> Dict:
+            try:
+                m = pynvml.nvmlDeviceGetMemoryInfo(info.device)
+                d = {
+                    "memory_used_mib": m.used // (1024 * 1024),
+                    "memory_total_mib": m.total // (1024 * 1024),
+                    "memory_usage_percent": 100.0 * float(m.used) / float(m.total)
+                }
+                return {"mem": make_result(True, d)}
+            except pynvml.NVMLError as e:
+                d = {"memory_used_mib": 0, "memory_total_mib": 0, "memory_usage_percent": 0.0}
+                return {"mem": make_result(False, d, str(e))}
+
+        query_functions["--mem"] = query_mem
+
+        def query_util(info: GPUInfo) -> Dict:
+            try:
+                u = pynvml.nvmlDeviceGetUtilizationRates(info.device)
+                d = {
+                    "gpu_utilization_percent": u.gpu,
+                    "memory_utilization_percent": u.memory
+                }
+                return {"util": make_result(True, d)}
+            except pynvml.NVMLError as e:
+                d = {"gpu_utilization_percent": 0, "memory_utilization_percent": 0}
+                return {"util": make_result(False, d, str(e))}
+
+        query_functions["--util"] = query_util
+
+        def query_ecc(info: GPUInfo) -> Dict:
+            err_msgs = []
+            ce, ue = 0, 0
+            try:
+                ce = pynvml.nvmlDeviceGetTotalEccErrors(
+                    info.device, pynvml.NVML_MEMORY_ERROR_TYPE_CORRECTED, pynvml.NVML_VOLATILE_ECC
+                )
+            except pynvml.NVMLError as e:
+                err_msgs.append(f"Corrected Errors: {str(e)}")
+            try:
+                ue = pynvml.nvmlDeviceGetTotalEccErrors(
+                    info.device, pynvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED, pynvml.NVML_VOLATILE_ECC
+                )
+            except pynvml.NVMLError as e:
+                err_msgs.append(f"Uncorrected Errors: {str(e)}")
+            d = {"ecc_corrected_errors": ce, "ecc_uncorrected_errors": ue}
+            return {"ecc": make_result(len(err_msgs) == 0, d, "; ".join(err_msgs))}
+
+        query_functions["--ecc"] = query_ecc
+
+        def query_processes(info: GPUInfo) -> Dict:
+            try:
+                procs = pynvml.nvmlDeviceGetComputeRunningProcesses(info.device)
+                processes = []
+                for p in procs:
+                    processes.append({
+                        "pid": p.pid,
+                        "gpu_memory": p.usedGpuMemory
+                    })
+                return {
+                    "processes": processes
+                }
+            except pynvml.NVMLError as _:
+                return {
+                    "processes": []
+                }
+
+        query_functions["--procs"] = query_processes
+
+        def query_health(info: GPUInfo) -> Dict:
+            return {
+                "health": {
+                    "has_error": True,
+                    "error": "Value not available",
+                    "value": "",
+                }
+            }
+
+        query_functions["--health"] = query_health
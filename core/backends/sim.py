@@ -0,0 +1,325 @@
+import os
+import math
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from backends.common import Backend, BackendError, GPUInfo, QUERY_FLAGS, make_result
+
+# Per-model characteristics; GPU i uses template i % 3, and the first three
+# GPUs keep the identities the simulator has always reported.
+TEMPLATES = [
+    {"name": "SIM-RTX4090", "uuid": "GPU-0a1b2c3d-4e5f-6172-8192-334455667788", "serial": "SIM123456",
+     "vbios": "90.00.01.00.AB", "temp": 45, "fan": 1050, "plimit": 350, "gpu_clock": 2100, "mem_clock": 1100,
+     "util": 30, "mem_used": 3000, "mem_total": 24000, "pciegen": 4, "pciewidth": 16},
+    {"name": "SIM-RTX3080", "uuid": "GPU-1b2c3d4e-5f6a-7b8c-9d0e-112233445566", "serial": "SIM654321",
+     "vbios": "90.00.02.00.CD", "temp": 55, "fan": 2400, "plimit": 250, "gpu_clock": 1800, "mem_clock": 900,
+     "util": 60, "mem_used": 6000, "mem_total": 16000, "pciegen": 3, "pciewidth": 8},
+    {"name": "SIM-GTX1060", "uuid": "GPU-2c3d4e5f-6a7b-8c9d-0e1f-223344556677", "serial": "SIM000001",
+     "vbios": "90.00.03.00.EF", "temp": 65, "fan": 9500, "plimit": 150, "gpu_clock": 1500, "mem_clock": 700,
+     "util": 90, "mem_used": 2000, "mem_total": 8000, "pciegen": 2, "pciewidth": 4},
+]
+DRIVER_VERSION = "525.00"
+
+IDLE_TEMP = 35.0        # temperature of an idle GPU (C)
+THROTTLE_TEMP = 85.0    # above this, clocks and power are cut
+TEMP_TAU = 20.0         # time constant of temperature following utilization (s)
+TEMP_STEP = 2.0         # resolution of the temperature lag filter (s)
+TEMP_WINDOW = 5 * TEMP_TAU
+# Utilization ticks memoized per GPU; a temperature reading looks TEMP_WINDOW seconds back
+UTIL_CACHE_SIZE = 512
+
+# name -> (default period in seconds, heat multiplier)
+PROFILES = {
+    "steady": (60.0, 1.0),
+    "idle": (60.0, 1.0),
+    "ramp": (120.0, 1.0),
+    "spike": (60.0, 1.0),
+    "throttle": (300.0, 1.75),
+    "falloff": (300.0, 1.0),
+}
+
+
+def _mix(*keys: int) -> int:
+    """Deterministic 64-bit hash of integer keys (splitmix64 finalizer)."""
+    h = 0x9E3779B97F4A7C15
+    for k in keys:
+        h = (h ^ (k & 0xFFFFFFFFFFFFFFFF)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+        h = (h ^ (h >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+        h ^= h >> 31
+    return h
+
+
+def _unit(*keys: int) -> float:
+    """Deterministic pseudo-random value in [-1, 1) for the given keys."""
+    return _mix(*keys) / 2 ** 63 - 1.0
+
+
+class SimConfig:
+    """
+    Simulator settings, read from the environment so they reach the core.py
+    processes spawned by the API:
+
+      GPU_SIM_COUNT    number of simulated GPUs (default 3)
+      GPU_SIM_SEED     seed of all generated noise and identities (default 0)
+      GPU_SIM_PROFILE  workload profiles, comma separated. Plain entries are
+                       cycled over the GPUs, "idx=profile" entries pin one GPU,
+                       and "profile:period" overrides the period in seconds,
+                       e.g. "steady,ramp:60,3=throttle,7=falloff:600"
+      GPU_SIM_EPOCH    unix time the profiles are phased from (default 0)
+      GPU_SIM_TIME     freeze the simulated clock at this many seconds after
+                       the epoch, for fully reproducible runs
+    """
+
+    def __init__(self, count: int = 3, seed: int = 0, profiles: str = "steady",
+                 epoch: float = 0.0, frozen_time: Optional[float] = None) -> None:
+        self.count = max(0, count)
+        self.seed = seed
+        self.epoch = epoch
+        self.frozen_time = frozen_time
+        self.default_profiles = []
+        self.pinned_profiles = {}
+        for entry in filter(None, (e.strip() for e in profiles.split(","))):
+            idx, _, spec = entry.rpartition("=")
+            profile = self._parse_profile(spec)
+            if idx:
+                self.pinned_profiles[int(idx)] = profile
+            else:
+                self.default_profiles.append(profile)
+        if not self.default_profiles:
+            self.default_profiles.append(self._parse_profile("steady"))
+
+    @staticmethod
+    def _parse_profile(spec: str) -> tuple:
+        name, _, period = spec.partition(":")
+        if name not in PROFILES:
+            raise RuntimeError(f"Unknown simulator profile: {name}")
+        return name, float(period) if period else PROFILES[name][0]
+
+    @classmethod
+    def from_env(cls) -> "SimConfig":
+        frozen = os.environ.get("GPU_SIM_TIME")
+        return cls(
+            count=int(os.environ.get("GPU_SIM_COUNT", "3")),
+            seed=int(os.environ.get("GPU_SIM_SEED", "0")),
+            profiles=os.environ.get("GPU_SIM_PROFILE", "steady"),
+            epoch=float(os.environ.get("GPU_SIM_EPOCH", "0")),
+            frozen_time=float(frozen) if frozen is not None else None,
+        )
+
+    def profile(self, index: int) -> tuple:
+        if index in self.pinned_profiles:
+            return self.pinned_profiles[index]
+        return self.default_profiles[index % len(self.default_profiles)]
+
+    def now(self) -> float:
+        if self.frozen_time is not None:
+            return self.frozen_time
+        return time.time() - self.epoch
+
+
+class SimGPU:
+    """One simulated GPU; every signal is a pure function of (seed, index, time)."""
+
+    def __init__(self, config: SimConfig, index: int) -> None:
+        self.index = index
+        self.seed = config.seed
+        self.tpl = TEMPLATES[index % len(TEMPLATES)]
+        self.profile, self.period = config.profile(index)
+        self.heat = PROFILES[self.profile][1]
+        self._gain = (self.tpl["temp"] - IDLE_TEMP) / self.tpl["util"]
+        # Per instance, so GPUs neither evict each other's ticks nor stay alive in a class-wide cache
+        self._utilization_at = lru_cache(maxsize=UTIL_CACHE_SIZE)(self._compute_utilization)
+
+        if index < len(TEMPLATES):
+            self.uuid, self.serial = self.tpl["uuid"], self.tpl["serial"]
+        else:
+            h = f"{_mix(self.seed, index, 1):016x}{_mix(self.seed, index, 2):016x}"
+            self.uuid = f"GPU-{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+            self.serial = f"SIM{_mix(self.seed, index, 3) % 10 ** 6:06d}"
+
+    def _noise(self, t: float, channel: int) -> float:
+        return _unit(self.seed, self.index, int(t), channel)
+
+    def is_lost(self, t: float) -> bool:
+        """The "falloff" profile drops off the bus for the last 20% of each period."""
+        return self.profile == "falloff" and (t % self.period) >= 0.8 * self.period
+
+    def _compute_utilization(self, tick: int) -> float:
+        t = float(tick)
+        phase = (t % self.period) / self.period
+        if self.profile == "idle":
+            base = 2.0
+        elif self.profile == "ramp":
+            base = 100.0 * phase
+        elif self.profile == "spike":
+            base = 100.0 if phase < 0.1 else 15.0
+        elif self.profile == "throttle":
+            base = 98.0
+        else:
+            base = self.tpl["util"] * (1 + 0.2 * self._noise(t, 0))
+        return min(100.0, max(0.0, base + 2.0 * self._noise(t, 1)))
+
+    def utilization(self, t: float) -> float:
+        return self._utilization_at(int(t))
+
+    def temperature(self, t: float) -> float:
+        """First-order lag of utilization: temperature trails load by ~TEMP_TAU seconds."""
+        num, den = 0.0, 0.0
+        for k in range(int(TEMP_WINDOW / TEMP_STEP)):
+            w = math.exp(-k * TEMP_STEP / TEMP_TAU)
+            num += w * self.utilization(t - k * TEMP_STEP)
+            den += w
+        return IDLE_TEMP + self.heat * self._gain * num / den + 0.5 * self._noise(t, 2)
+
+    def throttle_factor(self, t: float) -> float:
+        return 0.7 if self.temperature(t) > THROTTLE_TEMP else 1.0
+
+    def power(self, t: float) -> float:
+        idle = 0.15 * self.tpl["plimit"]
+        p = idle + (self.tpl["plimit"] - idle) * self.utilization(t) / 100.0
+        p = p * (1 + 0.05 * self._noise(t, 3)) * self.throttle_factor(t)
+        return min(p, float(self.tpl["plimit"]))
+
+    def clocks(self, t: float) -> Dict:
+        load = 0.6 + 0.4 * self.utilization(t) / 100.0
+        throttle = self.throttle_factor(t)
+        return {
+            "gpu_clock_mhz": self.tpl["gpu_clock"] * load * throttle * (1 + 0.02 * self._noise(t, 4)),
+            "memory_clock_mhz": self.tpl["mem_clock"] * (1 + 0.02 * self._noise(t, 5)),
+        }
+
+    def fan(self, t: float) -> float:
+        return self.tpl["fan"] * (1 + 0.1 * self._noise(t, 6))
+
+    def memory(self, t: float) -> Dict:
+        total = self.tpl["mem_total"]
+        used = min(total, self.tpl["mem_used"] * (0.7 + 0.6 * self.utilization(t) / 100.0)
+                   * (1 + 0.05 * self._noise(t, 7)))
+        return {
+            "memory_used_mib": used,
+            "memory_total_mib": total,
+            "memory_usage_percent": 100 * used / total,
+        }
+
+    def processes(self, t: float) -> List[Dict]:
+        tick = int(t / 10)  # the process list changes every 10 seconds
+        procs = []
+        for p in range(_mix(self.seed, self.index, tick, 8) % 6):
+            h = _mix(self.seed, self.index, tick, 9, p)
+            procs.append({
+                "pid": 1000 + h % 9000,
+                "gpu_memory": (100 + (h >> 16) % 1900) * 1024 * 1024 if (h >> 40) % 5 else None,
+            })
+        return procs
+
+    def health(self, t: float) -> Dict:
+        temp, util = self.temperature(t), self.utilization(t)
+        if temp > 80 or util > 95:
+            gpu_health = "Warning"
+            temp_status = "High" if temp > 80 else "Normal"
+            memory_status = "Stressed" if util > 95 else "Stable"
+            overall_health = "Warning"
+        elif temp > 70 or util > 85:
+            gpu_health = "Caution"
+            temp_status = "Elevated" if temp > 70 else "Normal"
+            memory_status = "Heavy" if util > 85 else "Stable"
+            overall_health = "Healthy"
+        else:
+            gpu_health = "Healthy"
+            temp_status = "Normal"
+            memory_status = "Stable"
+            overall_health = "Healthy"
+
+        return {
+            "body": {
+                "Overall Health": {"value": overall_health},
+                "GPU": {
+                    "children": {
+                        str(self.index): {
+                            "value": gpu_health,
+                            "children": {
+                                "Temperature": {"value": temp_status},
+                                "Memory": {"value": memory_status}
+                            }
+                        }
+                    }
+                }
+            },
+            "header": ["Health Report"]
+        }
+
+
+class SimMethod(Backend):
+    SUPPORTED_FLAGS = frozenset(QUERY_FLAGS)
+    _config = None
+    _gpus: Dict[int, SimGPU] = {}
+
+    @classmethod
+    def config(cls) -> SimConfig:
+        if cls._config is None:
+            cls._config = SimConfig.from_env()
+        return cls._config
+
+    @classmethod
+    def configure(cls, config: SimConfig) -> None:
+        """Replaces the environment-derived settings (for in-process use, e.g. benchmarks)."""
+        cls._config = config
+        cls._gpus = {}
+
+    @classmethod
+    def gpu(cls, index: int) -> SimGPU:
+        if index not in cls._gpus:
+            cls._gpus[index] = SimGPU(cls.config(), index)
+        return cls._gpus[index]
+
+    @classmethod
+    def get_gpu_count(cls) -> int:
+        return cls.config().count
+
+    @classmethod
+    def get_device_info(cls, index: int) -> GPUInfo:
+        if cls.gpu(index).is_lost(cls.config().now()):
+            raise BackendError("GPU is lost")
+        return GPUInfo(cls.gpu(index), index)
+
+    @staticmethod
+    def register_query_functions(funcs: dict) -> None:
+        def sim_query(attr_name, getter):
+            def wrapper(info):
+                return {attr_name: make_result(True, getter(info.device, SimMethod.config().now()))}
+
+            return wrapper
+
+        def query_processes(info) -> Dict:
+            return {
+                "processes": info.device.processes(SimMethod.config().now())
+            }
+
+        funcs.update({
+            "--name": sim_query("name", lambda g, t: g.tpl["name"]),
+            "--uuid": sim_query("uuid", lambda g, t: g.uuid),
+            "--serial": sim_query("serial", lambda g, t: g.serial),
+            "--vbios": sim_query("vbios", lambda g, t: g.tpl["vbios"]),
+            "--driver": lambda _: {"driver": make_result(True, DRIVER_VERSION)},
+            "--temp": sim_query("temp", SimGPU.temperature),
+            "--fan": sim_query("fan", SimGPU.fan),
+            "--power": sim_query("power", SimGPU.power),
+            "--clocks": sim_query("clocks", SimGPU.clocks),
+            "--util": sim_query("util", lambda g, t: {
+                "gpu_utilization_percent": g.utilization(t),
+                "memory_utilization_percent": g.utilization(t) * 0.8
+            }),
+            "--mem": sim_query("mem", SimGPU.memory),
+            "--minor": sim_query("minor", lambda g, t: g.index),
+            "--pstate": sim_query("pstate", lambda g, t: 0 if g.utilization(t) > 50 else 2),
+            "--pciegen": sim_query("pciegen", lambda g, t: g.tpl["pciegen"]),
+            "--pciewidth": sim_query("pciewidth", lambda g, t: g.tpl["pciewidth"]),
+            "--plimit": sim_query("plimit", lambda g, t: g.tpl["plimit"]),
+            "--procs": query_processes,
+            "--health": sim_query("health", SimGPU.health),
+            "--ecc": sim_query("ecc", lambda g, t: {
+                "ecc_corrected_errors": 0,
+                "ecc_uncorrected_errors": 0
+            }),
+        })
@@ -1,16 +1,122 @@
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request
 from fastapi.responses import JSONResponse, Response
 from fastapi import Path
+from starlette.routing import Match
 from typing import Optional
 import datetime
 import subprocess
 import json
+import time
+
+from backends import available_backends
+from instrumentation import Registry
 
 app = FastAPI()
 STATIC_FIELDS = [
 	"uuid", "name", "serial", "vbios", "driver",
 	"minor", "pciegen", "pciewidth", "plimit"
 ]
+_health_poller = None
+
+# Self-instrumentation, exposed as gpu_exporter_* series on /metrics/exporter
+exporter_metrics = Registry()
+REQUEST_SECONDS = exporter_metrics.histogram(
+	"gpu_exporter_request_seconds", "API handler latency in seconds", ("endpoint", "status"))
+STAGE_SECONDS = exporter_metrics.histogram(
+	"gpu_exporter_stage_seconds",
+	"Time per core.py invocation stage in seconds (spawn, initialize, query, decode, render)",
+	("method", "stage"))
+QUERY_FLAG_SECONDS = exporter_metrics.histogram(
+	"gpu_exporter_query_flag_seconds", "Backend time per query flag over all GPUs in seconds", ("method", "flag"))
+BACKEND_ERRORS = exporter_metrics.counter(
+	"gpu_exporter_backend_errors_total", "Query results reported with has_error, by flag", ("method", "flag"))
+CORE_FAILURES = exporter_metrics.counter(
+	"gpu_exporter_core_failures_total", "core.py invocations that failed (exit, decode)", ("method", "reason"))
+SAMPLER_LAG = exporter_metrics.histogram(
+	"gpu_exporter_sampler_lag_seconds", "How late a background sampler round started", ("sampler",))
+SAMPLER_POLL_SECONDS = exporter_metrics.histogram(
+	"gpu_exporter_sampler_poll_seconds", "Duration of a background sampler round in seconds", ("sampler",))
+CACHE_REQUESTS = exporter_metrics.counter(
+	"gpu_exporter_cache_requests_total", "Cache lookups by result (hit, miss)", ("cache", "result"))
+
+
+def _cache_hit_ratio() -> dict:
+	totals = {}
+	for (cache, result), value in CACHE_REQUESTS.items():
+		hits, lookups = totals.get(cache, (0.0, 0.0))
+		totals[cache] = (hits + (value if result == "hit" else 0.0), lookups + value)
+	return {(cache,): hits / lookups for cache, (hits, lookups) in totals.items() if lookups}
+
+
+exporter_metrics.gauge(
+	"gpu_exporter_cache_hit_ratio", "Fraction of cache lookups served from the cache", ("cache",), _cache_hit_ratio)
+
+
+def _ensure_health_poller() -> None:
+	"""
+	Starts the background DCGM health poller (once) so `--health` queries of
+	the bash method are served from its cache instead of calling dcgmi.
+	"""
+	global _health_poller
+	if _health_poller is None:
+		from backends.bash import BashMethod, HealthPoller
+		_health_poller = HealthPoller.shared()
+		_health_poller.start(BashMethod.get_gpu_count, _observe_health_poll)
+
+
+def _observe_health_poll(lag: float, duration: float) -> None:
+	SAMPLER_LAG.observe(lag, sampler="dcgm-health")
+	SAMPLER_POLL_SECONDS.observe(duration, sampler="dcgm-health")
+
+
+@app.on_event("shutdown")
+def _stop_health_poller() -> None:
+	if _health_poller is not None:
+		_health_poller.stop()
+
+
+def _route_template(request: Request) -> str:
+	# Label by route (e.g. /gpu/{gpu_uuid}) rather than raw path to bound cardinality
+	for route in app.router.routes:
+		match, _ = route.matches(request.scope)
+		if match == Match.FULL:
+			return route.path
+	return "unmatched"
+
+
+@app.middleware("http")
+async def _time_requests(request: Request, call_next):
+	start = time.perf_counter()
+	response = await call_next(request)
+	REQUEST_SECONDS.observe(
+		time.perf_counter() - start, endpoint=_route_template(request), status=str(response.status_code))
+	return response
+
+
+def _record_core_stats(method: str, data: dict, wall: float, decode: float) -> None:
+	"""Feeds the `stats` block of a core.py result (see `core.py --stats`) into the exporter metrics."""
+	stats = data.pop("stats", {})
+	seconds = stats.get("seconds", {})
+	total = seconds.get("total", 0.0)
+	initialize = seconds.get("initialize", 0.0)
+	STAGE_SECONDS.observe(max(0.0, wall - total), method=method, stage="spawn")
+	STAGE_SECONDS.observe(initialize, method=method, stage="initialize")
+	STAGE_SECONDS.observe(max(0.0, total - initialize), method=method, stage="query")
+	STAGE_SECONDS.observe(decode, method=method, stage="decode")
+	for flag, value in seconds.items():
+		if flag.startswith("--"):
+			QUERY_FLAG_SECONDS.observe(value, method=method, flag=flag)
+
+	for cache, counts in stats.get("cache", {}).items():
+		CACHE_REQUESTS.inc(counts.get("hits", 0), cache=cache, result="hit")
+		CACHE_REQUESTS.inc(counts.get("misses", 0), cache=cache, result="miss")
+
+	for gpu_data in data.get("gpus", {}).values():
+		for field, value in gpu_data.items():
+			if field == "error":
+				BACKEND_ERRORS.inc(method=method, flag="device")
+			elif isinstance(value, dict) and value.get("has_error"):
+				BACKEND_ERRORS.inc(method=method, flag=f"--{field}")
 
 def _run_core_py(method: str, options: list[str]) -> dict:
 	"""
@@ -19,20 +125,29 @@ def _run_core_py(method: str, options: list[str]) -> dict:
 	"""
 	base_cmd = ["python3", "core.py"]
 
-	if method in ["bash", "nvml", "sim"]:
-		base_cmd.append(f"--{method}")
+	if method in available_backends():
+		base_cmd += ["--backend", method]
 	else:
 		raise HTTPException(status_code=400, detail="Invalid method")
 
-	base_cmd += options
+	if method == "bash" and ("--health" in options or "--all" in options):
+		_ensure_health_poller()
+
+	base_cmd += options + ["--stats"]
 
+	start = time.perf_counter()
 	try:
 		result = subprocess.run(base_cmd, capture_output=True, check=True, text=True)
-		return json.loads(result.stdout)
+		wall = time.perf_counter() - start
+		data = json.loads(result.stdout)
 	except subprocess.CalledProcessError as e:
+		CORE_FAILURES.inc(method=method, reason="exit")
 		raise HTTPException(status_code=500, detail=f"Core.py failed: {e.stderr}")
 	except json.JSONDecodeError:
+		CORE_FAILURES.inc(method=method, reason="decode")
 		raise HTTPException(status_code=500, detail="Invalid JSON output from core.py")
+	_record_core_stats(method, data, wall, time.perf_counter() - start - wall)
+	return data
 
 
 def _extract_gpu_by_uuid(core_data: dict, target_uuid: str) -> Optional[dict]:
@@ -126,12 +241,8 @@ def list_gpus(method: str = Query("nvml")):
 	return JSONResponse(content=result)
 
 
-@app.get("/gpu/metric")
-def get_gpu_metrics(method: str = Query("nvml")):
-	"""Return only dynamic (time-varying) numeric data, for Prometheus use"""
-	metric_fields = ["--uuid", "--name", "--power", "--temp", "--clocks", "--util", "--mem", "--fan", "--health"]
-	
-	data = _run_core_py(method, metric_fields)
+def _render_prometheus(data: dict) -> str:
+	"""Renders core.py output as Prometheus text exposition."""
 	prometheus_lines = []
 	
 	# Add HELP and TYPE comments for each metric
@@ -225,7 +336,26 @@ def get_gpu_metrics(method: str = Query("nvml")):
 			health_value = health_map.get(overall_health.lower(), 4)  # 4 for Unknown
 			prometheus_lines.append(f"gpu_health_status{{{gpu_labels}}} {health_value}")
 
-	return Response(content="\n".join(prometheus_lines) + "\n", media_type="text/plain")
+	return "\n".join(prometheus_lines) + "\n"
+
+
+@app.get("/gpu/metric")
+def get_gpu_metrics(method: str = Query("nvml")):
+	"""Return only dynamic (time-varying) numeric data, for Prometheus use"""
+	metric_fields = ["--uuid", "--name", "--power", "--temp", "--clocks", "--util", "--mem", "--fan", "--health"]
+	
+	data = _run_core_py(method, metric_fields)
+	start = time.perf_counter()
+	content = _render_prometheus(data)
+	STAGE_SECONDS.observe(time.perf_counter() - start, method=method, stage="render")
+	return Response(content=content, media_type="text/plain")
+
+
+@app.get("/metrics/exporter")
+def get_exporter_metrics():
+	"""Return the exporter's own gpu_exporter_* metrics, for Prometheus use"""
+	# Kept off /gpu/metric, whose consumers expect every series to describe a GPU
+	return Response(content=exporter_metrics.render(), media_type="text/plain")
 
 
 @app.get("/gpu/metrics/json")
@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+import time
+
+# Backends import each other as top-level `backends.*`, the way core.py runs them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends.bash import HealthPoller  # noqa: E402
+
+FAKE_DCGMI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_dcgmi")
+
+
+def make_poller(tmp_path, monkeypatch, interval=30.0):
+    log = tmp_path / "dcgmi.log"
+    monkeypatch.setenv("FAKE_DCGMI_LOG", str(log))
+    poller = HealthPoller(interval=interval, cache_path=str(tmp_path / "health.json"), dcgmi=FAKE_DCGMI)
+    return poller, log
+
+
+def calls(log):
+    return log.read_text().split() if log.exists() else []
+
+
+def test_first_get_misses(tmp_path, monkeypatch):
+    poller, log = make_poller(tmp_path, monkeypatch)
+    report = poller.get(0)
+    assert not report["has_error"]
+    assert report["value"]["group"] == "0"
+    assert poller.stats() == {"hits": 0, "misses": 1}
+    assert calls(log) == ["0"]
+
+
+def test_second_get_hits_the_cache(tmp_path, monkeypatch):
+    poller, log = make_poller(tmp_path, monkeypatch)
+    poller.get(1)
+    report = poller.get(1)
+    assert report["value"]["group"] == "1"
+    assert poller.stats() == {"hits": 1, "misses": 1}
+    assert calls(log) == ["1"]
+
+
+def test_entry_older_than_max_age_is_refreshed(tmp_path, monkeypatch):
+    poller, log = make_poller(tmp_path, monkeypatch, interval=10.0)
+    poller.get(2)
+
+    cache_path = tmp_path / "health.json"
+    cache = json.loads(cache_path.read_text())
+    cache["2"]["timestamp"] = time.time() - 2 * poller.interval - 1
+    cache_path.write_text(json.dumps(cache))
+
+    report = poller.get(2)
+    assert report["age_seconds"] < poller.interval
+    assert poller.stats() == {"hits": 0, "misses": 2}
+    assert calls(log) == ["2", "2"]
+
+
+def test_dcgmi_path_with_spaces_is_not_split(tmp_path, monkeypatch):
+    fake = tmp_path / "my tools" / "fake dcgmi"
+    fake.parent.mkdir()
+    fake.write_text(open(FAKE_DCGMI).read())
+    fake.chmod(0o755)
+    poller, log = make_poller(tmp_path, monkeypatch)
+    poller.dcgmi = str(fake)
+    assert poller.get(3)["value"]["group"] == "3"
+    assert calls(log) == ["3"]
+
+
+def test_missing_dcgmi_is_an_error_entry(tmp_path, monkeypatch):
+    poller, _ = make_poller(tmp_path, monkeypatch)
+    poller.dcgmi = str(tmp_path / "no such dcgmi")
+    report = poller.get(0)
+    assert report["has_error"]
+    assert report["error"]
+
+
+def test_default_cache_is_per_user(monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    assert str(os.getuid()) in os.path.basename(HealthPoller.default_cache_path())
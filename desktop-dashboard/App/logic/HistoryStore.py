@@ -0,0 +1,254 @@
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QMetaObject, QObject, QThread, Qt, Signal, Slot
+
+
+# Evaluates the bucket edges once rather than once per bucket; the keyword needs SQLite 3.35+,
+# and without it older builds still answer the same query
+_MATERIALIZED = "MATERIALIZED" if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+
+def _to_iso(timestamp: float) -> str:
+    # The logger stores the API's local, naive ISO timestamps
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _from_iso(text: str) -> float:
+    return datetime.fromisoformat(text).timestamp()
+
+
+@dataclass(frozen=True)
+class Buckets:
+    """A metric reduced to one bucket per pixel column: center time, min, max and average of each"""
+    time: np.ndarray = field(default_factory=lambda: np.empty(0))
+    low: np.ndarray = field(default_factory=lambda: np.empty(0))
+    high: np.ndarray = field(default_factory=lambda: np.empty(0))
+    mean: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+class HistoryStore:
+    """
+    Read-only access to a `gpu_sql_logger` database: the `gpu_info` table and
+    one table per GPU UUID, keyed by ISO timestamp.
+
+    `buckets()` never loads raw rows: SQLite aggregates each of at most
+    `width` buckets over its own range of the timestamp index, so the cost of
+    a query follows the rows in range, not the size of the database, and the
+    result follows the plot's width.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # mode=ro: the logger may be writing to the same file
+        self._conn = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+
+    @staticmethod
+    def _table(uuid: str) -> str:
+        # Same table naming as the logger
+        return '"' + quote(uuid, safe="") + '"'
+
+    def gpus(self) -> Dict[str, str]:
+        """uuid -> name of every GPU with a metrics table"""
+        tables = {row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        gpus = {}
+        if "gpu_info" in tables:
+            for uuid, name in self._conn.execute("SELECT uuid, name FROM gpu_info ORDER BY minor, uuid"):
+                if uuid and quote(uuid, safe="") in tables:
+                    gpus[uuid] = name or uuid
+        return gpus
+
+    def metrics(self, uuid: str) -> List[str]:
+        """The numeric columns of a GPU's table"""
+        return [row[1] for row in self._conn.execute(f"PRAGMA table_info({self._table(uuid)})")
+                if row[2].upper() == "REAL"]
+
+    def extent(self, uuid: str) -> Optional[Tuple[float, float]]:
+        """Unix times of the first and last rows of a GPU, None if it has none"""
+        table = self._table(uuid)
+        # Separate subqueries: SQLite only answers a lone MIN or MAX from the index
+        first, last = self._conn.execute(
+            f"SELECT (SELECT MIN(timestamp) FROM {table}), (SELECT MAX(timestamp) FROM {table})").fetchone()
+        if first is None:
+            return None
+        return _from_iso(first), _from_iso(last)
+
+    def buckets(self, uuid: str, metric: str, start: Optional[float] = None, end: Optional[float] = None,
+                width: int = 1000) -> Buckets:
+        """`metric` between `start` and `end` (the whole history by default) in at most `width` buckets"""
+        return self.buckets_many(uuid, [metric], start, end, width)[metric]
+
+    def buckets_many(self, uuid: str, metrics: List[str], start: Optional[float] = None,
+                     end: Optional[float] = None, width: int = 1000) -> Dict[str, Buckets]:
+        """Like `buckets` for several metrics of one GPU, with a single pass over the range"""
+        unknown = set(metrics) - set(self.metrics(uuid))
+        if unknown:
+            raise ValueError(f"Unknown metric: {', '.join(sorted(unknown))}")
+        empty = {metric: Buckets() for metric in metrics}
+        if start is None or end is None:
+            extent = self.extent(uuid)
+            if extent is None:
+                return empty
+            start = extent[0] if start is None else start
+            end = extent[1] if end is None else end
+        if end <= start or not metrics:
+            return empty
+
+        width = max(width, 1)
+        step = (end - start) / width
+        # Bucket edges as the logger writes timestamps, so each bucket is one range scan of the
+        # timestamp index and no row's timestamp is ever parsed; the last edge takes in `end` itself
+        edges = [_to_iso(start + i * step) for i in range(width)] + [_to_iso(end + 1e-6)]
+        aggregates = ", ".join(f'MIN("{m}"), MAX("{m}"), AVG("{m}")' for m in metrics)
+        # One statement returning one row: the thread takes the GIL back once per query rather than
+        # once per bucket, which matters while the GUI thread is busy drawing
+        (answer,) = self._conn.execute(f'''
+            WITH edge(i, lo, hi) AS {_MATERIALIZED} (
+                SELECT key, value, lead(value) OVER (ORDER BY key) FROM json_each(:edges)
+            )
+            SELECT json_group_array((
+                SELECT json_array({aggregates})
+                FROM {self._table(uuid)} WHERE timestamp >= lo AND timestamp < hi
+            )) FROM edge WHERE hi IS NOT NULL
+        ''', {"edges": json.dumps(edges)}).fetchone()
+
+        rows = np.array(json.loads(answer), dtype=np.float64).reshape(width, len(metrics), 3)
+        centers = start + (np.arange(width) + 0.5) * step
+        result = {}
+        for k, metric in enumerate(metrics):
+            low, high, mean = rows[:, k, 0], rows[:, k, 1], rows[:, k, 2]
+            filled = ~np.isnan(low)
+            result[metric] = Buckets(centers[filled], low[filled], high[filled], mean[filled])
+        return result
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass(frozen=True)
+class HistoryQuery:
+    key: str  # The plot asking; a newer query with the same key replaces an unstarted one
+    uuid: str
+    metric: str
+    start: Optional[float]
+    end: Optional[float]
+    width: int
+    id: int = 0
+
+    def same_range(self, other: 'HistoryQuery') -> bool:
+        return (self.uuid, self.start, self.end, self.width) == (other.uuid, other.start, other.end, other.width)
+
+
+@dataclass(frozen=True)
+class HistoryResult:
+    query: HistoryQuery
+    buckets: Buckets
+    elapsed: float = 0.0
+    error: str = ""
+
+
+class _QueryWorker(QObject):
+    """Lives on the explorer thread with its own connection and answers the pending queries"""
+    answered = Signal(object)
+
+    def __init__(self, path: str, pending: Dict[str, HistoryQuery], lock: Lock):
+        super().__init__()
+        self.path = path
+        self._pending = pending
+        self._lock = lock
+        self._store = None
+
+    @Slot()
+    def drain(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                # Newest first: the plot being panned right now goes ahead of the others' backlog
+                newest = self._pending.pop(next(reversed(self._pending)))
+                # Waiting queries for the same range of the same GPU (as after "Show All") share its pass
+                batch = [newest] + [self._pending.pop(key) for key, query in list(self._pending.items())
+                                    if newest.same_range(query)]
+            for result in self._answer(batch):
+                self.answered.emit(result)
+
+    def _answer(self, batch: List[HistoryQuery]) -> List[HistoryResult]:
+        started = time.perf_counter()
+        first = batch[0]
+        try:
+            if self._store is None:
+                self._store = HistoryStore(self.path)
+            answers = self._store.buckets_many(first.uuid, list(dict.fromkeys(q.metric for q in batch)),
+                                               first.start, first.end, first.width)
+        except (sqlite3.Error, ValueError) as e:
+            return [HistoryResult(query, Buckets(), time.perf_counter() - started, str(e)) for query in batch]
+        elapsed = time.perf_counter() - started
+        return [HistoryResult(query, answers[query.metric], elapsed) for query in batch]
+
+    @Slot()
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+
+class HistoryExplorer(QObject):
+    """
+    Answers bucketed history queries on a background thread.
+
+    `request()` returns at once; the result arrives through `result_ready` on
+    the GUI thread. Queries are coalesced per key: while the thread is busy,
+    a new query from the same plot replaces the one still waiting, so a burst
+    of pan events costs one query, for the latest view. Waiting queries are
+    answered newest first.
+    """
+    result_ready = Signal(object)
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._pending: Dict[str, HistoryQuery] = {}
+        self._lock = Lock()
+        self._next_id = 0
+
+        self._thread = QThread()
+        self._thread.setObjectName("gpu-history-query")
+        self._worker = _QueryWorker(path, self._pending, self._lock)
+        self._worker.moveToThread(self._thread)
+        self._worker.answered.connect(self.result_ready)
+        self._thread.start()
+
+        if app := QCoreApplication.instance():
+            app.aboutToQuit.connect(self.shutdown)
+
+    def request(self, key: str, uuid: str, metric: str, start: Optional[float] = None,
+                end: Optional[float] = None, width: int = 1000) -> int:
+        """Queues a query and returns its id; `start`/`end` default to the GPU's whole history"""
+        with self._lock:
+            self._next_id += 1
+            query = HistoryQuery(key, uuid, metric, start, end, width, self._next_id)
+            idle = not self._pending
+            self._pending.pop(key, None)
+            self._pending[key] = query
+        if idle:
+            QMetaObject.invokeMethod(self._worker, "drain", Qt.ConnectionType.QueuedConnection)
+        return query.id
+
+    def shutdown(self) -> None:
+        if self._thread.isRunning():
+            with self._lock:
+                self._pending.clear()
+            QMetaObject.invokeMethod(self._worker, "close", Qt.ConnectionType.BlockingQueuedConnection)
+            self._thread.quit()
+            self._thread.wait()
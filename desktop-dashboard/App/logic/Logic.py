@@ -1,81 +1,94 @@
+import os
+import sys
 import time
+import math
+import threading
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import requests
 
+# The exposition parser and history buffers live in the repository-level `shared` package
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+
+from shared.exposition import ExpositionParser
+from App.logic.Series import MetricSeries
+
 
 class GPUMonitor:
     URL = None
-
-    def __init__(self, url: str = ""):
+    # Samples kept per GPU metric: two hours at the 2 s fetch interval
+    HISTORY_CAPACITY = 3600
+    # Optional age limit in seconds on top of the capacity
+    HISTORY_RETENTION: Optional[float] = None
+    # Seconds to wait for the API before a fetch fails
+    REQUEST_TIMEOUT = 5.0
+
+    def __init__(self, url: str = "", capacity: Optional[int] = None, retention: Optional[float] = None):
         if url == "":
             url = self.URL
         self.url = url
-        self.metrics_history: Dict[int, Dict[str, List[Tuple[float, float]]]] = {}
+        self.capacity = capacity or self.HISTORY_CAPACITY
+        self.retention = retention if retention is not None else self.HISTORY_RETENTION
+        self.metrics_history: Dict[int, Dict[str, MetricSeries]] = {}
         self.gpu_info: Dict[int, Dict[str, str]] = {}
         self.last_fetch_time = 0
         self.cache_duration = 2  # seconds
+        self._parser = ExpositionParser()
+        # Keeps the connection to the source open between fetches
+        self._session = requests.Session()
+        # Guards the history against readers on other threads; never held during HTTP requests
+        self.lock = threading.RLock()
 
-    def fetch_metrics(self) -> bool:
+    def fetch_metrics(self, force: bool = False) -> bool:
         current_time = time.time()
-        if current_time - self.last_fetch_time > self.cache_duration:
+        if force or current_time - self.last_fetch_time > self.cache_duration:
             try:
-                response = requests.get(self.url)
+                response = self._session.get(self.url, timeout=self.REQUEST_TIMEOUT)
                 response.raise_for_status()
-                self._parse_metrics(response.text)
-                self.last_fetch_time = current_time
+                with self.lock:
+                    self._parse_metrics(response.text)
+                    self.last_fetch_time = current_time
                 return True
             except requests.RequestException as e:
                 raise Exception(f"Error fetching metrics: {e}")
         return True
 
     def _parse_metrics(self, raw_data: str):
-        lines = raw_data.split('\n')
-
-        for line in lines:
-            if line.startswith('#') or not line.strip():
-                continue
+        scrape = self._parser.parse(raw_data)
+        now = time.time()
 
+        for key, labels in scrape.gpus.items():
             try:
-                metric_name, rest = line.split('{', 1)
-                labels_part, value_part = rest.split('}', 1)
-                value = float(value_part.strip())
-
-                labels = {}
-                for label in labels_part.split(','):
-                    key, val = label.split('=')
-                    labels[key.strip()] = val.strip('"')
-
-                gpu_index = int(labels['gpu_index'])
-
-                if gpu_index not in self.gpu_info:
-                    self.gpu_info[gpu_index] = {
-                        'uuid': labels['gpu_uuid'],
-                        'name': labels['gpu_name'],
-                        'health': labels['gpu_health']
-                    }
-
-                if gpu_index not in self.metrics_history:
-                    self.metrics_history[gpu_index] = {}
-
-                # Add the current value with timestamp
-                if metric_name not in self.metrics_history[gpu_index]:
-                    self.metrics_history[gpu_index][metric_name] = []
-
-                self.metrics_history[gpu_index][metric_name].append(
-                    (time.time(), value)
-                )
-
-            except (ValueError, KeyError) as e:
-                print(f"Error parsing line: {line}\nError: {e}")
+                gpu_index = int(key)
+            except ValueError:
+                print(f"Invalid GPU index: {key}")
                 continue
 
+            # Refreshed on every scrape so health changes show up
+            self.gpu_info[gpu_index] = {
+                'uuid': labels.get('gpu_uuid', ''),
+                'name': labels.get('gpu_name', ''),
+                'health': labels.get('gpu_health', '')
+            }
+
+            history = self.metrics_history.setdefault(gpu_index, {})
+            row = scrape.rows[key]
+            # Add the current value with timestamp
+            for metric_name, column in scrape.columns.items():
+                if not math.isnan(column[row]):
+                    series = history.get(metric_name)
+                    if series is None:
+                        series = history[metric_name] = MetricSeries(self.capacity, self.retention)
+                    series.append(now, column[row])
+
     def get_gpu_list(self) -> Dict[int, Dict[str, str]]:
         if not self.fetch_metrics():
             return {}
-        return {idx: info for idx, info in self.gpu_info.items()}
+        with self.lock:
+            return {idx: info for idx, info in self.gpu_info.items()}
 
-    def get_gpu_metric(self, gpu_index: int, metric_name: str) -> Optional[List[Tuple[float, float]]]:
+    def get_gpu_metric(self, gpu_index: int, metric_name: str) -> Optional[MetricSeries]:
         if not self.fetch_metrics():
             return None
 
@@ -90,12 +103,30 @@ class GPUMonitor:
 
         return self.metrics_history[gpu_index][metric_name]
 
+    def get_gpu_metric_window(self, gpu_index: int, metric_name: str, start: Optional[float] = None,
+                              end: Optional[float] = None, width: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """`(timestamps, values)` between `start` and `end`, min/max decimated to `width` pixels if given"""
+        if not self.fetch_metrics():
+            return np.empty(0), np.empty(0)
+        return self.history(gpu_index, metric_name, width, start, end)
+
+    def history(self, gpu_index: int, metric_name: str, width: int = 0, start: Optional[float] = None,
+                end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Like `get_gpu_metric_window` without fetching first; returns copies, safe to use from any thread"""
+        with self.lock:
+            series = self.metrics_history.get(gpu_index, {}).get(metric_name)
+            if series is None:
+                return np.empty(0), np.empty(0)
+            t, v = series.decimated(width, start, end)
+            return t.copy(), v.copy()
+
     def get_available_metrics(self, gpu_index: int) -> List[str]:
         if not self.fetch_metrics():
             return []
 
-        if gpu_index in self.metrics_history:
-            return list(self.metrics_history[gpu_index].keys())
+        with self.lock:
+            if gpu_index in self.metrics_history:
+                return list(self.metrics_history[gpu_index].keys())
         return []
 
 
@@ -118,11 +149,10 @@ def monitor_gpu_metric(monitor: GPUMonitor, gpu_index: int, metric_name: str):
     try:
         while True:
             history = monitor.get_gpu_metric(gpu_index, metric_name)
-            print(history)
             if history:
                 # Print only the latest value
-                timestamp, value = history[-1]
-                # print(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp)):<25}{value}")
+                timestamp, value = history.latest()
+                print(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp)):<25}{value}")
             time.sleep(2)
     except KeyboardInterrupt:
         print("\nMonitoring stopped.")
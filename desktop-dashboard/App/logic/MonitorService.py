@@ -0,0 +1,230 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QMetaObject, QObject, QThread, QTimer, Qt, Signal, Slot
+
+from App.logic.Logic import GPUMonitor
+
+
+@dataclass(frozen=True)
+class GpuSnapshot:
+    """Read-only state of the monitor after one poll, broadcast to every page"""
+    seq: int = 0
+    time: float = 0.0
+    # The data source polled
+    url: str = ""
+    # gpu index -> {'uuid', 'name', 'health'}
+    gpus: Mapping[int, Mapping[str, str]] = field(default_factory=lambda: MappingProxyType({}))
+    # gpu index -> names of the metrics it reports
+    metrics: Mapping[int, Tuple[str, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    # gpu index -> metric -> latest value
+    latest: Mapping[int, Mapping[str, float]] = field(default_factory=lambda: MappingProxyType({}))
+    error: str = ""
+
+
+class _PollWorker(QObject):
+    """Lives on the service thread and polls the API on its own timer"""
+    polled = Signal(object)
+
+    def __init__(self, monitor: GPUMonitor, interval_ms: int):
+        super().__init__()
+        self.monitor = monitor
+        self.interval_ms = interval_ms
+        self._timer = None
+        self._seq = 0
+
+    @Slot()
+    def start(self):
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.interval_ms)
+        self._timer.timeout.connect(self.poll)
+        self._timer.start()
+        self.poll()
+
+    @Slot()
+    def stop(self):
+        if self._timer:
+            self._timer.stop()
+
+    @Slot(int)
+    def set_interval(self, interval_ms: int):
+        faster = interval_ms < self.interval_ms
+        self.interval_ms = interval_ms
+        if self._timer:
+            self._timer.setInterval(interval_ms)
+            if faster:
+                # Back from the background: catch up now rather than at the next tick
+                self._timer.start()
+                self.poll()
+
+    @Slot(object)
+    def set_monitor(self, monitor: GPUMonitor):
+        """Polls `monitor` from now on, starting right away rather than at the next tick"""
+        self.monitor = monitor
+        if self._timer:
+            self._timer.start()
+        self.poll()
+
+    @Slot()
+    def poll(self):
+        monitor = self.monitor
+        error = ""
+        try:
+            monitor.fetch_metrics(force=True)
+        except Exception as e:
+            error = str(e)
+        self._seq += 1
+        self.polled.emit(_snapshot(monitor, self._seq, error))
+
+
+def _snapshot(monitor: GPUMonitor, seq: int, error: str = "") -> GpuSnapshot:
+    with monitor.lock:
+        gpus = {idx: MappingProxyType(dict(info)) for idx, info in monitor.gpu_info.items()}
+        metrics = {idx: tuple(history) for idx, history in monitor.metrics_history.items()}
+        latest = {idx: MappingProxyType({name: series.latest()[1] for name, series in history.items() if len(series)})
+                  for idx, history in monitor.metrics_history.items()}
+    return GpuSnapshot(
+        seq=seq,
+        time=time.time(),
+        url=monitor.url or "",
+        gpus=MappingProxyType(gpus),
+        metrics=MappingProxyType(metrics),
+        latest=MappingProxyType(latest),
+        error=error,
+    )
+
+
+class MonitorService(QObject):
+    """
+    The application-wide GPUMonitor and the one worker thread that polls it.
+
+    Every `interval_ms` the worker fetches the API once and the service emits
+    `snapshot_ready` with an immutable GpuSnapshot on the GUI thread; pages
+    subscribe instead of fetching on their own. Metric history stays in the
+    monitor and is read through `history()`, which never touches the network.
+
+    `set_background(True)` slows polling to `BACKGROUND_INTERVAL_MS` while
+    nothing is on screen; `set_background(False)` polls at once and returns
+    to `interval_ms`.
+
+    `set_url()` switches the data source in place. Each source keeps its own
+    GPUMonitor, so switching back to one of the last `MAX_SOURCES` is instant
+    and finds its history where it was left.
+    """
+    snapshot_ready = Signal(object)
+    _monitor_changed = Signal(object)
+    _interval_changed = Signal(int)
+
+    INTERVAL_MS = 2000
+    BACKGROUND_INTERVAL_MS = 30000
+    MAX_SOURCES = 4
+
+    _instance: Optional['MonitorService'] = None
+    _lock: Lock = Lock()
+
+    def __init__(self, url: str = "", interval_ms: int = INTERVAL_MS):
+        super().__init__()
+        self.monitor = GPUMonitor(url)
+        self.latest: Optional[GpuSnapshot] = None
+        self.interval_ms = interval_ms
+        self.background = False
+        # url -> its monitor, most recently used last
+        self._monitors: OrderedDict[str, GPUMonitor] = OrderedDict({self.monitor.url: self.monitor})
+
+        self._thread = QThread()
+        self._thread.setObjectName("gpu-monitor-poll")
+        self._worker = _PollWorker(self.monitor, interval_ms)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.start)
+        self._worker.polled.connect(self._on_polled)
+        self._monitor_changed.connect(self._worker.set_monitor)
+        self._interval_changed.connect(self._worker.set_interval)
+        self._thread.start()
+
+        if app := QCoreApplication.instance():
+            app.aboutToQuit.connect(self.shutdown)
+
+    @classmethod
+    def instance(cls) -> 'MonitorService':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def running(cls) -> Optional['MonitorService']:
+        """The service if it has been started, without starting it"""
+        with cls._lock:
+            return cls._instance
+
+    @classmethod
+    def destroy_instance(cls) -> None:
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                cls._instance.deleteLater()
+                cls._instance = None
+
+    @property
+    def url(self) -> str:
+        return self.monitor.url or ""
+
+    def sources(self) -> List[str]:
+        """URLs with a cached history, most recently used first"""
+        return [url for url in reversed(self._monitors) if url]
+
+    def set_background(self, background: bool) -> None:
+        if background != self.background:
+            self.background = background
+            self._interval_changed.emit(self.BACKGROUND_INTERVAL_MS if background else self.interval_ms)
+
+    def set_url(self, url: str) -> None:
+        """Polls `url` from now on, reusing its monitor and history if it was polled before"""
+        if url == self.monitor.url:
+            return
+        monitor = self._monitors.pop(url, None) or GPUMonitor(url)
+        self._monitors[url] = monitor
+        while len(self._monitors) > self.MAX_SOURCES:
+            self._monitors.popitem(last=False)
+        self.monitor = monitor
+        self._monitor_changed.emit(monitor)
+        if monitor.last_fetch_time:
+            # The cached state goes out at once; the worker's next poll of the source follows
+            self._on_polled(_snapshot(monitor, self.latest.seq if self.latest else 0))
+        else:
+            self.latest = None
+
+    def subscribe(self, slot: Callable[[GpuSnapshot], None]) -> None:
+        """Connects `slot` to every future snapshot and hands it the latest one right away"""
+        self.snapshot_ready.connect(slot)
+        if self.latest is not None:
+            slot(self.latest)
+
+    def unsubscribe(self, slot: Callable[[GpuSnapshot], None]) -> None:
+        try:
+            self.snapshot_ready.disconnect(slot)
+        except (RuntimeError, TypeError):
+            pass
+
+    def history(self, gpu_index: int, metric_name: str, width: int = 0, start: Optional[float] = None,
+                end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Copies of a metric's `(timestamps, values)`, min/max decimated to `width` pixels if given"""
+        return self.monitor.history(gpu_index, metric_name, width, start, end)
+
+    def _on_polled(self, snapshot: GpuSnapshot) -> None:
+        if snapshot.url != self.url:
+            # Polled before a switch, delivered after it
+            return
+        self.latest = snapshot
+        self.snapshot_ready.emit(snapshot)
+
+    def shutdown(self) -> None:
+        if self._thread.isRunning():
+            QMetaObject.invokeMethod(self._worker, "stop", Qt.ConnectionType.BlockingQueuedConnection)
+            self._thread.quit()
+            self._thread.wait()
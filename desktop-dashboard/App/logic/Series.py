@@ -0,0 +1,68 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from shared.history import RingBuffer
+
+
+class MetricSeries:
+    """
+    Time-indexed metric history with a fixed memory footprint.
+
+    Timestamps and values are two `RingBuffer`s of `capacity` samples; once
+    full, each new sample replaces the oldest. Samples older than `retention`
+    seconds (if set) are dropped as well. The history is always one
+    contiguous, time-ordered slice, so windows are zero-copy views found by
+    binary search.
+    """
+
+    def __init__(self, capacity: int, retention: Optional[float] = None):
+        self.capacity = capacity
+        self.retention = retention
+        self._t = RingBuffer(capacity)
+        self._v = RingBuffer(capacity)
+
+    def __len__(self) -> int:
+        return len(self._t)
+
+    def append(self, timestamp: float, value: float) -> None:
+        self._t.append(timestamp)
+        self._v.append(value)
+
+        if self.retention is not None:
+            expired = int(np.searchsorted(self._t.window(), timestamp - self.retention, side="left"))
+            self._t.discard(expired)
+            self._v.discard(expired)
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        if not len(self._t):
+            return None
+        return self._t.latest(), self._v.latest()
+
+    def window(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Read-only `(timestamps, values)` views of the samples with `start <= t <= end`, oldest first"""
+        t, v = self._t.window(), self._v.window()
+        lo = 0 if start is None else int(np.searchsorted(t, start, side="left"))
+        hi = len(t) if end is None else int(np.searchsorted(t, end, side="right"))
+        return t[lo:hi], v[lo:hi]
+
+    def decimated(self, width: int, start: Optional[float] = None,
+                  end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The window reduced to at most two samples per pixel column for a plot
+        `width` pixels wide: each column keeps its minimum and its maximum, in
+        time order, so spikes survive the reduction.
+        """
+        t, v = self.window(start, end)
+        if width <= 0 or len(t) <= 2 * width:
+            return t, v
+
+        span = max(t[-1] - t[0], 1e-9)
+        columns = np.minimum(((t - t[0]) / span * width).astype(np.int64), width - 1)
+        # Sort by (column, value): the first sample of a column is its minimum, the last its maximum
+        order = np.lexsort((v, columns))
+        starts = np.flatnonzero(np.diff(columns[order])) + 1
+        first = order[np.concatenate(([0], starts))]
+        last = order[np.concatenate((starts - 1, [len(order) - 1]))]
+        keep = np.unique(np.concatenate((first, last)))
+        return t[keep], v[keep]
@@ -1,12 +1,20 @@
-from PySide6.QtCore import QSize
+import importlib
+from typing import Optional
+
+from PySide6.QtCore import QEvent, QSize, QTimer, Signal
 from PySide6.QtWidgets import QMainWindow, QApplication
 from qt_material import apply_stylesheet
 
 import App.utils.Loader
+import App.widgets.Plots
+from App.navigation.pages import PAGE_REGISTRY
 from App.navigation.router import Router
+from App.utils.Startup import Preloader, StartupTimer
 
 
 class MainWindow(QMainWindow):
+    minimized_changed = Signal(bool)
+
     def __init__(self):
         super().__init__()
         self.router = Router.instance()
@@ -17,10 +25,55 @@ class MainWindow(QMainWindow):
 
         self.router.navigate("welcome")
 
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.minimized_changed.emit(self.isMinimized())
+
+
+def _start_monitor(url: Optional[str], window: MainWindow):
+    # numpy and requests load here rather than before the window shows; the first poll
+    # then runs on the service thread while the welcome page is up
+    from App.logic.Logic import GPUMonitor
+    from App.logic.MonitorService import MonitorService
+    if url:
+        GPUMonitor.URL = url
+    service = MonitorService.instance()
+    # Minimized, nothing is drawn: a slow poll keeps the history going until the window is back
+    window.minimized_changed.connect(service.set_background)
+    service.set_background(window.isMinimized())
+
+
+def _warm_up_web_engine(window: QMainWindow):
+    # Starting the first QtWebEngine process is the slow part; a hidden view does it early,
+    # loading the markdown shell so its scripts are parsed and cached before the first info page
+    from App.widgets.MarkdownLabel import MarkdownLabel
+    from PySide6.QtWebEngineWidgets import QWebEngineView
+
+    web_engine = QWebEngineView(window)
+    web_engine.setHtml(MarkdownLabel._get_shell(), baseUrl=MarkdownLabel._get_assets_url())
+    web_engine.resize(1, 1)
+    web_engine.move(-100000, -100000)
+    web_engine.show()
+    QTimer.singleShot(2500, web_engine.hide)
+    QTimer.singleShot(2500, web_engine.deleteLater)
 
-def main():
+
+def _preload(preloader: Preloader, window: MainWindow, url: Optional[str]):
+    preloader.add("monitor", lambda: _start_monitor(url, window))
+    preloader.add(f"plot backend ({App.widgets.Plots.backend})", App.widgets.Plots.plot_class)
+    for name, page in PAGE_REGISTRY.items():
+        preloader.add(f"page {name}", lambda module=page['module']: importlib.import_module(f"App.pages.{module}.view"))
+    preloader.add("web engine", lambda: _warm_up_web_engine(window))
+
+
+def main(url: Optional[str] = None, timer: Optional[StartupTimer] = None):
+    timer = timer or StartupTimer()
+    timer.mark("imports")
     app = QApplication([])
+    timer.mark("QApplication")
     font = App.utils.Loader.Loader().get_font()
+    timer.mark("font")
     apply_stylesheet(
         app,
         theme='dark_blue.xml' if App.utils.Loader.Loader().is_dark() else 'light_pink.xml',
@@ -30,8 +83,22 @@ def main():
             'font_family': f'{font.family()}'
         }
     )
+    timer.mark("stylesheet")
 
     window = MainWindow()
+    timer.mark("main window")
     window.show()
+
+    preloader = Preloader.instance()
+    preloader.timer = timer
+    _preload(preloader, window, url)
+
+    def shown():
+        # Runs once the show and first paint events have been handled
+        timer.mark("first paint")
+        timer.report("Window shown")
+        preloader.start()
+
+    QTimer.singleShot(0, shown)
     app.exec()
     # TODO: DELETE ALL THE PRINTS
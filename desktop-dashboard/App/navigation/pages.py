@@ -12,6 +12,8 @@ PAGE_REGISTRY = {
         "module": "welcome",
         "title": "GPU Monitor",
         "icon": "main.png",
+        # Shown once; dropped as soon as it is left
+        "cache_size": 0,
     },
     "info": {
         "module": "markdown",
@@ -22,6 +24,19 @@ PAGE_REGISTRY = {
         "module": "gpu",
         "title": "GPU Info",
         "icon": "main.png",
+        # One page per GPU index; the last few keep their plots while hidden
+        "key": "index",
+        "cache_size": 4,
+    },
+    "overview": {
+        "module": "overview",
+        "title": "GPU Overview",
+        "icon": "main.png",
+    },
+    "history": {
+        "module": "history",
+        "title": "GPU History",
+        "icon": "main.png",
     },
 }
 
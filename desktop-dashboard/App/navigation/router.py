@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from threading import Lock
-from typing import Optional, Dict, Protocol, runtime_checkable
+from typing import Optional, Dict, Hashable, Protocol, Tuple, runtime_checkable
 
 from PySide6.QtWidgets import QStackedWidget, QWidget, QApplication
 
@@ -24,11 +24,26 @@ class _RouterMeta(type):
         return cls._instances[cls]
 
 
+# (page name, value of the page's "key" payload field, or None)
+PageKey = Tuple[str, Optional[Hashable]]
+
+
 class Router(metaclass=_RouterMeta):
+    """
+    Shows one page at a time and keeps recently used pages alive.
+
+    Pages are cached per kind: each keeps its `cache_size` most recently used
+    instances (`max_cache_size` unless PAGE_REGISTRY says otherwise). A page
+    whose entry names a payload `key`, such as the GPU page and its index,
+    has one instance per value. A page is `suspend()`ed when it is hidden,
+    `resume()`d when it is shown again from the cache and `cleanup()`ed when
+    it is evicted.
+    """
+
     def __init__(self, max_cache_size: int = 1):
         if not hasattr(self, '_initialized'):
             self.stack: QStackedWidget = QStackedWidget()
-            self._page_cache: OrderedDict[str, QWidget] = OrderedDict()
+            self._page_cache: OrderedDict[PageKey, QWidget] = OrderedDict()
             self.max_cache_size: int = max_cache_size
             self._lock: Lock = Lock()
             self._initialized: bool = True
@@ -41,9 +56,14 @@ class Router(metaclass=_RouterMeta):
         if page_name not in PAGE_REGISTRY:
             raise ValueError(f"Unknown page: {page_name}")
 
+        previous = self.stack.currentWidget()
         with self._lock:
-            page = self._get_or_create_page(page_name)
-            self._update_cache(page_name, page)
+            key = self._cache_key(page_name, payload)
+            cached = key in self._page_cache
+            page = self._get_or_create_page(key)
+            if previous is not None and previous is not page and hasattr(previous, 'suspend'):
+                previous.suspend()
+            self._update_cache(key, page)
 
         try:
             if hasattr(page, 'controller') and page.controller:
@@ -58,6 +78,8 @@ class Router(metaclass=_RouterMeta):
 
         self._update_window_properties(page_name)
         self.stack.setCurrentWidget(page)
+        if cached and previous is not page and hasattr(page, 'resume'):
+            page.resume()
 
     def _update_window_properties(self, page_name: str) -> None:
         main_window = self.stack.window()
@@ -76,11 +98,26 @@ class Router(metaclass=_RouterMeta):
         except Exception as e:
             raise Exception(f"Error updating window properties: {e}")
 
-    def _get_or_create_page(self, page_name: str) -> QWidget:
-        if page := self._page_cache.get(page_name):
-            self._page_cache.move_to_end(page_name)
+    def _cache_key(self, page_name: str, payload: Optional[dict]) -> PageKey:
+        field = PAGE_REGISTRY[page_name].get('key')
+        if field is None:
+            return page_name, None
+        if payload is not None and field in payload:
+            return page_name, payload[field]
+        # No key given: the most recently used page of this kind
+        for name, value in reversed(self._page_cache):
+            if name == page_name:
+                return name, value
+        return page_name, None
+
+    def _cache_size(self, page_name: str) -> int:
+        return PAGE_REGISTRY[page_name].get('cache_size', self.max_cache_size)
+
+    def _get_or_create_page(self, key: PageKey) -> QWidget:
+        if page := self._page_cache.get(key):
+            self._page_cache.move_to_end(key)
             return page
-        return self._load_page(page_name)
+        return self._load_page(key[0])
 
     def _load_page(self, page_name: str) -> QWidget:
         try:
@@ -97,17 +134,24 @@ class Router(metaclass=_RouterMeta):
         except Exception as e:
             raise RuntimeError(f"Page creation failed: {page_name} - {e}")
 
-    def _update_cache(self, page_name: str, page: QWidget) -> None:
-        if page_name not in self._page_cache:
-            if len(self._page_cache) >= self.max_cache_size:
-                self._evict_oldest_page()
-            self._page_cache[page_name] = page
-        self._page_cache.move_to_end(page_name)
-
-    def _evict_oldest_page(self) -> None:
-        oldest_name, oldest_page = self._page_cache.popitem(last=False)
-        self.stack.removeWidget(oldest_page)
-        oldest_page.deleteLater()
+    def _update_cache(self, key: PageKey, page: QWidget) -> None:
+        self._page_cache[key] = page
+        self._page_cache.move_to_end(key)
+
+        kept: Dict[str, int] = {}
+        # Newest first, so each kind keeps its most recently used pages; the page being shown always stays
+        for cached_key in reversed(list(self._page_cache)):
+            name = cached_key[0]
+            kept[name] = kept.get(name, 0) + 1
+            if cached_key != key and kept[name] > self._cache_size(name):
+                self._evict_page(cached_key)
+
+    def _evict_page(self, key: PageKey) -> None:
+        page = self._page_cache.pop(key)
+        if hasattr(page, 'cleanup'):
+            page.cleanup()
+        self.stack.removeWidget(page)
+        page.deleteLater()
 
     @classmethod
     def destroy_instance(cls) -> None:
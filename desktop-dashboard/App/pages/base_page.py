@@ -15,3 +15,25 @@ class BasePage(QWidget):
 
     def connect_signals(self):
         pass
+
+    def is_on_screen(self) -> bool:
+        """False while the page is hidden, its window minimized or (where the platform says so) covered"""
+        if not self.isVisible():
+            return False
+        window = self.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def suspend(self):
+        """Called by the router when the page is hidden but stays cached"""
+        pass
+
+    def resume(self):
+        """Called by the router when a cached page is shown again"""
+        pass
+
+    def cleanup(self):
+        """Called by the router before the page is evicted and deleted"""
+        pass
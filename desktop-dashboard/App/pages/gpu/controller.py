@@ -6,10 +6,14 @@ class Controller(BaseController):
         super().__init__(view, router)
         self.index = 0
         self.real_name = ""
+        # The page Back returns to: home, or the overview the GPU was opened from
+        self.destination = "home"
 
     def back(self):
-        self.view.cleanup()
-        self.router.navigate("home")
+        self.router.navigate(self.destination)
+
+    def history(self, path, uuid):
+        self.router.navigate("history", payload={'path': path, 'uuid': uuid, 'index': self.index})
 
     def about(self):
         self.router.navigate("info", payload={'path': f'info.md', 'destination': 'env'})
@@ -18,6 +22,10 @@ class Controller(BaseController):
         pass
 
     def on_navigate(self, payload: dict):
+        if 'back' in payload:
+            self.destination = payload['back']
+        if self.view.gpu_index == payload['index']:
+            # A cached page for this GPU: its plots and history are kept, and resume() catches them up
+            return
         self.index = payload['index']
         self.view._setup_ui()
-        self.view.connect_buttons()
@@ -1,39 +1,18 @@
-from PySide6.QtCore import QTimer, QThread, Signal, QObject
-from PySide6.QtWidgets import QPushButton, QWidget, QScrollArea, QVBoxLayout
+from PySide6.QtWidgets import QFileDialog, QPushButton, QWidget, QScrollArea, QVBoxLayout
 
-from App.logic.Logic import GPUMonitor
+from App.logic.MonitorService import GpuSnapshot, MonitorService
 from App.pages.base_page import BasePage
 from App.pages.gpu.controller import Controller
 from App.widgets.MainLayout import MainLayout
-from App.widgets.Plot2D import Plot2D
+from App.widgets.Plots import new_plot
 from App.widgets.Separator import Separator
 from App.widgets.TwoSwitch import TwoSwitch
 
 
-class DataFetcher(QThread):
-    data_ready = Signal(dict)
-
-    def __init__(self, monitor, gpu_index: int, parent: QObject = None):
-        super().__init__(parent)
-        self.gpu_index = gpu_index
-        self.monitor = monitor
-        self._running = True
-
-    def run(self):
-        if not self._running:
-            return
-        data = {}
-        metrics = self.monitor.get_available_metrics(self.gpu_index)
-        for metric in metrics:
-            history = self.monitor.get_gpu_metric(self.gpu_index, metric)
-            data[metric] = history or []
-        self.data_ready.emit(data)
-
-    def stop(self):
-        self._running = False
-
-
 class View(BasePage):
+    # The last `gpu_sql_logger` database opened from any GPU page
+    history_path = ""
+
     def __init__(self, router):
         super().__init__(router)
         self.controller = Controller(self, router)
@@ -42,23 +21,30 @@ class View(BasePage):
         self.plots = {}
         self.switches = {}
 
-        self.timer = QTimer(self)
-        self._worker = None
-        self.monitor = GPUMonitor()
+        self.service = MonitorService.instance()
+        self._subscribed = False
+        self._draw_next = False
+        # The data source the plots were built for
+        self._url = None
 
     def _setup_ui(self):
+        self.cleanup()
         if self.layout():
             old_layout = self.layout()
             self._clear_layout(old_layout)
             QWidget().setLayout(old_layout)
+        self.plots = {}
+        self.switches = {}
 
         self.main_layout = MainLayout(f"GPU NO.{self.controller.index}")
         self.setLayout(self.main_layout)
 
         self.back_btn = QPushButton("Back")
         self.set = QPushButton("Restart")
+        self.history_btn = QPushButton("History")
 
         self.main_layout.add_button(self.back_btn)
+        self.main_layout.add_button(self.history_btn)
         self.main_layout.add_button(self.set, role="success")
 
         scroll = QScrollArea()
@@ -69,14 +55,16 @@ class View(BasePage):
         self.main_layout.set_main_content(scroll)
 
         self.gpu_index = self.controller.index
-        self._create_all_plots()
+        self._url = self.service.url
         self.connect_buttons()
-        self._init_timer_and_worker()
+        self._subscribe()
 
-    def _create_all_plots(self):
-        metrics = GPUMonitor().get_available_metrics(self.gpu_index)
+    def _create_plots(self, metrics):
+        """Adds a plot and a switch for each metric that does not have one yet"""
         for metric in metrics:
-            plot = Plot2D(
+            if metric in self.plots:
+                continue
+            plot = new_plot(
                 title=metric.replace('_', ' ').title(),
                 x_label="Time",
                 y_label=metric.split('_')[-1]
@@ -94,11 +82,27 @@ class View(BasePage):
     def connect_buttons(self):
         self.back_btn.clicked.connect(self.controller.back)
         self.set.clicked.connect(self._on_restart_clicked)
+        self.history_btn.clicked.connect(self._on_history_clicked)
+
+    def _on_history_clicked(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Open Logger Database",
+            View.history_path,
+            "SQLite Databases (*.db *.sqlite *.sqlite3);;All Files (*)"
+        )
+        if path:
+            View.history_path = path
+            gpu = self.service.latest.gpus.get(self.gpu_index, {}) if self.service.latest else {}
+            self.controller.history(path, gpu.get('uuid'))
 
     def _on_restart_clicked(self):
         for metric, switch in self.switches.items():
             visible = bool(switch.value)
             plot = self.plots[metric]
+            if visible and plot.isHidden():
+                # Hidden plots are not redrawn; catch this one up with the history it missed
+                self._draw(metric)
             plot.setVisible(visible)
 
             idx = self.plots_layout.indexOf(plot) + 1
@@ -106,39 +110,51 @@ class View(BasePage):
             if item and item.widget():
                 item.widget().setVisible(visible)
 
-    def _init_timer_and_worker(self):
-        self.timer.setInterval(2000)
-        self.timer.timeout.connect(self._start_fetcher)
-        self.timer.start()
-        self._start_fetcher()
-
-    def _start_fetcher(self):
-        if self._worker and self._worker.isRunning():
+    def _subscribe(self):
+        # The snapshot handed over on subscribing is drawn even though the router only shows
+        # the page after this; skipping it would leave the plots blank for a whole poll
+        self._draw_next = True
+        if not self._subscribed:
+            self._subscribed = True
+            self.service.subscribe(self._on_snapshot)
+        elif self.service.latest is not None:
+            self._on_snapshot(self.service.latest)
+
+    def _on_snapshot(self, snapshot: GpuSnapshot):
+        metrics = snapshot.metrics.get(self.gpu_index, ())
+        self._create_plots(metrics)
+        if not self.is_on_screen() and not self._draw_next:
+            # The monitor keeps the history; the first snapshot back on screen redraws it all
             return
-        self._worker = DataFetcher(self.monitor, self.gpu_index)
-        self._worker.data_ready.connect(self._on_new_data)
-        self._worker.finished.connect(self._on_worker_finished)
-        self._worker.start()
-
-    def _on_worker_finished(self):
-        if self._worker:
-            self._worker.deleteLater()
-            self._worker = None
-
-    def _on_new_data(self, data: dict):
-        for metric, history in data.items():
-            plot = self.plots.get(metric)
-            if not plot or not history:
-                continue
-            timestamps, values = zip(*history)
-            plot.clear_plot()
-            plot.plot_points(timestamps, values, label=metric.replace('_', ' '))
+        self._draw_next = False
+        for metric in metrics:
+            if not self.plots[metric].isHidden():
+                self._draw(metric)
+
+    def _draw(self, metric):
+        plot = self.plots[metric]
+        # At most two points per pixel column, however long the history
+        timestamps, values = self.service.history(self.gpu_index, metric, width=plot.plot_width())
+        if len(timestamps):
+            # Updates the plot's line in place; the plots redraw together once this slot returns
+            plot.set_series(metric, timestamps, values, label=metric.replace('_', ' '))
+
+    def suspend(self):
+        # Hidden pages are not redrawn; the monitor keeps their history meanwhile
+        self.cleanup()
+
+    def resume(self):
+        if self._url != self.service.url:
+            # Another source's GPU under the same index
+            self._setup_ui()
+        else:
+            # The latest snapshot redraws every plot from the full history, filling the gap
+            self._subscribe()
 
     def cleanup(self):
-        self.timer.stop()
-        if self._worker and self._worker.isRunning():
-            self._worker.stop()
-            self._worker.wait()
+        if self._subscribed:
+            self.service.unsubscribe(self._on_snapshot)
+            self._subscribed = False
 
     def _clear_layout(self, layout):
         while layout.count():
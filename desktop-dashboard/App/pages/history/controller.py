@@ -0,0 +1,21 @@
+from App.pages.base_controller import BaseController
+
+
+class Controller(BaseController):
+    def __init__(self, view, router):
+        super().__init__(view, router)
+        self.path = None
+        self.uuid = None
+        self.index = None
+
+    def back(self):
+        if self.index is None:
+            self.router.navigate("home")
+        else:
+            self.router.navigate("gpu", payload={'index': self.index})
+
+    def on_navigate(self, payload: dict):
+        self.path = payload['path']
+        self.uuid = payload.get('uuid')
+        self.index = payload.get('index')
+        self.view._setup_ui()
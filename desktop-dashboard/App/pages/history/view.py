@@ -0,0 +1,161 @@
+import time
+
+from PySide6.QtWidgets import QComboBox, QPushButton, QScrollArea, QVBoxLayout, QWidget
+
+from App.logic.HistoryStore import HistoryExplorer, HistoryResult, HistoryStore
+from App.pages.base_page import BasePage
+from App.pages.history.controller import Controller
+from App.widgets.Label import Label
+from App.widgets.MainLayout import MainLayout
+from App.widgets.Plots import new_plot
+from App.widgets.Separator import Separator
+
+
+def _format_time(timestamp):
+    return time.strftime('%m-%d %H:%M', time.localtime(timestamp))
+
+
+class View(BasePage):
+    """
+    Explores a `gpu_sql_logger` database. Each plot shows one metric as the
+    average, minimum and maximum of one bucket per pixel column; every pan or
+    zoom queries the database again for just the visible range.
+    """
+
+    def __init__(self, router):
+        super().__init__(router)
+        self.controller = Controller(self, router)
+        self.explorer = None
+        self.uuid = None
+        self.plots = {}
+        # metric -> id of the newest query; older answers are dropped
+        self._latest = {}
+        # Plots whose next answer should reset the view to the data
+        self._unfitted = set()
+
+    def _setup_ui(self):
+        self.cleanup()
+        if self.layout():
+            old_layout = self.layout()
+            self._clear_layout(old_layout)
+            QWidget().setLayout(old_layout)
+        self.plots = {}
+
+        self.main_layout = MainLayout("GPU History")
+        self.setLayout(self.main_layout)
+
+        self.gpu_box = QComboBox()
+        self.main_layout.add_parameter_widget(Label("GPU"))
+        self.main_layout.add_parameter_widget(self.gpu_box)
+        self.status = Label("", italic=True)
+        self.status.setWordWrap(True)
+        self.main_layout.add_parameter_widget(self.status)
+
+        self.back_btn = QPushButton("Back")
+        self.all_btn = QPushButton("Show All")
+        self.main_layout.add_button(self.back_btn)
+        self.main_layout.add_button(self.all_btn, role="success")
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        container = QWidget()
+        self.plots_layout = QVBoxLayout(container)
+        scroll.setWidget(container)
+        self.main_layout.set_main_content(scroll)
+
+        store = HistoryStore(self.controller.path)
+        try:
+            gpus = store.gpus()
+        finally:
+            store.close()
+        for uuid, name in gpus.items():
+            self.gpu_box.addItem(f"{name} ({uuid})", uuid)
+        if not gpus:
+            self.status.setText(f"No GPU tables in {self.controller.path}")
+
+        self.gpu_box.setCurrentIndex(max(self.gpu_box.findData(self.controller.uuid), 0))
+
+        self.explorer = HistoryExplorer(self.controller.path)
+        self.explorer.result_ready.connect(self._on_result)
+        self.connect_buttons()
+        if gpus:
+            self._show_gpu(self.gpu_box.currentIndex())
+
+    def connect_buttons(self):
+        self.back_btn.clicked.connect(self.controller.back)
+        self.all_btn.clicked.connect(self._show_all)
+        self.gpu_box.currentIndexChanged.connect(self._show_gpu)
+
+    def _show_gpu(self, index):
+        self.uuid = self.gpu_box.itemData(index)
+        while self.plots_layout.count():
+            if widget := self.plots_layout.takeAt(0).widget():
+                widget.deleteLater()
+        self.plots = {}
+        self._latest = {}
+
+        store = HistoryStore(self.controller.path)
+        try:
+            metrics = store.metrics(self.uuid)
+        finally:
+            store.close()
+        for metric in metrics:
+            plot = new_plot(
+                title=metric.replace('_', ' ').title(),
+                x_label="Time",
+                y_label=metric.split('_')[-1]
+            )
+            plot.set_x_formatter(_format_time)
+            plot.view_changed.connect(lambda x_min, x_max, width, m=metric: self._query(m, x_min, x_max, width))
+            plot.reset_button.clicked.connect(lambda checked=False, m=metric: self._query_all(m))
+            self.plots[metric] = plot
+            self.plots_layout.addWidget(plot)
+            self.plots_layout.addWidget(Separator())
+        self._show_all()
+
+    def _show_all(self):
+        for metric in self.plots:
+            self._query_all(metric)
+
+    def _query_all(self, metric):
+        self._unfitted.add(metric)
+        self._query(metric, None, None, self.plots[metric].plot_width())
+
+    def _query(self, metric, start, end, width):
+        self._latest[metric] = self.explorer.request(metric, self.uuid, metric, start, end, max(width, 1))
+
+    def _on_result(self, result: HistoryResult):
+        query = result.query
+        plot = self.plots.get(query.key)
+        if plot is None or query.uuid != self.uuid or self._latest.get(query.key) != query.id:
+            return
+        if result.error:
+            self.status.setText(f"{query.metric}: {result.error}")
+            return
+        self.status.setText(f"{query.metric}: {len(result.buckets)} buckets in {result.elapsed * 1000:.0f} ms")
+
+        buckets = result.buckets
+        plot.set_series('high', buckets.time, buckets.high, label="max", linewidth=0.8)
+        plot.set_series('mean', buckets.time, buckets.mean, label="avg")
+        plot.set_series('low', buckets.time, buckets.low, label="min", linewidth=0.8)
+        if query.key in self._unfitted:
+            self._unfitted.discard(query.key)
+            plot.reset_view()
+
+    def suspend(self):
+        # Coming back always goes through on_navigate, which rebuilds the page
+        self.cleanup()
+
+    def cleanup(self):
+        if self.explorer is not None:
+            self.explorer.shutdown()
+            self.explorer = None
+
+    def _clear_layout(self, layout):
+        while layout.count():
+            item = layout.takeAt(0)
+            if widget := item.widget():
+                widget.deleteLater()
+            elif sublayout := item.layout():
+                self._clear_layout(sublayout)
+        layout.deleteLater()
@@ -1,8 +1,4 @@
-import os
-import sys
-
-from PySide6.QtWidgets import QApplication
-
+from App.logic.MonitorService import MonitorService
 from App.pages.base_controller import BaseController
 
 
@@ -13,14 +9,17 @@ class Controller(BaseController):
     def show_about(self):
         self.router.navigate("info", payload={'path': 'main.md', 'destination': 'home'})
 
+    def show_overview(self):
+        self.router.navigate("overview")
+
     def show_gpu_info(self, gid):
-        self.router.navigate("gpu", payload={'index': gid})
+        self.router.navigate("gpu", payload={'index': gid, 'back': 'home'})
 
-    @staticmethod
-    def changeURL(text):
-        if text.strip() == "":
+    def changeURL(self, text):
+        url = text.strip()
+        service = MonitorService.instance()
+        if url == "" or url == service.url:
             return
-        QApplication.quit()
-        script = os.path.abspath(sys.argv[0])
-        new_argv = [sys.executable, script, text] + sys.argv[1:]
-        os.execv(sys.executable, new_argv)
+        self.view.show_source(url)
+        service.set_url(url)
+        self.view.update_sources()
@@ -1,9 +1,9 @@
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import (QPushButton, QVBoxLayout, QMessageBox,
+from PySide6.QtWidgets import (QPushButton, QVBoxLayout, QCompleter,
                                QScrollArea, QWidget, QHBoxLayout, QSizePolicy)
 
 import App.widgets.ToolBar
-from App.logic.Logic import GPUMonitor
+from App.logic.MonitorService import GpuSnapshot, MonitorService
 from App.pages.base_page import BasePage
 from App.pages.home.controller import Controller
 from App.utils.Loader import Loader
@@ -17,6 +17,9 @@ class View(BasePage):
         self.controller = Controller(self, router)
         self.toolbar = None
         self.help_btn = None
+        # The GPU list arrives with the service's snapshots; the page never waits on the network
+        self.service = MonitorService.instance()
+        self._subscribed = False
         self._setup_ui()
         self.connect_signals()
 
@@ -32,11 +35,12 @@ class View(BasePage):
         content_layout.setContentsMargins(20, 20, 20, 20)
         content_layout.setSpacing(20)
 
-        url_label = Label(f"Current URL: {App.logic.Logic.GPUMonitor.URL}")
-        url_label.setStyleSheet("font-weight: bold;")
-        content_layout.addWidget(url_label)
+        self.url_label = Label(f"Current URL: {self.service.url}")
+        self.url_label.setStyleSheet("font-weight: bold;")
+        content_layout.addWidget(self.url_label)
 
         self.tagline = SingleInput("URL", input_type='text')
+        self.update_sources()
         container_layout = QHBoxLayout()
         container_layout.addLayout(self.tagline)
         self.apply_button = QPushButton("Apply")
@@ -45,7 +49,11 @@ class View(BasePage):
 
         gpu_label = Label("Available GPUs")
         gpu_label.setStyleSheet("font-weight: bold; font-size: 16px;")
-        content_layout.addWidget(gpu_label)
+        gpu_header_layout = QHBoxLayout()
+        gpu_header_layout.addWidget(gpu_label, stretch=1)
+        self.overview_button = QPushButton("Overview")
+        gpu_header_layout.addWidget(self.overview_button)
+        content_layout.addLayout(gpu_header_layout)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -58,51 +66,14 @@ class View(BasePage):
         button_layout.setContentsMargins(5, 5, 5, 5)
         button_container.setLayout(button_layout)
 
-        try:
-            monitor = GPUMonitor()
-            gpus = monitor.get_gpu_list()
-            if not gpus:
-                no_gpu_label = Label("No GPUs detected")
-                no_gpu_label.setStyleSheet("font-style: italic; color: gray;")
-                button_layout.addWidget(no_gpu_label)
-            else:
-                for gpu_id, gpu_info in gpus.items():
-                    btn = QPushButton()
-                    btn.setProperty("gpu_id", gpu_id)
-                    btn.setProperty("health", gpu_info.get('health', 'unknown').lower())
-
-                    # Format button text with name and UUID
-                    btn_text = f"GPU {gpu_id}: {gpu_info.get('name', 'Unknown')}\n"
-                    btn_text += f"UUID: {gpu_info.get('uuid', 'N/A')}\n"
-                    btn_text += f"Status: {gpu_info.get('health', 'unknown')}"
-                    btn.setText(btn_text)
-
-                    health = gpu_info.get('health', 'unknown').lower()
-                    if health == 'healthy':
-                        pass
-                    elif health == 'warning':
-                        btn.setProperty("class", "warning")
-                    else:
-                        btn.setProperty("class", "danger")
-
-                    btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-                    btn.setMinimumHeight(80)
-
-                    btn.clicked.connect(lambda checked=False, gid=gpu_id: self.controller.show_gpu_info(gid))
-
-                    button_layout.addWidget(btn)
-
-        except Exception as e:
-            error_msg = QMessageBox()
-            error_msg.setIcon(QMessageBox.Icon.Critical)
-            error_msg.setText("Failed to get GPU information")
-            error_msg.setInformativeText(str(e))
-            error_msg.setWindowTitle("Error")
-            error_msg.exec()
-
-            error_label = Label("Failed to load GPU information")
-            error_label.setStyleSheet("color: red; font-style: italic;")
-            button_layout.addWidget(error_label)
+        self.button_layout = button_layout
+        self.gpu_buttons = {}
+        # Placeholder until the first snapshot; afterwards it only shows errors or "No GPUs detected"
+        self.status_label = Label(f"Loading GPUs from {self.service.url}...")
+        self.status_label.setStyleSheet("font-style: italic; color: gray;")
+        self.status_label.setWordWrap(True)
+        button_layout.addWidget(self.status_label)
+        button_layout.addStretch()
 
         scroll.setWidget(button_container)
         content_layout.addWidget(scroll)
@@ -118,7 +89,91 @@ class View(BasePage):
 
         main_layout.addLayout(content_layout)
         self.setLayout(main_layout)
+        self._subscribe()
+
+    def _subscribe(self):
+        if not self._subscribed:
+            self._subscribed = True
+            self.service.subscribe(self._on_snapshot)
+
+    def update_sources(self):
+        # Earlier sources still have their history cached; switching back to one is instant
+        self.tagline.input_field.setCompleter(QCompleter(self.service.sources(), self))
+
+    def show_source(self, url):
+        """Drops the previous source's GPUs and waits for `url`'s"""
+        for btn in self.gpu_buttons.values():
+            btn.deleteLater()
+        self.gpu_buttons = {}
+        self.url_label.setText(f"Current URL: {url}")
+        self._set_status(f"Loading GPUs from {url}...", "font-style: italic; color: gray;")
+
+    def _on_snapshot(self, snapshot: GpuSnapshot):
+        for gpu_id in [gpu_id for gpu_id in self.gpu_buttons if gpu_id not in snapshot.gpus]:
+            self.gpu_buttons.pop(gpu_id).deleteLater()
+        for gpu_id, gpu_info in sorted(snapshot.gpus.items()):
+            self._update_gpu_button(gpu_id, gpu_info)
+
+        if snapshot.error:
+            prefix = "Showing the last known state" if self.gpu_buttons else "Failed to load GPU information"
+            self._set_status(f"{prefix}: {snapshot.error}", "color: red; font-style: italic;")
+        elif not self.gpu_buttons:
+            self._set_status("No GPUs detected", "font-style: italic; color: gray;")
+        else:
+            self.status_label.hide()
+
+    def _set_status(self, text, style):
+        self.status_label.setText(text)
+        self.status_label.setStyleSheet(style)
+        self.status_label.show()
+
+    def _update_gpu_button(self, gpu_id, gpu_info):
+        """Creates the GPU's button on first sight; later snapshots only touch what changed"""
+        btn = self.gpu_buttons.get(gpu_id)
+        if btn is None:
+            btn = QPushButton()
+            btn.setProperty("gpu_id", gpu_id)
+            btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            btn.setMinimumHeight(80)
+            btn.clicked.connect(lambda checked=False, gid=gpu_id: self.controller.show_gpu_info(gid))
+            self.gpu_buttons[gpu_id] = btn
+            # Kept in GPU order, ahead of the status label
+            self.button_layout.insertWidget(sorted(self.gpu_buttons).index(gpu_id), btn)
+
+        # Format button text with name and UUID
+        btn_text = f"GPU {gpu_id}: {gpu_info.get('name', 'Unknown')}\n"
+        btn_text += f"UUID: {gpu_info.get('uuid', 'N/A')}\n"
+        btn_text += f"Status: {gpu_info.get('health', 'unknown')}"
+        if btn.text() != btn_text:
+            btn.setText(btn_text)
+
+        health = gpu_info.get('health', 'unknown').lower()
+        if health == 'healthy':
+            css_class = ""
+        elif health == 'warning':
+            css_class = "warning"
+        else:
+            css_class = "danger"
+        if btn.property("class") != css_class:
+            btn.setProperty("health", health)
+            btn.setProperty("class", css_class)
+            # A changed dynamic property only restyles after a re-polish
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+
+    def suspend(self):
+        self.cleanup()
+
+    def resume(self):
+        # The latest snapshot brings the buttons up to date at once
+        self._subscribe()
+
+    def cleanup(self):
+        if self._subscribed:
+            self.service.unsubscribe(self._on_snapshot)
+            self._subscribed = False
 
     def connect_signals(self):
+        self.overview_button.clicked.connect(self.controller.show_overview)
         self.apply_button.clicked.connect(lambda checked=False:
                                           self.controller.changeURL(self.tagline.get_value()))
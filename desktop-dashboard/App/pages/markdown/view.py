@@ -28,7 +28,10 @@ class View(BasePage):
             self.btn = None
 
     def _setup_ui(self):
-        self.clear_ui()
+        # The label keeps its loaded page; another document only swaps the content
+        if self.label:
+            self.label.set_markdown_file(self.controller.path)
+            return
         self.label = MarkdownLabel(self.controller.path, True)
         self.btn = QPushButton("Back")
         self.btn.clicked.connect(lambda: self.controller.navigate_to_page2())
@@ -0,0 +1,12 @@
+from App.pages.base_controller import BaseController
+
+
+class Controller(BaseController):
+    def __init__(self, view, router):
+        super().__init__(view, router)
+
+    def back(self):
+        self.router.navigate("home")
+
+    def show_gpu_info(self, gid):
+        self.router.navigate("gpu", payload={'index': gid, 'back': 'overview'})
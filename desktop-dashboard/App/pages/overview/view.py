@@ -0,0 +1,155 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QGridLayout, QHBoxLayout, QPushButton, QScrollArea, QVBoxLayout, QWidget
+
+import App.widgets.ToolBar
+from App.logic.MonitorService import GpuSnapshot, MonitorService
+from App.pages.base_page import BasePage
+from App.pages.overview.controller import Controller
+from App.widgets.GpuTile import GpuTile, Sparkline
+from App.widgets.Label import Label
+
+SPARKLINES = (
+    Sparkline("Util", "gpu_utilization_percent", "%", (0, 100)),
+    Sparkline("Temp", "gpu_temperature_celsius", "°C"),
+    Sparkline("Power", "gpu_power_watts", "W"),
+    Sparkline("Mem", "gpu_memory_usage_percent", "%", (0, 100)),
+)
+
+
+class View(BasePage):
+    """
+    Every GPU of the source at once, one GpuTile each.
+
+    All tiles are fed from the monitor service's snapshots and the history
+    it already keeps; no plot library is involved. A tile repaints only the
+    rows whose data changed since the last snapshot.
+    """
+    # Seconds of history in each sparkline
+    WINDOW = 300
+    TILE_WIDTH = 320
+
+    def __init__(self, router):
+        super().__init__(router)
+        self.controller = Controller(self, router)
+        self.service = MonitorService.instance()
+        self._subscribed = False
+        self._draw_next = False
+        self._url = None
+        self._columns = 0
+        self.tiles = {}
+        self._setup_ui()
+
+    def _setup_ui(self):
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+
+        self.toolbar = App.widgets.ToolBar.ToolBar("GPU Overview")
+        main_layout.addWidget(self.toolbar)
+
+        content_layout = QVBoxLayout()
+        content_layout.setContentsMargins(20, 20, 20, 20)
+        content_layout.setSpacing(10)
+
+        header_layout = QHBoxLayout()
+        self.status_label = Label(f"Loading GPUs from {self.service.url}...", italic=True)
+        self.status_label.setWordWrap(True)
+        header_layout.addWidget(self.status_label, stretch=1)
+        self.back_btn = QPushButton("Back")
+        header_layout.addWidget(self.back_btn)
+        content_layout.addLayout(header_layout)
+
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        container = QWidget()
+        self.grid = QGridLayout(container)
+        self.grid.setSpacing(10)
+        self.grid.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.scroll.setWidget(container)
+        content_layout.addWidget(self.scroll)
+
+        main_layout.addLayout(content_layout)
+        self.setLayout(main_layout)
+        self.connect_signals()
+        self._subscribe()
+
+    def connect_signals(self):
+        self.back_btn.clicked.connect(self.controller.back)
+
+    def _subscribe(self):
+        # Draw the snapshot handed over on subscribing, which comes before the router shows the page
+        self._draw_next = True
+        if not self._subscribed:
+            self._subscribed = True
+            self.service.subscribe(self._on_snapshot)
+
+    def _on_snapshot(self, snapshot: GpuSnapshot):
+        if snapshot.url != self._url:
+            self._url = snapshot.url
+            self._remove_tiles(list(self.tiles))
+        self._remove_tiles([index for index in self.tiles if index not in snapshot.gpus])
+        new = [index for index in snapshot.gpus if index not in self.tiles]
+        for index in new:
+            tile = GpuTile(index, SPARKLINES)
+            tile.clicked.connect(self.controller.show_gpu_info)
+            self.tiles[index] = tile
+        if new:
+            self._reflow(force=True)
+
+        draw = self._draw_next or self.is_on_screen()
+        self._draw_next = False
+        for index, tile in self.tiles.items():
+            tile.set_info(snapshot.gpus[index])
+            if not draw:
+                # The next snapshot back on screen brings every sparkline up to date
+                continue
+            latest = snapshot.latest.get(index, {})
+            width = tile.sparkline_width()
+            for sparkline in SPARKLINES:
+                # About two points per pixel column of the sparkline, however long the window
+                timestamps, values = self.service.history(index, sparkline.metric, width,
+                                                          start=snapshot.time - self.WINDOW)
+                tile.set_series(sparkline.metric, timestamps, values, latest.get(sparkline.metric))
+
+        if snapshot.error:
+            self.status_label.setText(f"Showing the last known state: {snapshot.error}" if self.tiles
+                                      else f"Failed to load GPU information: {snapshot.error}")
+        elif not self.tiles:
+            self.status_label.setText("No GPUs detected")
+        else:
+            self.status_label.setText(f"{len(self.tiles)} GPUs at {snapshot.url}")
+
+    def _remove_tiles(self, indices):
+        for index in indices:
+            tile = self.tiles.pop(index)
+            self.grid.removeWidget(tile)
+            tile.deleteLater()
+        if indices:
+            self._reflow(force=True)
+
+    def _reflow(self, force=False):
+        """Lays the tiles out in as many columns as fit, in GPU order"""
+        columns = max(self.scroll.viewport().width() // self.TILE_WIDTH, 1)
+        if columns == self._columns and not force:
+            return
+        self._columns = columns
+        for index in self.tiles:
+            self.grid.removeWidget(self.tiles[index])
+        for position, index in enumerate(sorted(self.tiles)):
+            self.grid.addWidget(self.tiles[index], position // columns, position % columns)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._reflow()
+
+    def suspend(self):
+        self.cleanup()
+
+    def resume(self):
+        self._subscribe()
+
+    def cleanup(self):
+        if self._subscribed:
+            self.service.unsubscribe(self._on_snapshot)
+            self._subscribed = False
@@ -1,4 +1,5 @@
 from App.pages.base_controller import BaseController
+from App.utils.Startup import Preloader
 
 
 class Controller(BaseController):
@@ -6,4 +7,6 @@ class Controller(BaseController):
         super().__init__(view, router)
 
     def skip_welcome(self):
+        # The home page needs the monitor started by the preloader
+        Preloader.instance().finish()
         self.router.navigate("home")
@@ -1,7 +1,4 @@
-from PIL.ImageQt import ImageQt
 from PySide6.QtCore import QTimer
-from PySide6.QtGui import QPixmap
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import (QLabel, QVBoxLayout, QWidget, QFrame)
 
 import App.utils.Loader
@@ -27,22 +24,9 @@ class View(BasePage):
         self.add_background_image()
         self._setup_ui()
 
-        # setup web_engine!
-        self.web_engine = QWebEngineView(self)
-        self.web_engine.setHtml("<html><body>Preloading WebEngine...</body></html>")
-        self.web_engine.resize(1, 1)
-        self.web_engine.move(-100000, -100000)
-        self.web_engine.show()
-        QTimer.singleShot(2500, self.cleanup_web_engine)
-
-    def cleanup_web_engine(self):
-        self.web_engine.hide()
-        self.web_engine.deleteLater()
-
     def add_background_image(self):
-        pil_image = Ld.load_image(f"logo/1_{'dark' if App.utils.Loader.Loader.is_dark() else 'light'}.png")
-        q_image = ImageQt(pil_image)
-        pixmap = QPixmap.fromImage(q_image)
+        # Straight to a QPixmap: PIL is not needed this early
+        pixmap = Ld.load_pixmap(f"logo/1_{'dark' if App.utils.Loader.Loader.is_dark() else 'light'}.png")
         self.background.setPixmap(pixmap)
         self.background.setScaledContents(True)
         self.background.setGeometry(0, 0, self.width(), self.height())
@@ -1,19 +1,59 @@
+import hashlib
 import json
 import pickle
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 import PySide6
-from PIL import Image
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QFontDatabase, QFont
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QGuiApplication, QImage, QPixmap, QIcon, QPainter, QFontDatabase, QFont
 from PySide6.QtSvg import QSvgRenderer
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+def _approx_size(value: Any, depth: int = 0) -> int:
+    """Rough memory footprint in bytes, enough to budget the cache"""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (QPixmap, QImage)):
+        return value.width() * value.height() * max(value.depth(), 8) // 8
+    if isinstance(value, QIcon):
+        return sum(size.width() * size.height() * 4 for size in value.availableSizes()) or 1024
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if hasattr(value, 'getbands') and hasattr(value, 'size'):
+        # PIL image, decoded on first use
+        return value.size[0] * value.size[1] * len(value.getbands())
+    size = sys.getsizeof(value)
+    if depth < 8:
+        if isinstance(value, dict):
+            size += sum(_approx_size(k, depth + 1) + _approx_size(v, depth + 1) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(_approx_size(v, depth + 1) for v in value)
+    return size
+
 
 class Loader:
-    _cache = {}
-    _cache_max_size = 100
+    """
+    Assets under `assets/`, cached in memory.
+
+    The cache is a least-recently-used map bounded by the approximate bytes
+    of its values (`_cache_max_bytes`), so one large image or pickle cannot
+    push out many small, hot entries just by being newer. A value larger than
+    the whole budget is returned but not cached.
+    """
+    _cache: OrderedDict = OrderedDict()
+    # key -> approximate bytes of the cached value
+    _cache_sizes = {}
+    _cache_bytes = 0
+    _cache_max_bytes = 64 * 1024 * 1024
     _base_path = Path(__file__).parent.parent.parent / "assets"
+    # Rendered SVG icons are also written here, so later launches skip rendering; None disables it
+    icon_disk_cache: Optional[Path] = _base_path / "temp" / "icons"
 
     @classmethod
     def _get_full_path(cls, relative_path: str, folder_name: Optional[str] = None) -> Path:
@@ -23,18 +63,28 @@ class Loader:
 
     @classmethod
     def _add_to_cache(cls, key: str, value: Any) -> None:
-        if len(cls._cache) >= cls._cache_max_size:
-            cls._cache.pop(next(iter(cls._cache)))
+        cls._remove_from_cache(key)
+        size = _approx_size(value)
+        if size > cls._cache_max_bytes:
+            return
+        while cls._cache and cls._cache_bytes + size > cls._cache_max_bytes:
+            cls._remove_from_cache(next(iter(cls._cache)))
         cls._cache[key] = value
+        cls._cache_sizes[key] = size
+        cls._cache_bytes += size
 
     @classmethod
     def _get_from_cache(cls, key: str) -> Any:
-        return cls._cache.get(key)
+        if key in cls._cache:
+            cls._cache.move_to_end(key)
+            return cls._cache[key]
+        return None
 
     @classmethod
     def _remove_from_cache(cls, key: str) -> None:
         if key in cls._cache:
             cls._cache.pop(key)
+            cls._cache_bytes -= cls._cache_sizes.pop(key)
 
     @classmethod
     def load_json(cls, path: str, is_temp: bool = False) -> dict:
@@ -53,7 +103,10 @@ class Loader:
             raise ValueError(f"Failed to load JSON from {full_path}") from e
 
     @classmethod
-    def load_image(cls, path: str, is_temp: bool = False) -> Image.Image:
+    def load_image(cls, path: str, is_temp: bool = False) -> 'Image.Image':
+        # PIL is imported on first use; the window does not need it to start
+        from PIL import Image
+
         full_path = cls._get_full_path(path, "temp" if is_temp else "images")
 
         cache_key = f"image:{full_path}"
@@ -67,6 +120,20 @@ class Loader:
         except (FileNotFoundError, OSError) as e:
             raise ValueError(f"Failed to load image from {full_path}") from e
 
+    @classmethod
+    def load_pixmap(cls, path: str, is_temp: bool = False) -> QPixmap:
+        full_path = cls._get_full_path(path, "temp" if is_temp else "images")
+
+        cache_key = f"pixmap:{full_path}"
+        if (cached := cls._get_from_cache(cache_key)) is not None:
+            return cached
+
+        pixmap = QPixmap(f"{full_path}")
+        if pixmap.isNull():
+            raise ValueError(f"Failed to load pixmap from {full_path}")
+        cls._add_to_cache(cache_key, pixmap)
+        return pixmap
+
     @classmethod
     def load_pickle(cls, path: str, is_temp: bool = False) -> Any:
         full_path = cls._get_full_path(path, "temp" if is_temp else "pickles")
@@ -103,23 +170,75 @@ class Loader:
         return cls.load_bytes(path, is_temp).decode("utf-8")
 
     @classmethod
-    def load_icon(cls, path: str, is_temp: bool = False) -> PySide6.QtGui.QIcon:
-
+    def load_icon(cls, path: str, is_temp: bool = False, size: Optional[QSize] = None,
+                  device_pixel_ratio: Optional[float] = None) -> PySide6.QtGui.QIcon:
+        """
+        An icon from `images/icons`. SVGs are rendered once per (path, size,
+        device pixel ratio), `size` defaulting to the SVG's own and the ratio to
+        the application's; other formats are loaded by QIcon as they are.
+        """
         full_path = cls._get_full_path("icons/" + path, "temp" if is_temp else "images")
-        cache_key = f"icon:{full_path}"
+        if full_path.suffix.lower() != ".svg":
+            cache_key = f"icon:{full_path}"
+            if (cached := cls._get_from_cache(cache_key)) is not None:
+                return cached
+            icon = QIcon(f"{full_path}")
+            cls._add_to_cache(cache_key, icon)
+            return icon
+
+        if device_pixel_ratio is None:
+            app = QGuiApplication.instance()
+            device_pixel_ratio = app.devicePixelRatio() if app else 1.0
+        size_key = "default" if size is None else f"{size.width()}x{size.height()}"
+        cache_key = f"icon:{full_path}:{size_key}@{device_pixel_ratio}"
         if (cached := cls._get_from_cache(cache_key)) is not None:
             return cached
 
-        renderer = QSvgRenderer(f"{full_path}")
-        if renderer.isValid():
-            pixmap = QPixmap(renderer.defaultSize())
-            pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            return QIcon(pixmap)
+        pixmap = cls._render_svg(full_path, size, device_pixel_ratio)
+        icon = QIcon(pixmap) if pixmap is not None else QIcon(f"{full_path}")
+        cls._add_to_cache(cache_key, icon)
+        return icon
+
+    @classmethod
+    def _icon_disk_path(cls, full_path: Path, size_key: str, device_pixel_ratio: float) -> Tuple[Path, str]:
+        """The rendered file for this source, size and ratio, and the prefix it shares with older renders"""
+        source = hashlib.sha1(f"{full_path}:{size_key}@{device_pixel_ratio}".encode()).hexdigest()[:16]
+        prefix = f"{full_path.stem}-{source}-"
+        # Keyed by the source's mtime: an edited SVG is rendered again
+        return cls.icon_disk_cache / f"{prefix}{full_path.stat().st_mtime_ns}.png", prefix
+
+    @classmethod
+    def _render_svg(cls, full_path: Path, size: Optional[QSize], device_pixel_ratio: float) -> Optional[QPixmap]:
+        disk_path = prefix = None
+        if cls.icon_disk_cache is not None and full_path.exists():
+            size_key = "default" if size is None else f"{size.width()}x{size.height()}"
+            disk_path, prefix = cls._icon_disk_path(full_path, size_key, device_pixel_ratio)
+            pixmap = QPixmap(f"{disk_path}")
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(device_pixel_ratio)
+                return pixmap
 
-        return QIcon(f"{full_path}")
+        renderer = QSvgRenderer(f"{full_path}")
+        if not renderer.isValid():
+            return None
+        logical = size if size is not None else renderer.defaultSize()
+        pixmap = QPixmap(logical * device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        if disk_path is not None:
+            try:
+                disk_path.parent.mkdir(parents=True, exist_ok=True)
+                for stale in disk_path.parent.glob(f"{prefix}*.png"):
+                    stale.unlink()
+                pixmap.save(f"{disk_path}", "PNG")
+            except OSError:
+                # Only an optimization; a read-only install renders every launch
+                pass
+        return pixmap
 
     @classmethod
     def is_dark(cls) -> bool:
@@ -170,7 +289,7 @@ class Loader:
             raise ValueError(f"Failed to save JSON to {full_path}") from e
 
     @classmethod
-    def save_image(cls, path: str, image: Image.Image, is_temp: bool,
+    def save_image(cls, path: str, image: 'Image.Image', is_temp: bool,
                    image_format: Optional[str] = None) -> None:
         full_path = cls._get_full_path(path, "temp" if is_temp else "images")
         full_path.parent.mkdir(parents=True, exist_ok=True)
@@ -220,4 +339,6 @@ class Loader:
 
     @classmethod
     def destroy_instance(cls):
-        cls._cache = {}
+        cls._cache = OrderedDict()
+        cls._cache_sizes = {}
+        cls._cache_bytes = 0
@@ -0,0 +1,111 @@
+"""
+Startup timing and the idle-time preloader.
+
+The window is shown before anything heavy is imported: matplotlib,
+QtWebEngine and the monitor's dependencies load with the pages that use
+them. Once the first frame is up, `Preloader` imports them one step per
+idle timer tick, so they are usually warm before a page needs them without
+delaying the first paint.
+
+The command-line options are kept too, so a restart (after a theme change)
+relaunches with them and the current data source.
+"""
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer
+
+_launch_options: List[str] = []
+_launch_url: Optional[str] = None
+
+
+def set_launch_options(options: List[str], url: Optional[str] = None) -> None:
+    """Options (everything but the URL) and the URL the app was started with, to pass again on restart"""
+    global _launch_options, _launch_url
+    _launch_options = list(options)
+    _launch_url = url
+
+
+def restart_argv(url: Optional[str] = None) -> List[str]:
+    """The argv that relaunches the app with the launch options on `url` (by default the launch URL)"""
+    url = url or _launch_url
+    return [sys.argv[0]] + _launch_options + ([url] if url else [])
+
+
+class StartupTimer:
+    """Wall-clock time of each startup phase; `report()` prints them when enabled"""
+
+    def __init__(self, enabled: bool = False, started: Optional[float] = None):
+        self.enabled = enabled
+        self.started = time.perf_counter() if started is None else started
+        self.phases: List[Tuple[str, float]] = []
+        self._last = self.started
+
+    def mark(self, phase: str) -> None:
+        """Ends `phase`, which began at the previous mark (or at `started`)"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases.append((phase, seconds))
+
+    def report(self, title: str) -> None:
+        """Prints the phases recorded since the last report to stderr"""
+        if self.enabled:
+            lines = [f"{title}: {(time.perf_counter() - self.started) * 1000:.0f} ms since start"]
+            width = max((len(phase) for phase, _ in self.phases), default=0) + 2
+            lines += [f"  {phase:<{width}}{seconds * 1000:8.1f} ms" for phase, seconds in self.phases]
+            print("\n".join(lines), file=sys.stderr)
+        self.phases = []
+
+
+class Preloader(QObject):
+    """
+    Runs warm-up steps on the GUI thread, one per idle timer tick.
+
+    A zero-interval QTimer fires once the event queue is empty, so input and
+    repaints go ahead of every step. A step that cannot import is reported
+    and skipped; the page that needs it fails the same way it would have.
+    """
+    _instance: Optional['Preloader'] = None
+
+    def __init__(self, timer: Optional[StartupTimer] = None):
+        super().__init__()
+        self.timer = timer or StartupTimer()
+        self._steps: List[Tuple[str, Callable[[], None]]] = []
+        self._idle = QTimer(self)
+        self._idle.setInterval(0)
+        self._idle.timeout.connect(self._run_next)
+
+    @classmethod
+    def instance(cls) -> 'Preloader':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def add(self, name: str, step: Callable[[], None]) -> None:
+        self._steps.append((name, step))
+
+    def start(self, delay_ms: int = 0) -> None:
+        QTimer.singleShot(delay_ms, self._idle.start)
+
+    def finish(self) -> None:
+        """Runs the remaining steps right away, for a caller that needs them done"""
+        while self._steps:
+            self._run_next()
+
+    def _run_next(self) -> None:
+        if self._steps:
+            name, step = self._steps.pop(0)
+            started = time.perf_counter()
+            try:
+                step()
+            except ImportError as e:
+                name = f"{name} (unavailable: {e})"
+            self.timer.record(name, time.perf_counter() - started)
+            if not self._steps:
+                self.timer.report("Preload")
+        if not self._steps:
+            self._idle.stop()
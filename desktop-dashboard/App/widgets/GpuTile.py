@@ -0,0 +1,175 @@
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QPointF, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+from App.utils.Loader import Loader
+
+
+class Sparkline:
+    """One row of a tile: a metric's label, unit and y range (None to fit the data)"""
+
+    def __init__(self, label: str, metric: str, unit: str, y_range: Optional[Tuple[float, float]] = None):
+        self.label = label
+        self.metric = metric
+        self.unit = unit
+        self.y_range = y_range
+
+
+class GpuTile(QWidget):
+    """
+    A compact card for one GPU: name and health, then a QPainter sparkline
+    with the latest value for each of a few metrics.
+
+    Updates only repaint what changed: `set_info()` the header,
+    `set_series()` the row of that metric, and only if its data differs from
+    what is on screen. Each row's data is expected already reduced to about
+    two points per pixel column of `sparkline_width()`.
+    """
+    clicked = Signal(int)
+
+    PADDING = 8
+    HEADER_HEIGHT = 22
+    ROW_HEIGHT = 28
+    LABEL_WIDTH = 48
+    VALUE_WIDTH = 70
+
+    def __init__(self, index: int, sparklines: Sequence[Sparkline], parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.sparklines = list(sparklines)
+        self._info: Mapping[str, str] = {}
+        # metric -> (timestamps, values, latest value) on screen
+        self._series: Dict[str, Tuple[np.ndarray, np.ndarray, Optional[float]]] = {}
+
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        if Loader().is_dark():
+            self._background = QColor('#1f1f1f')
+            self._text = QColor('white')
+            self._muted = QColor('#9e9e9e')
+            self._line = QColor('#00FFFF')
+        else:
+            self._background = QColor('white')
+            self._text = QColor('black')
+            self._muted = QColor('#616161')
+            self._line = QColor('#007acc')
+
+    def sizeHint(self) -> QSize:
+        return QSize(320, self._height())
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(240, self._height())
+
+    def _height(self) -> int:
+        return 2 * self.PADDING + self.HEADER_HEIGHT + self.ROW_HEIGHT * len(self.sparklines)
+
+    def _header_rect(self) -> QRectF:
+        return QRectF(self.PADDING, self.PADDING, self.width() - 2 * self.PADDING, self.HEADER_HEIGHT)
+
+    def _row_rect(self, row: int) -> QRectF:
+        top = self.PADDING + self.HEADER_HEIGHT + row * self.ROW_HEIGHT
+        return QRectF(self.PADDING, top, self.width() - 2 * self.PADDING, self.ROW_HEIGHT)
+
+    def _sparkline_rect(self, row: int) -> QRectF:
+        rect = self._row_rect(row)
+        return rect.adjusted(self.LABEL_WIDTH, 4, -self.VALUE_WIDTH, -4)
+
+    def sparkline_width(self) -> int:
+        return max(int(self._sparkline_rect(0).width()), 1)
+
+    def set_info(self, info: Mapping[str, str]) -> None:
+        if dict(info) != dict(self._info):
+            self._info = info
+            # The health colour is the border, so the whole tile changes
+            self.update()
+
+    def set_series(self, metric: str, timestamps: np.ndarray, values: np.ndarray, latest: Optional[float]) -> None:
+        shown = self._series.get(metric)
+        if (shown is not None and shown[2] == latest and np.array_equal(shown[1], values)
+                and len(shown[0]) == len(timestamps)):
+            return
+        self._series[metric] = (timestamps, values, latest)
+        for row, sparkline in enumerate(self.sparklines):
+            if sparkline.metric == metric:
+                self.update(self._row_rect(row).toAlignedRect())
+
+    def _health_color(self) -> QColor:
+        health = self._info.get('health', 'unknown').lower()
+        if health == 'healthy':
+            return QColor('#2ec27e')
+        if health == 'warning':
+            return QColor('#f6c700')
+        return QColor('#e01b24')
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        try:
+            dirty = QRectF(event.rect())
+            painter.fillRect(dirty, self._background)
+            painter.setPen(QPen(self._health_color(), 2))
+            painter.drawRect(QRectF(self.rect()).adjusted(1, 1, -1, -1))
+
+            if dirty.intersects(self._header_rect()):
+                self._paint_header(painter)
+            for row, sparkline in enumerate(self.sparklines):
+                if dirty.intersects(self._row_rect(row)):
+                    self._paint_row(painter, row, sparkline)
+        finally:
+            painter.end()
+
+    def _paint_header(self, painter: QPainter):
+        rect = self._header_rect()
+        font = QFont(self.font())
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(self._text)
+        name = self._info.get('name', '') or 'Unknown'
+        painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"GPU {self.index}: {name}")
+        painter.setFont(self.font())
+        painter.setPen(self._health_color())
+        painter.drawText(rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                         self._info.get('health', 'unknown'))
+
+    def _paint_row(self, painter: QPainter, row: int, sparkline: Sparkline):
+        rect = self._row_rect(row)
+        painter.setFont(self.font())
+        painter.setPen(self._muted)
+        painter.drawText(QRectF(rect.left(), rect.top(), self.LABEL_WIDTH, rect.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, sparkline.label)
+
+        timestamps, values, latest = self._series.get(sparkline.metric, (np.empty(0), np.empty(0), None))
+        painter.setPen(self._text)
+        text = "–" if latest is None else f"{latest:.0f} {sparkline.unit}"
+        painter.drawText(QRectF(rect.right() - self.VALUE_WIDTH, rect.top(), self.VALUE_WIDTH, rect.height()),
+                         Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
+
+        if len(timestamps) < 2:
+            return
+        area = self._sparkline_rect(row)
+        if sparkline.y_range is not None:
+            y0, y1 = sparkline.y_range
+        else:
+            y0, y1 = float(np.nanmin(values)), float(np.nanmax(values))
+        if y1 <= y0:
+            y0, y1 = y0 - 1, y1 + 1
+        t0, t1 = float(timestamps[0]), float(timestamps[-1])
+        if t1 <= t0:
+            return
+        xs = area.left() + (timestamps - t0) / (t1 - t0) * area.width()
+        ys = area.bottom() - (np.clip(values, y0, y1) - y0) / (y1 - y0) * area.height()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # 1 px lines: wider pens are many times slower to rasterize
+        painter.setPen(QPen(self._line, 1))
+        painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.rect().contains(event.position().toPoint()):
+            self.clicked.emit(self.index)
+        super().mouseReleaseEvent(event)
@@ -1,4 +1,6 @@
-import base64
+import hashlib
+import json
+from collections import OrderedDict
 
 import markdown2
 from PySide6.QtCore import QUrl
@@ -9,179 +11,227 @@ from App.utils.Loader import Loader
 
 
 class MarkdownLabel(QWebEngineView):
-    _HIGHLIGHT_SCRIPTS_CACHE = None
-    _FONT_BASE64 = None
+    """
+    Markdown rendered in a web view, with code highlighting and MathJax.
+
+    Every label loads the same page shell once: highlight.js, MathJax and the
+    font come from local files relative to `assets/bytes`, and both themes are
+    CSS variable sets. Changing the markdown or the theme afterwards runs a
+    small script in the loaded page instead of reloading it. Rendered HTML is
+    cached per markdown text, shared by all labels.
+    """
+    _SHELL_CACHE = None
+    _RENDER_CACHE: OrderedDict = OrderedDict()
+    _RENDER_CACHE_SIZE = 32
+    _LANGUAGES = ["python", "javascript", "java", "cpp", "xml",
+                  "css", "sql", "bash", "json", "markdown"]
 
     def __init__(self, text_or_path, is_path, parent=None):
         super().__init__(parent)
         self._loader = Loader()
         self.current_markdown = None
         self._is_dark = self._loader.is_dark()
-        self.mathjax_base_path = self._get_mathjax_base_path()
-        self.mathjax_src_path = self._get_mathjax_src_path()
+        # Scripts waiting for the shell to finish loading
+        self._pending = {}
+        self._shell_ready = False
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.setMinimumHeight(50)
 
-        initial_text = self._loader.load_text("md/" + text_or_path) if is_path else text_or_path
-        self.set_html_from_markdown(initial_text)
+        self.loadFinished.connect(self._on_shell_loaded)
+        self.setHtml(self._get_shell(), baseUrl=self._get_assets_url())
+
+        if is_path:
+            self.set_markdown_file(text_or_path)
+        else:
+            self.set_markdown(text_or_path)
 
     def set_theme(self, is_dark):
         self._is_dark = is_dark
-        self.set_html_from_markdown(self.current_markdown)
+        self._run("theme", f"setTheme({json.dumps(is_dark)});")
 
     def set_markdown(self, text):
-        self.current_markdown = text
         self.set_html_from_markdown(text)
 
+    def set_markdown_file(self, path):
+        self.set_markdown(self._loader.load_text("md/" + path))
+
     def set_html_from_markdown(self, markdown_text):
         self.current_markdown = markdown_text or ""
-        full_html = self._generate_html(self.current_markdown)
-        self.setHtml(full_html, baseUrl=QUrl(self.mathjax_base_path))
+        self._run("content", f"setContent({json.dumps(self._render(self.current_markdown))});")
 
     # region Helper Methods
-    def _get_mathjax_base_path(self):
-        path = self._loader.get_path() / "assets" / "bytes" / "mathjax_offline"
-        return f"file:///{path}"
+    def _run(self, kind, script):
+        """Runs `script` in the shell now, or once it has loaded; a newer script of the same kind replaces it"""
+        if self._shell_ready:
+            self.page().runJavaScript(script)
+        else:
+            self._pending[kind] = script
 
-    def _get_mathjax_src_path(self):
-        path = self._loader.get_path() / "assets" / "bytes" / "mathjax_offline" / "es5"
-        return f"file:///{path}/tex-mml-chtml.js"
+    def _on_shell_loaded(self, ok):
+        if not ok:
+            return
+        self._shell_ready = True
+        self._run("theme", f"setTheme({json.dumps(self._is_dark)});")
+        for kind, script in self._pending.items():
+            if kind != "theme":
+                self.page().runJavaScript(script)
+        self._pending = {}
 
     @classmethod
-    def _load_highlight_scripts(cls):
-        if cls._HIGHLIGHT_SCRIPTS_CACHE is None:
-            loader = Loader()
-            try:
-                hljs_script = loader.load_text("highlight/highlight.min.js")
-                languages = ["python", "javascript", "java", "cpp", "xml",
-                             "css", "sql", "bash", "json", "markdown"]
-                lang_scripts = "\n".join(
-                    loader.load_text(f"highlight/languages/{lang}.min.js")
-                    for lang in languages
-                )
-                cls._HIGHLIGHT_SCRIPTS_CACHE = (hljs_script, lang_scripts)
-            except Exception as e:
-                raise Exception(f"Error loading Highlight.js resources: {e}")
-        return cls._HIGHLIGHT_SCRIPTS_CACHE
-
-    def _get_highlight_css(self):
-        theme = "github-dark" if self._is_dark else "github"
-        try:
-            return self._loader.load_text(f"highlight/styles/{theme}.min.css")
-        except Exception as e:
-            raise Exception(f"Error loading Highlight.js theme: {e}")
-
-    @classmethod
-    def _get_font_base64(cls):
-        if cls._FONT_BASE64 is None:
-            loader = Loader()
-            font_bytes = loader.load_bytes("fonts/comic-neue-regular.woff2")
-            cls._FONT_BASE64 = base64.b64encode(font_bytes).decode("utf-8")
-        return cls._FONT_BASE64
-
-    def _get_theme_colors(self):
-        return {
-            "bg_color": "#31363B" if self._is_dark else "#E6E6E6",
-            "text_color": "#E6E6E6" if self._is_dark else "#31363B",
-            "code_bg": "#232629" if self._is_dark else "#F0F0F0",
-            "border_color": "#7F8C8D" if self._is_dark else "#BDC3C7",
-            "link_color": "#1E90FF" if self._is_dark else "#0066CC",
-            "table_header_bg": "#2A2E32" if self._is_dark else "#DFE2E5",
-            "scrollbar_track": "#1a3d5a" if self._is_dark else "#ffd1dc",
-            "scrollbar_thumb": "#2a5a7a" if self._is_dark else "#ffa8ba",
-            "scrollbar_hover": "#3a7a9a" if self._is_dark else "#ff8da3"
-        }
-
-    def _generate_html(self, markdown_text):
-        colors = self._get_theme_colors()
-        hljs_script, lang_scripts = self._load_highlight_scripts()
-        hljs_css = self._get_highlight_css()
-        font_base64 = self._get_font_base64()
+    def _render(cls, markdown_text):
+        # The HTML does not depend on the theme, which the shell applies with CSS variables
+        key = hashlib.sha1(markdown_text.encode("utf-8")).hexdigest()
+        if key in cls._RENDER_CACHE:
+            cls._RENDER_CACHE.move_to_end(key)
+            return cls._RENDER_CACHE[key]
         html_body = markdown2.markdown(
             markdown_text,
             extras=["fenced-code-blocks", "tables", "task_list", "footnotes", "toc"]
         )
+        cls._RENDER_CACHE[key] = html_body
+        if len(cls._RENDER_CACHE) > cls._RENDER_CACHE_SIZE:
+            cls._RENDER_CACHE.popitem(last=False)
+        return html_body
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            {self._generate_mathjax_script()}
-            <style>{hljs_css}</style>
-            <script>
-                {hljs_script}
+    @staticmethod
+    def _get_assets_url():
+        # The trailing slash makes the shell's relative URLs resolve inside assets/bytes
+        return QUrl.fromLocalFile(f"{Loader().get_path() / 'assets' / 'bytes'}/")
+
+    @staticmethod
+    def _get_theme_colors(is_dark):
+        return {
+            "bg_color": "#31363B" if is_dark else "#E6E6E6",
+            "text_color": "#E6E6E6" if is_dark else "#31363B",
+            "code_bg": "#232629" if is_dark else "#F0F0F0",
+            "border_color": "#7F8C8D" if is_dark else "#BDC3C7",
+            "link_color": "#1E90FF" if is_dark else "#0066CC",
+            "table_header_bg": "#2A2E32" if is_dark else "#DFE2E5",
+            "scrollbar_track": "#1a3d5a" if is_dark else "#ffd1dc",
+            "scrollbar_thumb": "#2a5a7a" if is_dark else "#ffa8ba",
+            "scrollbar_hover": "#3a7a9a" if is_dark else "#ff8da3"
+        }
+
+    @classmethod
+    def _get_shell(cls):
+        if cls._SHELL_CACHE is None:
+            lang_scripts = "\n".join(
+                f'<script src="highlight/languages/{lang}.min.js"></script>' for lang in cls._LANGUAGES
+            )
+            cls._SHELL_CACHE = f"""
+            <!DOCTYPE html>
+            <html data-theme="dark">
+            <head>
+                <meta charset="UTF-8">
+                {cls._generate_mathjax_script()}
+                <link id="hljs-theme" rel="stylesheet" href="highlight/styles/github-dark.min.css">
+                <script src="highlight/highlight.min.js"></script>
                 {lang_scripts}
-                hljs.highlightAll();
-            </script>
-            <style>
-                {self._generate_css_styles(colors, font_base64)}
-            </style>
-        </head>
-        <body>
-            {html_body}
-        </body>
-        </html>
-        """
+                <style>
+                    {cls._generate_css_styles()}
+                </style>
+                <script>
+                    {cls._generate_page_script()}
+                </script>
+            </head>
+            <body>
+                <div id="content"></div>
+            </body>
+            </html>
+            """
+        return cls._SHELL_CACHE
 
-    def _generate_mathjax_script(self):
-        return f"""
+    @staticmethod
+    def _generate_mathjax_script():
+        return """
         <script>
-        MathJax = {{
-            tex: {{
-                inlineMath: [['$', '$'], ['\\(', '\\)']],
-                displayMath: [['$$', '$$'], ['\\[', '\\]']],
+        MathJax = {
+            tex: {
+                inlineMath: [['$', '$'], ['\\\\(', '\\\\)']],
+                displayMath: [['$$', '$$'], ['\\\\[', '\\\\]']],
                 processEscapes: true,
-                packages: {{'[+]': ['mhchem']}}
-            }},
-            options: {{
+                packages: {'[+]': ['mhchem']}
+            },
+            options: {
                 ignoreHtmlClass: 'tex2jax_ignore',
                 processHtmlClass: 'tex2jax_process'
-            }},
-            loader: {{load: ['[tex]/mhchem']}}
-        }};
+            },
+            loader: {load: ['[tex]/mhchem']}
+        };
         </script>
-        <script id="MathJax-script" async src="{self.mathjax_src_path}"></script>
+        <script id="MathJax-script" async src="mathjax_offline/es5/tex-mml-chtml.js"></script>
         """
 
     @staticmethod
-    def _generate_css_styles(colors, font_base64):
+    def _generate_page_script():
+        return """
+        function setContent(html) {
+            var root = document.getElementById('content');
+            if (window.MathJax && MathJax.typesetClear) {
+                MathJax.typesetClear([root]);
+            }
+            root.innerHTML = html;
+            root.querySelectorAll('pre code').forEach(function (block) {
+                hljs.highlightElement(block);
+            });
+            if (window.MathJax && MathJax.startup && MathJax.startup.promise) {
+                MathJax.startup.promise.then(function () { return MathJax.typesetPromise([root]); });
+            }
+            window.scrollTo(0, 0);
+        }
+
+        function setTheme(dark) {
+            document.documentElement.setAttribute('data-theme', dark ? 'dark' : 'light');
+            document.getElementById('hljs-theme').href =
+                'highlight/styles/' + (dark ? 'github-dark' : 'github') + '.min.css';
+        }
+        """
+
+    @classmethod
+    def _generate_css_styles(cls):
+        def variables(is_dark):
+            colors = cls._get_theme_colors(is_dark)
+            colors["quote_color"] = colors["text_color"] + "99"
+            return " ".join(f"--{name}: {value};" for name, value in colors.items())
+
         return f"""
+        :root[data-theme="dark"] {{ {variables(True)} }}
+        :root[data-theme="light"] {{ {variables(False)} }}
         @font-face {{
             font-family: 'Comic Neue';
             font-style: normal;
             font-weight: 400;
             font-display: swap;
-            src: url(data:font/woff2;base64,{font_base64}) format("woff2");
+            src: url("fonts/comic-neue-regular.woff2") format("woff2");
             unicode-range: U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, U+0308, U+0329, U+2000-206F, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD;
         }}
         body {{
             font-family: 'Comic Neue', 'Comic Sans MS', 'Marker Felt', 'Arial Rounded MT Bold', 'Arial', sans-serif;
             line-height: 1.6;
-            color: {colors['text_color']};
-            background-color: {colors['bg_color']};
+            color: var(--text_color);
+            background-color: var(--bg_color);
             padding: 12px;
             margin: 0;
         }}
         a {{
-            color: {colors['link_color']};
+            color: var(--link_color);
             text-decoration: none;
         }}
         a:hover {{ text-decoration: underline; }}
         pre {{
-            background-color: {colors['code_bg']};
+            background-color: var(--code_bg);
             border-radius: 4px;
             padding: 12px;
             overflow: auto;
-            border-left: 3px solid {colors['border_color']};
+            border-left: 3px solid var(--border_color);
         }}
         code:not(pre code) {{
-            background-color: {colors['code_bg']};
+            background-color: var(--code_bg);
             border-radius: 4px;
             padding: 0.3em 0.5em;
             font-family: SFMono-Regular, Consolas, "Liberation Mono", Menlo, monospace, 'Comic Neue';
-            color: {colors['text_color']};
+            color: var(--text_color);
         }}
         table {{
             border-collapse: collapse;
@@ -189,39 +239,39 @@ class MarkdownLabel(QWebEngineView):
             margin: 1em 0;
         }}
         th, td {{
-            border: 1px solid {colors['border_color']};
+            border: 1px solid var(--border_color);
             padding: 8px 12px;
         }}
-        th {{ background-color: {colors['table_header_bg']}; }}
+        th {{ background-color: var(--table_header_bg); }}
         blockquote {{
-            border-left: 4px solid {colors['border_color']};
+            border-left: 4px solid var(--border_color);
             padding-left: 16px;
             margin-left: 0;
-            color: {colors['text_color']}99;
+            color: var(--quote_color);
         }}
         hr {{
             border: 0;
             height: 1px;
-            background-color: {colors['border_color']};
+            background-color: var(--border_color);
             margin: 20px 0;
         }}
         .MathJax {{
-            color: {colors['text_color']} !important;
+            color: var(--text_color) !important;
             background-color: transparent !important;
         }}
-        .hljs {{ background: {colors['code_bg']} !important; }}
+        .hljs {{ background: var(--code_bg) !important; }}
 
         /* Scrollbar Styling */
         ::-webkit-scrollbar {{ width: 12px; height: 12px; }}
         ::-webkit-scrollbar-track {{
-            background: {colors['scrollbar_track']};
+            background: var(--scrollbar_track);
             border-radius: 6px;
         }}
         ::-webkit-scrollbar-thumb {{
-            background: {colors['scrollbar_thumb']};
+            background: var(--scrollbar_thumb);
             border-radius: 6px;
-            border: 2px solid {colors['scrollbar_track']};
+            border: 2px solid var(--scrollbar_track);
         }}
-        ::-webkit-scrollbar-thumb:hover {{ background: {colors['scrollbar_hover']}; }}
-        ::-webkit-scrollbar-corner {{ background: {colors['scrollbar_track']}; }}
+        ::-webkit-scrollbar-thumb:hover {{ background: var(--scrollbar_hover); }}
+        ::-webkit-scrollbar-corner {{ background: var(--scrollbar_track); }}
         """
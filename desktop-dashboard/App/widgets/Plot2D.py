@@ -1,17 +1,24 @@
 import random
 
 import numpy as np
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QFileDialog
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QPushButton,
                                QSizePolicy, QHBoxLayout, QSpacerItem)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
 
 from App.utils.Loader import Loader
 
 
 class Plot2D(QWidget):
+    # (x_min, x_max, width in pixels) after every pan or zoom by the user
+    view_changed = Signal(float, float, int)
+
+    # Room left past the data when the view has to grow, so streaming data does not need a full redraw per update
+    STREAM_HEADROOM = 0.2
+
     def __init__(self, title, x_label, y_label, have_grid=True, parent=None, editable=False):
         super().__init__(parent)
 
@@ -63,6 +70,11 @@ class Plot2D(QWidget):
         self.setLayout(main_layout)
         self.current_color_index = 0
         self.plotted_items = []
+        # Streaming series: key -> persistent Line2D, redrawn by blitting over a cached background
+        self._series = {}
+        self._background = None
+        self._update_pending = False
+        self._user_view = False
         self._drag_start = None
         self._drag_origin = None
         self._zoom_factor = 1.1
@@ -74,6 +86,7 @@ class Plot2D(QWidget):
         self.canvas.mpl_connect('button_release_event', self._on_release)
         self.canvas.mpl_connect('motion_notify_event', self._on_motion)
         self.canvas.mpl_connect('scroll_event', self._on_scroll)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.setMinimumSize(400, 400)
 
         self.set_title(title)
@@ -222,9 +235,11 @@ class Plot2D(QWidget):
         new_xlim = (xlim[0] - dx * x_range, xlim[1] - dx * x_range)
         new_ylim = (ylim[0] - dy * y_range, ylim[1] - dy * y_range)
 
+        self._user_view = True
         self.axes.set_xlim(new_xlim)
         self.axes.set_ylim(new_ylim)
         self.canvas.draw_idle()
+        self._emit_view_changed()
 
     def _on_release(self, event):
         if hasattr(self, '_dragged_point'):
@@ -258,9 +273,15 @@ class Plot2D(QWidget):
             ydata + (ylim[1] - ydata) * scale_factor
         ]
 
+        self._user_view = True
         self.axes.set_xlim(new_xlim)
         self.axes.set_ylim(new_ylim)
         self.canvas.draw()
+        self._emit_view_changed()
+
+    def _emit_view_changed(self):
+        x_min, x_max = self.axes.get_xlim()
+        self.view_changed.emit(float(x_min), float(x_max), self.plot_width())
 
     def _on_key_press(self, event):
         pass
@@ -313,7 +334,80 @@ class Plot2D(QWidget):
         self._update_legend()
         self.canvas.draw()
 
+    def set_series(self, key, x, y, label=None, color=None, linewidth=1.5, markersize=1):
+        """
+        Creates or updates a streaming series. The series keeps one Line2D
+        whose data is replaced in place; updates made in the same event loop
+        iteration are drawn together, by blitting when the data still fits the
+        view and with a full `draw_idle` when the view has to grow.
+        """
+        line = self._series.get(key)
+        if line is None:
+            if color is None:
+                color = self.color_cycle[self.current_color_index % len(self.color_cycle)]
+                self.current_color_index += 1
+            # Animated artists are left out of full draws, so the cached background never contains them
+            line, = self.axes.plot(x, y, color=color, linewidth=linewidth, marker='o',
+                                   markersize=markersize, label=label, animated=True)
+            self._series[key] = line
+            self._update_legend()
+            self._background = None
+        else:
+            line.set_data(x, y)
+
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_series)
+
+    def remove_series(self, key):
+        line = self._series.pop(key, None)
+        if line is not None:
+            line.remove()
+            self._update_legend()
+            self._background = None
+            self.canvas.draw_idle()
+
+    def _flush_series(self):
+        self._update_pending = False
+        if self._fit_view() or self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_series()
+        self.canvas.blit(self.figure.bbox)
+
+    def _draw_series(self):
+        for line in self._series.values():
+            self.axes.draw_artist(line)
+
+    def _on_draw(self, event):
+        # After every full draw: cache it as the background, then put the series on top
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_series()
+
+    def _fit_view(self):
+        """Grows the view (with headroom) when the streaming data left it; returns whether it changed"""
+        if self._user_view:
+            return False
+        xs = [line.get_xdata() for line in self._series.values() if len(line.get_xdata())]
+        ys = [line.get_ydata() for line in self._series.values() if len(line.get_ydata())]
+        if not xs:
+            return False
+        x_min, x_max = min(np.nanmin(x) for x in xs), max(np.nanmax(x) for x in xs)
+        y_min, y_max = min(np.nanmin(y) for y in ys), max(np.nanmax(y) for y in ys)
+        (x0, x1), (y0, y1) = self.axes.get_xlim(), self.axes.get_ylim()
+        if x0 <= x_min and x_max <= x1 and y0 <= y_min and y_max <= y1:
+            return False
+
+        x_span = (x_max - x_min) or 1.0
+        y_pad = (y_max - y_min) * self.STREAM_HEADROOM / 2 or 1.0
+        self.axes.set_xlim(x_min, x_max + x_span * self.STREAM_HEADROOM)
+        self.axes.set_ylim(y_min - y_pad, y_max + y_pad)
+        return True
+
     def reset_view(self):
+        self._user_view = False
+        self.axes.relim()
         self.axes.autoscale()
         self.canvas.draw()
 
@@ -327,20 +421,36 @@ class Plot2D(QWidget):
             options=options
         )
         if file_name:
-            self.figure.savefig(file_name, dpi=300, bbox_inches='tight')
+            # Animated series are skipped by savefig unless switched back to ordinary artists
+            for line in self._series.values():
+                line.set_animated(False)
+            try:
+                self.figure.savefig(file_name, dpi=300, bbox_inches='tight')
+            finally:
+                for line in self._series.values():
+                    line.set_animated(True)
 
     def set_title(self, title):
         self.axes.set_title(title)
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def set_labels(self, x_label, y_label):
         self.axes.set_xlabel(x_label)
         self.axes.set_ylabel(y_label)
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def set_grid(self, visible=True):
         self.axes.grid(visible)
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def set_x_formatter(self, formatter):
+        """`formatter(value) -> str` for the x tick labels"""
+        self.axes.xaxis.set_major_formatter(FuncFormatter(lambda value, _: formatter(value)))
+        self.canvas.draw_idle()
+
+    def plot_width(self):
+        """Width of the data area in device pixels"""
+        return int(self.axes.bbox.width)
 
     def _update_legend(self):
         handles, labels = self.axes.get_legend_handles_labels()
@@ -360,6 +470,10 @@ class Plot2D(QWidget):
         for item in self.plotted_items:
             item.remove()
         self.plotted_items = []
+        for line in self._series.values():
+            line.remove()
+        self._series = {}
+        self._background = None
         self.current_color_index = 0
         if hasattr(self.axes, 'legend_'):
             try:
@@ -0,0 +1,38 @@
+"""
+Picks the Plot2D implementation once, at startup.
+
+"matplotlib" is the original `Plot2D`; "qt" is `QtPlot2D`, which draws with
+QPainter and never imports matplotlib. Both have the same public API, so
+pages create their plots with `new_plot()` and do not care which is active.
+"""
+import os
+import warnings
+
+BACKENDS = ("matplotlib", "qt")
+DEFAULT_BACKEND = "matplotlib"
+backend = os.environ.get("GPU_MONITOR_PLOT", DEFAULT_BACKEND)
+if backend not in BACKENDS:
+    # A stale environment should not keep the app from starting; --plot stays strict
+    warnings.warn(f"Ignoring GPU_MONITOR_PLOT={backend!r} (expected one of {', '.join(BACKENDS)}); "
+                  f"using {DEFAULT_BACKEND}")
+    backend = DEFAULT_BACKEND
+
+
+def set_backend(name: str) -> None:
+    global backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown plot backend: {name} (expected one of {', '.join(BACKENDS)})")
+    backend = name
+
+
+def plot_class():
+    # Imported on first use, so the unused backend (and its dependencies) never loads
+    if backend == "qt":
+        from App.widgets.QtPlot2D import QtPlot2D
+        return QtPlot2D
+    from App.widgets.Plot2D import Plot2D
+    return Plot2D
+
+
+def new_plot(*args, **kwargs):
+    return plot_class()(*args, **kwargs)
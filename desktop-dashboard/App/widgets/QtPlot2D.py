@@ -0,0 +1,594 @@
+import math
+import random
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtCore import QMarginsF, QPointF, QRectF, QSizeF, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPageSize, QPainter, QPdfWriter, QPen, QPolygonF
+from PySide6.QtWidgets import QFileDialog, QHBoxLayout, QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout, QWidget
+
+from App.utils.Loader import Loader
+
+
+def _nice_ticks(lo, hi, count):
+    """Tick positions on multiples of 1, 2, 2.5 or 5 times a power of ten, about `count` of them"""
+    span = hi - lo
+    if not (math.isfinite(span) and span > 0):
+        return np.empty(0), 0
+    raw = span / max(count, 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(lo / step) * step
+    ticks = first + step * np.arange(int((hi - first) / step) + 1)
+    return ticks, max(0, -math.floor(math.log10(step)) + (1 if step / magnitude == 2.5 else 0))
+
+
+def _decimate(x, y, x0, x1, width):
+    """The points of sorted `x` in view, at most a min/max pair per pixel column, plus one neighbour each side"""
+    lo = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x1, side="right")) + 1, len(x))
+    x, y = x[lo:hi], y[lo:hi]
+    if len(x) <= 2 * width or width <= 0:
+        return x, y
+    columns = np.clip(((x - x0) / (x1 - x0) * width).astype(np.int64), -1, width)
+    starts = np.flatnonzero(np.diff(columns, prepend=columns[0] - 1))
+    low = np.fmin.reduceat(y, starts)
+    high = np.fmax.reduceat(y, starts)
+    ends = np.append(starts[1:], len(x)) - 1
+    # Each column's pair at its own first and last x keeps the line continuous between columns
+    return np.column_stack((x[starts], x[ends])).ravel(), np.column_stack((low, high)).ravel()
+
+
+class _Item:
+    """One plotted line and/or set of markers"""
+
+    def __init__(self, x, y, color, linewidth=1.5, line=True, markersize=0.0, alpha=1.0, label=None):
+        self.color = QColor(color)
+        self.color.setAlphaF(alpha)
+        self.linewidth = linewidth
+        self.line = line
+        self.markersize = markersize
+        self.label = label
+        self.set_data(x, y)
+
+    def set_data(self, x, y):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.sorted = len(self.x) < 2 or bool(np.all(np.diff(self.x) >= 0))
+
+    def visible(self, x0, x1, width):
+        if self.sorted:
+            return _decimate(self.x, self.y, x0, x1, width)
+        return self.x, self.y
+
+
+class _Canvas(QWidget):
+    """The painting surface; mouse handling is forwarded to the plot"""
+
+    def __init__(self, plot):
+        super().__init__(plot)
+        self.plot = plot
+        self.setMouseTracking(False)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        try:
+            self.plot._paint(painter, QRectF(self.rect()))
+        finally:
+            painter.end()
+
+    def mousePressEvent(self, event):
+        self.plot._on_press(event)
+
+    def mouseMoveEvent(self, event):
+        self.plot._on_motion(event)
+
+    def mouseReleaseEvent(self, event):
+        self.plot._on_release(event)
+
+    def wheelEvent(self, event):
+        self.plot._on_scroll(event)
+
+
+class QtPlot2D(QWidget):
+    """
+    Plot2D drawn with QPainter instead of matplotlib, with the same public API.
+
+    Only what is in view is drawn: sorted data is clipped to the view by binary
+    search and reduced to a min/max pair per pixel column before it becomes a
+    polygon, so a repaint costs about the same at 1k points as at 1M. Updates
+    schedule an ordinary widget repaint, which Qt coalesces per event loop
+    iteration.
+    """
+    # (x_min, x_max, width in pixels) after every pan or zoom by the user
+    view_changed = Signal(float, float, int)
+
+    # Same margin around autoscaled data as matplotlib's default
+    MARGIN = 0.05
+    STREAM_HEADROOM = 0.2
+
+    def __init__(self, title, x_label, y_label, have_grid=True, parent=None, editable=False):
+        super().__init__(parent)
+
+        self.editable = editable
+        self._edit_mode = False
+        self.editable_points = []
+        self._dragged_point = None
+        self._drag_offset = (0, 0)
+        self.is_dark_theme = Loader().is_dark()
+        if self.is_dark_theme:
+            self._apply_dark_theme()
+        else:
+            self._apply_light_theme()
+
+        self.canvas = _Canvas(self)
+        self.canvas.setMinimumSize(400, 400)
+        self.canvas.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(self.canvas)
+        button_layout = QHBoxLayout()
+        button_layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
+        self.reset_button = QPushButton("Reset Plot View")
+        self.reset_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.reset_button.clicked.connect(self.reset_view)
+        button_layout.addWidget(self.reset_button)
+        button_layout.addSpacing(10)
+        self.save_button = QPushButton("Save Plot")
+        self.save_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.save_button.clicked.connect(self._save_plot_dialog)
+        button_layout.addWidget(self.save_button)
+        if self.editable:
+            button_layout.addSpacing(10)
+            self.edit_button = QPushButton("Change Points")
+            self.edit_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+            self.edit_button.setCheckable(True)
+            self.edit_button.clicked.connect(self._toggle_edit_mode)
+            button_layout.addWidget(self.edit_button)
+            self.clear_points_button = QPushButton("Clear Points")
+            self.clear_points_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+            self.clear_points_button.clicked.connect(self._clear_user_points)
+            self.clear_points_button.setVisible(False)
+            button_layout.addWidget(self.clear_points_button)
+        button_layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
+        main_layout.addLayout(button_layout)
+        self.setLayout(main_layout)
+
+        self.current_color_index = 0
+        self.plotted_items = []
+        self._series = {}
+        self._title = ""
+        self._x_label = ""
+        self._y_label = ""
+        self._grid = have_grid
+        self._x_formatter = None
+        self._xlim = (0.0, 1.0)
+        self._ylim = (0.0, 1.0)
+        self._user_view = False
+        self._plot_rect = QRectF()
+        self._drag_start = None
+        self._drag_origin = None
+        self._zoom_factor = 1.1
+
+        self.set_title(title)
+        self.set_labels(x_label, y_label)
+        self.set_grid(have_grid)
+
+    def _apply_dark_theme(self):
+        self.color_cycle = [
+            '#00FFFF', '#FF00FF', '#FFFF00', '#00FF00', '#FF4500',
+            '#1E90FF', '#FF1493', '#7CFC00', '#FF8C00', '#BA55D3'
+        ]
+        self._face = QColor('#31363B')
+        self._axes_face = QColor('#1f1f1f')
+        self._text = QColor('white')
+        self._spine = QColor('#4F5B62')
+        self._grid_color = QColor(128, 128, 128, int(0.2 * 255))
+
+    def _apply_light_theme(self):
+        self.color_cycle = [
+            '#007acc', '#ff6f61', '#2ec27e', '#f6c700', '#c061cb',
+            '#ff4b00', '#20a4f3', '#e71d36', '#6a4c93', '#00bfae',
+        ]
+        self._face = QColor('#E6E6E6')
+        self._axes_face = QColor('white')
+        self._text = QColor('red')
+        self._spine = QColor('black')
+        self._grid_color = QColor(128, 128, 128, int(0.3 * 255))
+
+    # Data
+
+    def _next_color(self, color):
+        if color is None:
+            color = random.choice(self.color_cycle)
+            self.current_color_index += 1
+        return color
+
+    def plot_function(self, func, x_range=(-10, 10), num_points=500, label=None, color=None, linewidth=1.5):
+        x = np.linspace(x_range[0], x_range[1], num_points)
+        self.plotted_items.append(_Item(x, func(x), self._next_color(color), linewidth, label=label))
+        self._autoscale()
+        self.canvas.update()
+
+    def plot_points(self, x, y, label=None, color=None, marker='o', linestyle='-', linewidth=1.5, editable=False,
+                    markersize=1):
+        color = self._next_color(color)
+        if linestyle != 'None' and len(x) > 1:
+            self.plotted_items.append(_Item(x, y, color, linewidth, alpha=0.5))
+        self.plotted_items.append(_Item(x, y, color, line=False, markersize=markersize if marker else 0,
+                                        label=label))
+
+        if editable and self.editable:
+            for xi, yi in zip(x, y):
+                self._add_editable_point(xi, yi, original=True)
+
+        self._autoscale()
+        self.canvas.update()
+
+    def set_series(self, key, x, y, label=None, color=None, linewidth=1.5, markersize=1):
+        """Creates or updates a streaming series in place; repaints are coalesced by Qt"""
+        item = self._series.get(key)
+        if item is None:
+            if color is None:
+                color = self.color_cycle[self.current_color_index % len(self.color_cycle)]
+                self.current_color_index += 1
+            self._series[key] = _Item(x, y, color, linewidth, markersize=markersize, label=label)
+        else:
+            item.set_data(x, y)
+        self._fit_view()
+        self.canvas.update()
+
+    def remove_series(self, key):
+        if self._series.pop(key, None) is not None:
+            self.canvas.update()
+
+    def _items(self):
+        return list(self.plotted_items) + list(self._series.values())
+
+    def _data_limits(self):
+        """Bounds of the finite points, or None (leaving the view alone) when there are none"""
+        xs, ys = [], []
+        for item in self._items():
+            n = min(len(item.x), len(item.y))
+            # A missing metric arrives as an all-NaN series, which has no bounds to contribute
+            finite = np.isfinite(item.x[:n]) & np.isfinite(item.y[:n])
+            if finite.any():
+                xs.append(item.x[:n][finite])
+                ys.append(item.y[:n][finite])
+        if not xs:
+            return None
+        return (min(x.min() for x in xs), max(x.max() for x in xs),
+                min(y.min() for y in ys), max(y.max() for y in ys))
+
+    def _autoscale(self):
+        if self._user_view:
+            return
+        limits = self._data_limits()
+        if limits is None:
+            return
+        x_min, x_max, y_min, y_max = limits
+        x_pad = (x_max - x_min) * self.MARGIN or 0.5
+        y_pad = (y_max - y_min) * self.MARGIN or 0.5
+        self._xlim = (x_min - x_pad, x_max + x_pad)
+        self._ylim = (y_min - y_pad, y_max + y_pad)
+
+    def _fit_view(self):
+        """Grows the view (with headroom) when the streaming data left it"""
+        if self._user_view:
+            return
+        limits = self._data_limits()
+        if limits is None:
+            return
+        x_min, x_max, y_min, y_max = limits
+        (x0, x1), (y0, y1) = self._xlim, self._ylim
+        if x0 <= x_min and x_max <= x1 and y0 <= y_min and y_max <= y1:
+            return
+        x_span = (x_max - x_min) or 1.0
+        y_pad = (y_max - y_min) * self.STREAM_HEADROOM / 2 or 1.0
+        self._xlim = (x_min, x_max + x_span * self.STREAM_HEADROOM)
+        self._ylim = (y_min - y_pad, y_max + y_pad)
+
+    def reset_view(self):
+        self._user_view = False
+        self._autoscale()
+        self.canvas.update()
+
+    def clear_plot(self, clear_user_points=True):
+        if clear_user_points:
+            self._clear_user_points()
+        self.plotted_items = []
+        self._series = {}
+        self.current_color_index = 0
+        self.canvas.update()
+
+    # Labels
+
+    def set_title(self, title):
+        self._title = title
+        self.canvas.update()
+
+    def set_labels(self, x_label, y_label):
+        self._x_label, self._y_label = x_label, y_label
+        self.canvas.update()
+
+    def set_grid(self, visible=True):
+        self._grid = visible
+        self.canvas.update()
+
+    def set_x_formatter(self, formatter):
+        """`formatter(value) -> str` for the x tick labels"""
+        self._x_formatter = formatter
+        self.canvas.update()
+
+    def plot_width(self):
+        """Width of the data area in device pixels"""
+        rect = self._plot_rect if not self._plot_rect.isEmpty() else QRectF(self.canvas.rect())
+        return int(rect.width() * self.canvas.devicePixelRatioF())
+
+    # Painting
+
+    def _paint(self, painter, rect):
+        painter.fillRect(rect, self._face)
+        metrics = painter.fontMetrics()
+        line = metrics.height()
+
+        y_ticks, y_digits = _nice_ticks(*self._ylim, max(int(rect.height() / (3 * line)), 2))
+        y_text = [f"{v:.{y_digits}f}" for v in y_ticks]
+        left = 10 + line + max([metrics.horizontalAdvance(t) for t in y_text] or [0]) + 8
+        plot = QRectF(rect.left() + left, rect.top() + 2 * line,
+                      rect.width() - left - 20, rect.height() - 5 * line).normalized()
+        self._plot_rect = plot
+        if plot.width() < 2 or plot.height() < 2:
+            return
+        x_ticks, x_digits = _nice_ticks(*self._xlim, max(int(plot.width() / 110), 2))
+        if self._x_formatter:
+            x_text = [self._x_formatter(v) for v in x_ticks]
+        else:
+            x_text = [f"{v:.{x_digits}f}" for v in x_ticks]
+
+        (x0, x1), (y0, y1) = self._xlim, self._ylim
+        sx, sy = plot.width() / ((x1 - x0) or 1.0), plot.height() / ((y1 - y0) or 1.0)
+
+        def px(v):
+            return plot.left() + (v - x0) * sx
+
+        def py(v):
+            return plot.bottom() - (v - y0) * sy
+
+        painter.fillRect(plot, self._axes_face)
+        if self._grid:
+            painter.setPen(QPen(self._grid_color, 1))
+            for v in x_ticks:
+                painter.drawLine(QPointF(px(v), plot.top()), QPointF(px(v), plot.bottom()))
+            for v in y_ticks:
+                painter.drawLine(QPointF(plot.left(), py(v)), QPointF(plot.right(), py(v)))
+
+        painter.save()
+        painter.setClipRect(plot)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Device pixels, the unit of plot_width(), so callers fetch as many points as get drawn
+        width = int(plot.width() * painter.device().devicePixelRatioF())
+        for item in self._items():
+            x, y = item.visible(x0, x1, width)
+            if not len(x):
+                continue
+            xs, ys = plot.left() + (x - x0) * sx, plot.bottom() - (y - y0) * sy
+            points = QPolygonF([QPointF(a, b) for a, b in zip(xs.tolist(), ys.tolist())])
+            # With a point or more per pixel column a thick line would only blur and markers would only
+            # overlap it, and wide pens take Qt's path stroker, which costs tens of times more per frame
+            dense = len(x) >= width
+            if item.line and len(x) > 1:
+                painter.setPen(QPen(item.color, min(item.linewidth, 1.0) if dense else item.linewidth))
+                painter.drawPolyline(points)
+            if item.markersize and not (dense and item.line):
+                pen = QPen(item.color, 2 * item.markersize)
+                pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+                painter.setPen(pen)
+                painter.drawPoints(points)
+        marker = QPen(QColor('red'))
+        marker.setCapStyle(Qt.PenCapStyle.RoundCap)
+        for point in self.editable_points:
+            marker.setWidthF(16 if point.get('picked') else 12)
+            painter.setPen(marker)
+            painter.drawPoint(QPointF(px(point['x'][0]), py(point['y'][0])))
+        painter.restore()
+
+        painter.setPen(QPen(self._spine, 1))
+        painter.drawRect(plot)
+        painter.setPen(self._text)
+        for v, text in zip(x_ticks, x_text):
+            painter.drawLine(QPointF(px(v), plot.bottom()), QPointF(px(v), plot.bottom() + 4))
+            painter.drawText(QRectF(px(v) - 60, plot.bottom() + 6, 120, line), Qt.AlignmentFlag.AlignHCenter, text)
+        for v, text in zip(y_ticks, y_text):
+            painter.drawLine(QPointF(plot.left() - 4, py(v)), QPointF(plot.left(), py(v)))
+            painter.drawText(QRectF(rect.left(), py(v) - line / 2, plot.left() - rect.left() - 6, line),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
+
+        painter.drawText(QRectF(rect.left(), rect.top(), rect.width(), 2 * line), Qt.AlignmentFlag.AlignCenter,
+                         self._title)
+        painter.drawText(QRectF(plot.left(), plot.bottom() + line + 8, plot.width(), line),
+                         Qt.AlignmentFlag.AlignHCenter, self._x_label)
+        painter.save()
+        painter.translate(rect.left() + 4, plot.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-plot.height() / 2, 0, plot.height(), line), Qt.AlignmentFlag.AlignHCenter,
+                         self._y_label)
+        painter.restore()
+        self._paint_legend(painter, plot, line)
+
+    def _paint_legend(self, painter, plot, line):
+        entries = [item for item in self._items() if item.label]
+        if not entries:
+            return
+        text_width = max(painter.fontMetrics().horizontalAdvance(item.label) for item in entries)
+        box = QRectF(plot.right() - text_width - 46, plot.top() + 6, text_width + 40, len(entries) * line + 8)
+        painter.fillRect(box, self._axes_face)
+        painter.setPen(QPen(self._spine, 1))
+        painter.drawRect(box)
+        for i, item in enumerate(entries):
+            y = box.top() + 4 + i * line + line / 2
+            if item.line:
+                painter.setPen(QPen(item.color, item.linewidth))
+                painter.drawLine(QPointF(box.left() + 6, y), QPointF(box.left() + 26, y))
+            else:
+                pen = QPen(item.color, 2 * item.markersize)
+                pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+                painter.setPen(pen)
+                painter.drawPoint(QPointF(box.left() + 16, y))
+            painter.setPen(self._text)
+            painter.drawText(QRectF(box.left() + 32, y - line / 2, text_width + 4, line),
+                             Qt.AlignmentFlag.AlignVCenter, item.label)
+
+    # Interaction
+
+    def _to_data(self, pos):
+        plot = self._plot_rect
+        (x0, x1), (y0, y1) = self._xlim, self._ylim
+        return (x0 + (pos.x() - plot.left()) / plot.width() * (x1 - x0),
+                y0 + (plot.bottom() - pos.y()) / plot.height() * (y1 - y0))
+
+    def _emit_view_changed(self):
+        self.view_changed.emit(float(self._xlim[0]), float(self._xlim[1]), self.plot_width())
+
+    def _on_press(self, event):
+        pos = event.position()
+        if not self._plot_rect.contains(pos):
+            return
+        x, y = self._to_data(pos)
+        if self._edit_mode:
+            if event.button() == Qt.MouseButton.LeftButton:
+                for point_data in self.editable_points:
+                    if self._near(point_data, pos, 8):
+                        self._dragged_point = point_data
+                        self._drag_offset = (x - point_data['x'][0], y - point_data['y'][0])
+                        return
+                self.add_point(x, y)
+            elif event.button() == Qt.MouseButton.RightButton:
+                closest = min(self.editable_points, key=lambda p: self._distance(p, x, y), default=None)
+                if closest and self._distance(closest, x, y) < 0.5:
+                    self._remove_point(closest)
+            return
+
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_start = pos
+            self._drag_origin = (self._xlim, self._ylim)
+
+    def _near(self, point_data, pos, pixels):
+        (x0, x1), (y0, y1) = self._xlim, self._ylim
+        plot = self._plot_rect
+        px = plot.left() + (point_data['x'][0] - x0) / (x1 - x0) * plot.width()
+        py = plot.bottom() - (point_data['y'][0] - y0) / (y1 - y0) * plot.height()
+        return abs(px - pos.x()) <= pixels and abs(py - pos.y()) <= pixels
+
+    @staticmethod
+    def _distance(point_data, x, y):
+        return float(np.hypot(x - point_data['x'][0], y - point_data['y'][0]))
+
+    def _on_motion(self, event):
+        pos = event.position()
+        if self._edit_mode and self._dragged_point is not None:
+            x, y = self._to_data(pos)
+            self._dragged_point['x'][0] = x - self._drag_offset[0]
+            self._dragged_point['y'][0] = y - self._drag_offset[1]
+            self.canvas.update()
+            return
+        if self._drag_start is None:
+            return
+
+        (x0, x1), (y0, y1) = self._drag_origin
+        dx = (pos.x() - self._drag_start.x()) / self._plot_rect.width() * (x1 - x0)
+        dy = (pos.y() - self._drag_start.y()) / self._plot_rect.height() * (y1 - y0)
+        self._user_view = True
+        self._xlim = (x0 - dx, x1 - dx)
+        self._ylim = (y0 + dy, y1 + dy)
+        self.canvas.update()
+        self._emit_view_changed()
+
+    def _on_release(self, event):
+        self._dragged_point = None
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_start = None
+            self._drag_origin = None
+
+    def _on_scroll(self, event):
+        pos = event.position()
+        if not self._plot_rect.contains(pos) or self._edit_mode:
+            return
+        x, y = self._to_data(pos)
+        scale = 1 / self._zoom_factor if event.angleDelta().y() > 0 else self._zoom_factor
+        (x0, x1), (y0, y1) = self._xlim, self._ylim
+        self._user_view = True
+        self._xlim = (x - (x - x0) * scale, x + (x1 - x) * scale)
+        self._ylim = (y - (y - y0) * scale, y + (y1 - y) * scale)
+        self.canvas.update()
+        self._emit_view_changed()
+
+    # Editable points
+
+    def _toggle_edit_mode(self):
+        self._edit_mode = not self._edit_mode
+        self.edit_button.setChecked(self._edit_mode)
+        self.clear_points_button.setVisible(self._edit_mode)
+        self.edit_button.setText("Editing Points..." if self._edit_mode else "Change Points")
+        for point_data in self.editable_points:
+            point_data['picked'] = self._edit_mode
+        self.canvas.update()
+
+    def _add_editable_point(self, x, y, original=False):
+        point_data = {'x': np.array([x]), 'y': np.array([y])}
+        if original:
+            point_data['original_x'] = x
+            point_data['original_y'] = y
+        self.editable_points.append(point_data)
+        return point_data
+
+    def add_point(self, x, y):
+        self._add_editable_point(x, y)['picked'] = self._edit_mode
+        self.canvas.update()
+
+    def _remove_point(self, point_data):
+        if point_data in self.editable_points:
+            self.editable_points.remove(point_data)
+            self.canvas.update()
+
+    def _clear_user_points(self):
+        self.editable_points = []
+        self.canvas.update()
+
+    def get_user_points(self):
+        return [(p['x'][0], p['y'][0]) for p in self.editable_points]
+
+    def get_editable_points(self):
+        return [(p['x'][0], p['y'][0]) for p in self.editable_points]
+
+    # Saving
+
+    def _save_plot_dialog(self):
+        file_name, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Plot",
+            "",
+            "PNG Files (*.png);;JPEG Files (*.jpg *.jpeg);;PDF Files (*.pdf);;All Files (*)"
+        )
+        if file_name:
+            self.save(file_name)
+
+    def save(self, file_name, scale=3.0):
+        """Renders the plot to a PDF or, by extension, an image `scale` times the widget's size"""
+        size = self.canvas.size()
+        if Path(file_name).suffix.lower() == ".pdf":
+            # One widget pixel per point; the output is vector either way
+            writer = QPdfWriter(file_name)
+            writer.setResolution(72)
+            writer.setPageSize(QPageSize(QSizeF(size), QPageSize.Unit.Point))
+            writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+            painter = QPainter(writer)
+            self._paint(painter, QRectF(0, 0, size.width(), size.height()))
+            painter.end()
+            return
+        image = QImage(size * scale, QImage.Format.Format_ARGB32)
+        image.setDevicePixelRatio(scale)
+        painter = QPainter(image)
+        self._paint(painter, QRectF(0, 0, size.width(), size.height()))
+        painter.end()
+        image.save(file_name)
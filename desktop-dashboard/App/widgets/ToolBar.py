@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (QWidget, QHBoxLayout, QLabel,
 
 from App.navigation.router import Router
 from App.utils.Loader import Loader
+from App.utils.Startup import restart_argv
 from App.widgets.ToggleSwitch import ToggleSwitch
 
 
@@ -112,8 +113,13 @@ class _ToolbarWithOutLine(QWidget):
 
     @staticmethod
     def _restart_application():
+        # Imported here like the rest of the monitor; a service not started yet has no URL of its own,
+        # so the restart falls back to the one the app was launched with
+        from App.logic.MonitorService import MonitorService
+        service = MonitorService.running()
+        argv = restart_argv(service.url if service is not None else None)
         QApplication.quit()
-        os.execv(sys.executable, [sys.executable] + sys.argv)
+        os.execv(sys.executable, [sys.executable] + argv)
 
 
 class ToolBar(QWidget):
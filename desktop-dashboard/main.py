@@ -1,9 +1,26 @@
-import sys
+import time
+
+# Taken before the imports below so --debug-startup counts them
+STARTED = time.perf_counter()
+
+import argparse
+import os
 
-import App.logic.Logic
 import App.main as app
+import App.widgets.Plots
+from App.utils.Startup import StartupTimer, set_launch_options
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
-        App.logic.Logic.GPUMonitor.URL = sys.argv[1]
-    app.main()
+    parser = argparse.ArgumentParser(description="GPU Monitor desktop dashboard")
+    parser.add_argument("url", nargs="?", help="URL of the metrics endpoint")
+    parser.add_argument("--plot", choices=App.widgets.Plots.BACKENDS, default=App.widgets.Plots.backend,
+                        help="Plot implementation: matplotlib, or qt for the lighter QPainter one "
+                             "(default: $GPU_MONITOR_PLOT or matplotlib)")
+    parser.add_argument("--debug-startup", action="store_true",
+                        default=bool(os.environ.get("GPU_MONITOR_DEBUG_STARTUP")),
+                        help="Print how long each startup phase and preload step took "
+                             "(default: set if $GPU_MONITOR_DEBUG_STARTUP is)")
+    args = parser.parse_args()
+    App.widgets.Plots.set_backend(args.plot)
+    set_launch_options([f"--plot={args.plot}"] + (["--debug-startup"] if args.debug_startup else []), args.url)
+    app.main(args.url, StartupTimer(args.debug_startup, STARTED))
@@ -0,0 +1,138 @@
+"""
+Prometheus text exposition parser shared by the terminal and desktop dashboards.
+
+Every GPU series exported by the core API carries the same label block for
+all of its metrics, so the parser keeps a cache from the raw label text to
+its parsed label dict, whose names and values are `sys.intern`ed: after the
+first scrape a line costs one split and one dict lookup. The result is columnar, one list of values per
+metric with one row per GPU.
+"""
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+GPU_KEY_LABEL = "gpu_index"
+
+_LABEL_RE = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"\s*(?:,|$)')
+_UNESCAPE_RE = re.compile(r'\\(.)')
+_UNESCAPES = {"n": "\n", "\\": "\\", '"': '"'}
+
+NAN = float("nan")
+
+
+def parse_labels(block: str) -> Dict[str, str]:
+    """Parses `a="1",b="x\\"y"` (the text between the braces) into a dict, unescaping values."""
+    labels = {}
+    pos = 0
+    while pos < len(block):
+        match = _LABEL_RE.match(block, pos)
+        if match is None:
+            if block[pos:].strip(" ,"):
+                raise ValueError(f"Malformed label block: {block!r}")
+            break
+        name, value = match.groups()
+        if "\\" in value:
+            value = _UNESCAPE_RE.sub(lambda m: _UNESCAPES.get(m.group(1), "\\" + m.group(1)), value)
+        labels[name] = value
+        pos = match.end()
+    return labels
+
+
+@dataclass
+class Snapshot:
+    """
+    One scrape, per GPU in columns.
+
+    `gpus` maps each `gpu_index` label value to the GPU's labels, in the order
+    the GPUs appeared; `columns[metric][row]` is the metric's value for the GPU
+    at that row (NaN when it did not report it). Series without a GPU index,
+    such as the exporter's own `gpu_exporter_*` metrics, go to `other`.
+    """
+    gpus: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    rows: Dict[str, int] = field(default_factory=dict)
+    columns: Dict[str, List[float]] = field(default_factory=dict)
+    other: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+
+    def value(self, gpu: str, metric: str, default: float = NAN) -> float:
+        column = self.columns.get(metric)
+        row = self.rows.get(gpu)
+        if column is None or row is None or math.isnan(column[row]):
+            return default
+        return column[row]
+
+    def metrics(self, gpu: str) -> Dict[str, float]:
+        """The metrics a GPU reported, by name."""
+        row = self.rows[gpu]
+        return {metric: column[row] for metric, column in self.columns.items() if not math.isnan(column[row])}
+
+
+class ExpositionParser:
+    """
+    Reusable parser; keep one per scrape target so label sets are interned
+    across scrapes. Unchanged GPUs get the very same label dict every time.
+    """
+    MAX_CACHED_LABEL_SETS = 4096
+
+    def __init__(self, key_label: str = GPU_KEY_LABEL):
+        self.key_label = key_label
+        self._labels: Dict[str, Tuple[str, Dict[str, str]]] = {}
+
+    def _intern(self, block: str) -> Tuple[str, Dict[str, str]]:
+        cached = self._labels.get(block)
+        if cached is None:
+            if len(self._labels) >= self.MAX_CACHED_LABEL_SETS:
+                self._labels.clear()
+            # Interned, so every GPU's label names (and repeated values) share one string
+            labels = {sys.intern(name): sys.intern(value) for name, value in parse_labels(block).items()}
+            cached = self._labels[block] = (labels.get(self.key_label), labels)
+        return cached
+
+    def parse(self, text: str) -> Snapshot:
+        snapshot = Snapshot()
+        gpus, rows, columns, other = snapshot.gpus, snapshot.rows, snapshot.columns, snapshot.other
+
+        for line in text.splitlines():
+            if not line or line[0] == "#":
+                continue
+            brace = line.find("{")
+            try:
+                if brace < 0:
+                    parts = line.split()
+                    if not parts:
+                        continue
+                    name, value, key, labels = parts[0], float(parts[1]), None, {}
+                else:
+                    close = line.rindex("}")
+                    name = line[:brace].strip()
+                    key, labels = self._intern(line[brace + 1:close])
+                    # The value may be followed by a timestamp
+                    value = float(line[close + 1:].split()[0])
+            except (ValueError, IndexError):
+                continue
+
+            if key is None:
+                other.append((name, labels, value))
+                continue
+
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = len(rows)
+                gpus[key] = labels
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [NAN] * len(rows)
+            elif len(column) <= row:
+                column.extend([NAN] * (row + 1 - len(column)))
+            column[row] = value
+
+        for column in columns.values():
+            if len(column) < len(rows):
+                column.extend([NAN] * (len(rows) - len(column)))
+        return snapshot
+
+
+def parse(text: str) -> Snapshot:
+    """One-off parse without label interning across calls."""
+    return ExpositionParser().parse(text)
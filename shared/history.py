@@ -0,0 +1,58 @@
+"""Fixed-capacity metric history shared by the terminal and desktop dashboards."""
+from typing import Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Float ring buffer with amortized O(1) append and zero-copy windows.
+
+    Samples are appended to a backing array twice the capacity, so the last
+    `n` are always one contiguous slice and `window` returns a view. When the
+    array is full, the last `capacity - 1` samples move to the front of a new
+    array rather than the old one, so no slice handed out is ever written
+    again; `frozen` relies on that.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=np.float64)
+        # The samples are _data[_end - _size:_end]
+        self._end = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        if self._end == len(self._data):
+            keep = self.capacity - 1
+            data = np.empty_like(self._data)
+            data[:keep] = self._data[self._end - keep:self._end]
+            self._data, self._end = data, keep
+        self._data[self._end] = value
+        self._end += 1
+        self._size = min(self._size + 1, self.capacity)
+
+    def discard(self, n: int) -> None:
+        """Drops the `n` oldest samples."""
+        self._size -= max(0, min(n, self._size))
+
+    def latest(self, default: float = 0.0) -> float:
+        return float(self._data[self._end - 1]) if self._size else default
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """Read-only view of the last `n` samples (all by default), oldest first."""
+        n = self._size if n is None else max(0, min(n, self._size))
+        view = self._data[self._end - n:self._end]
+        view.flags.writeable = False
+        return view
+
+    def frozen(self) -> "RingBuffer":
+        """A read-only buffer of the current samples, sharing memory; later appends here never change it."""
+        clone = RingBuffer.__new__(RingBuffer)
+        clone.capacity = self.capacity
+        clone._data = self.window()
+        clone._end = clone._size = self._size
+        return clone
@@ -0,0 +1,106 @@
+import math
+import os
+import sys
+
+import pytest
+
+# The dashboards import the parser as `shared.exposition` from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.exposition import ExpositionParser, parse, parse_labels  # noqa: E402
+
+SCRAPE = """\
+# HELP gpu_utilization_percent GPU utilization
+# TYPE gpu_utilization_percent gauge
+gpu_utilization_percent{gpu_index="0",name="A100"} 42
+gpu_utilization_percent{gpu_index="1",name="A100"} 7 1700000000000
+gpu_temperature_celsius{gpu_index="1",name="A100"} 65.5
+gpu_exporter_scrape_seconds 0.012
+gpu_exporter_info{version="1.2"} 1
+"""
+
+
+def test_parse_labels_unescapes_values():
+    labels = parse_labels(r'a="say \"hi\"",b="C:\\temp",c="two\nlines"')
+    assert labels == {"a": 'say "hi"', "b": "C:\\temp", "c": "two\nlines"}
+
+
+def test_parse_labels_keeps_commas_and_braces_inside_quotes():
+    assert parse_labels('a="x,y",b="{z}"') == {"a": "x,y", "b": "{z}"}
+
+
+def test_parse_labels_rejects_malformed_block():
+    with pytest.raises(ValueError):
+        parse_labels('a="1",b=2')
+
+
+def test_quoted_brace_in_sample_line():
+    snapshot = parse('gpu_power_watts{gpu_index="0",name="weird}name,x"} 120\n')
+    assert snapshot.gpus["0"]["name"] == "weird}name,x"
+    assert snapshot.value("0", "gpu_power_watts") == 120
+
+
+def test_optional_timestamp():
+    snapshot = parse(SCRAPE)
+    assert snapshot.value("0", "gpu_utilization_percent") == 42
+    assert snapshot.value("1", "gpu_utilization_percent") == 7
+
+
+def test_special_float_values():
+    snapshot = parse(
+        'm{gpu_index="0"} NaN\n'
+        'm{gpu_index="1"} +Inf\n'
+        'm{gpu_index="2"} -Inf\n'
+    )
+    column = snapshot.columns["m"]
+    assert math.isnan(column[0])
+    assert column[1] == math.inf
+    assert column[2] == -math.inf
+    # A NaN sample reads as not reported
+    assert snapshot.value("0", "m", default=-1.0) == -1.0
+
+
+def test_series_without_gpu_index_go_to_other():
+    snapshot = parse(SCRAPE)
+    assert list(snapshot.gpus) == ["0", "1"]
+    assert snapshot.other == [
+        ("gpu_exporter_scrape_seconds", {}, 0.012),
+        ("gpu_exporter_info", {"version": "1.2"}, 1.0),
+    ]
+
+
+def test_missing_columns_are_nan_filled():
+    snapshot = parse(SCRAPE)
+    temperature = snapshot.columns["gpu_temperature_celsius"]
+    assert len(temperature) == 2
+    assert math.isnan(temperature[0])
+    assert temperature[1] == 65.5
+    assert snapshot.metrics("0") == {"gpu_utilization_percent": 42}
+
+    # A column first seen on a later GPU is padded for the GPUs before it, and
+    # one that stops early is padded after it
+    snapshot = parse('a{gpu_index="0"} 1\nb{gpu_index="1"} 2\nc{gpu_index="2"} 3\n')
+    assert [len(column) for column in snapshot.columns.values()] == [3, 3, 3]
+    assert math.isnan(snapshot.columns["b"][0]) and math.isnan(snapshot.columns["a"][2])
+
+
+def test_label_sets_are_interned_across_scrapes():
+    parser = ExpositionParser()
+    first = parser.parse(SCRAPE)
+    second = parser.parse(SCRAPE)
+    assert second.gpus["0"] is first.gpus["0"]
+    assert second.gpus["1"] is first.gpus["1"]
+    # Label names and values are interned strings, shared between GPUs
+    assert first.gpus["0"]["name"] is first.gpus["1"]["name"]
+    # A fresh parser does not share the dicts
+    assert parse(SCRAPE).gpus["0"] is not first.gpus["0"]
+
+
+def test_label_cache_is_bounded():
+    parser = ExpositionParser()
+    parser.MAX_CACHED_LABEL_SETS = 8
+    text = "".join(f'm{{gpu_index="{i}"}} {i}\n' for i in range(20))
+    snapshot = parser.parse(text)
+    assert len(parser._labels) <= 8
+    assert snapshot.value("19", "m") == 19
+    assert len(snapshot.gpus) == 20
@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pytest
+
+# The dashboards import the buffers as `shared.history` from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.history import RingBuffer  # noqa: E402
+
+
+def test_window_keeps_the_last_capacity_samples():
+    buf = RingBuffer(4)
+    assert len(buf) == 0 and buf.latest(default=-1.0) == -1.0
+    for i in range(11):
+        buf.append(i)
+    assert len(buf) == 4
+    assert buf.latest() == 10
+    assert buf.window().tolist() == [7, 8, 9, 10]
+    assert buf.window(2).tolist() == [9, 10]
+    assert buf.window(100).tolist() == [7, 8, 9, 10]
+
+
+def test_windows_are_read_only():
+    buf = RingBuffer(3)
+    buf.append(1.0)
+    with pytest.raises(ValueError):
+        buf.window()[0] = 2.0
+
+
+def test_frozen_buffers_never_change():
+    buf = RingBuffer(3)
+    frozen = []
+    for i in range(20):
+        buf.append(i)
+        frozen.append((buf.frozen(), buf.window().tolist()))
+    for snapshot, samples in frozen:
+        assert snapshot.window().tolist() == samples
+        assert snapshot.latest() == samples[-1]
+        assert len(snapshot) == len(samples)
+
+
+def test_discard_drops_the_oldest():
+    buf = RingBuffer(5)
+    for i in range(5):
+        buf.append(i)
+    buf.discard(2)
+    assert buf.window().tolist() == [2, 3, 4]
+    buf.discard(10)
+    assert len(buf) == 0
@@ -0,0 +1,46 @@
+"""
+Vectorized Braille area charts.
+
+Each character cell is a 2x4 dot matrix (U+2800..U+28FF), so a chart of
+`width` x `height` cells plots `2 * width` samples at `4 * height` levels.
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+# Bit of each dot, indexed [dot row from the top][dot column]
+DOT_BITS = np.array([[0x01, 0x08],
+                     [0x02, 0x10],
+                     [0x04, 0x20],
+                     [0x40, 0x80]], dtype=np.uint8)
+BRAILLE_BASE = 0x2800
+
+
+def rasterize(values: Sequence[float], width: int, height: int,
+              min_val: float = 0.0, max_val: float = 100.0) -> np.ndarray:
+    """
+    Area chart of the last `2 * width` values as a (height, width) array of
+    Braille dot masks, top row first. Missing leading samples stay empty; any
+    sample present lights at least its bottom dot.
+    """
+    columns = 2 * width
+    levels = 4 * height
+    samples = np.asarray(values, dtype=np.float64)[-columns:]
+
+    # Dot height per dot column; columns without a sample get 0
+    heights = np.zeros(columns, dtype=np.int64)
+    value_range = max(max_val - min_val, 1e-9)
+    scaled = (np.clip(samples, min_val, max_val) - min_val) / value_range
+    heights[columns - len(samples):] = (scaled * (levels - 1)).astype(np.int64) + 1
+
+    # (levels, columns) dot bitmap, top dot row first
+    lit = np.arange(levels - 1, -1, -1)[:, None] < heights[None, :]
+    cells = lit.reshape(height, 4, width, 2) * DOT_BITS[None, :, None, :]
+    return cells.sum(axis=(1, 3), dtype=np.uint16).astype(np.uint8)
+
+
+def to_rows(cells: np.ndarray, blank: str = ' ') -> List[str]:
+    """Turns dot masks into one string per row; empty cells become `blank`."""
+    codes = cells.astype(np.uint32) + BRAILLE_BASE
+    codes[cells == 0] = ord(blank)
+    return [row.tobytes().decode('utf-32-le') for row in np.ascontiguousarray(codes)]
@@ -0,0 +1,132 @@
+import curses
+from typing import List, Tuple
+
+BLANK = ' '
+
+
+class FrameBuffer:
+    """
+    Off-screen stand-in for a curses window.
+
+    The draw functions render into it with the usual window calls (addstr,
+    attron/attroff, box, vline, ...); `flush` then compares the frame with the
+    previously flushed one and writes only the changed runs to the real window,
+    one addstr per run of equally attributed cells. Text that does not fit is
+    clipped instead of raising or wrapping like curses does.
+    """
+
+    def __init__(self, rows: int = 0, cols: int = 0):
+        self.rows = 0
+        self.cols = 0
+        self.resize(rows, cols)
+
+    def resize(self, rows: int, cols: int) -> None:
+        self.rows, self.cols = rows, cols
+        self.chars = [[BLANK] * cols for _ in range(rows)]
+        self.attrs = [[0] * cols for _ in range(rows)]
+        # Nothing is known to be on screen after a resize
+        self._prev_chars = [None] * rows
+        self._prev_attrs = [None] * rows
+        self.y = self.x = 0
+        self.attr = 0
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.rows, self.cols
+
+    def erase(self) -> None:
+        for y in range(self.rows):
+            self.chars[y] = [BLANK] * self.cols
+            self.attrs[y] = [0] * self.cols
+        self.y = self.x = 0
+        self.attr = 0
+
+    clear = erase
+
+    def attron(self, attr: int) -> None:
+        # Same rules as ncurses: turning on a color pair replaces the current one
+        if attr & curses.A_COLOR:
+            self.attr = (self.attr & ~curses.A_COLOR) | attr
+        else:
+            self.attr |= attr
+
+    def attroff(self, attr: int) -> None:
+        if attr & curses.A_COLOR:
+            self.attr &= ~(attr | curses.A_COLOR)
+        else:
+            self.attr &= ~attr
+
+    def attrset(self, attr: int) -> None:
+        self.attr = attr
+
+    def move(self, y: int, x: int) -> None:
+        self.y, self.x = y, x
+
+    def addstr(self, *args) -> None:
+        """addstr(str[, attr]) or addstr(y, x, str[, attr])"""
+        if len(args) >= 3:
+            self.y, self.x = args[0], args[1]
+            args = args[2:]
+        text = args[0]
+        attr = args[1] if len(args) > 1 else self.attr
+        y, x = self.y, self.x
+        if 0 <= y < self.rows and x < self.cols:
+            start = max(0, x)
+            text = text[start - x:self.cols - x]
+            end = start + len(text)
+            self.chars[y][start:end] = text
+            self.attrs[y][start:end] = [attr] * len(text)
+        self.x = x + len(args[0])
+
+    def hline(self, y: int, x: int, ch, n: int) -> None:
+        self.addstr(y, x, (ch if isinstance(ch, str) else '─') * n)
+
+    def vline(self, y: int, x: int, ch, n: int) -> None:
+        ch = ch if isinstance(ch, str) else '│'
+        for i in range(n):
+            self.addstr(y + i, x, ch)
+
+    def box(self) -> None:
+        if self.rows < 2 or self.cols < 2:
+            return
+        inner = self.cols - 2
+        self.addstr(0, 0, '┌' + '─' * inner + '┐')
+        self.addstr(self.rows - 1, 0, '└' + '─' * inner + '┘')
+        self.vline(1, 0, '│', self.rows - 2)
+        self.vline(1, self.cols - 1, '│', self.rows - 2)
+
+    def diff(self) -> List[Tuple[int, int, str, int]]:
+        """Changed runs `(y, x, text, attr)` since the last diff; the current frame becomes the reference."""
+        runs = []
+        for y in range(self.rows):
+            chars, attrs = self.chars[y], self.attrs[y]
+            prev_chars, prev_attrs = self._prev_chars[y], self._prev_attrs[y]
+            if chars == prev_chars and attrs == prev_attrs:
+                continue
+
+            x = 0
+            while x < self.cols:
+                if prev_chars is not None and chars[x] == prev_chars[x] and attrs[x] == prev_attrs[x]:
+                    x += 1
+                    continue
+                start, attr = x, attrs[x]
+                x += 1
+                while x < self.cols and attrs[x] == attr and (
+                        prev_chars is None or chars[x] != prev_chars[x] or attrs[x] != prev_attrs[x]):
+                    x += 1
+                runs.append((y, start, ''.join(chars[start:x]), attr))
+
+            self._prev_chars[y] = list(chars)
+            self._prev_attrs[y] = list(attrs)
+        return runs
+
+    def flush(self, window) -> int:
+        """Writes the changed runs to `window` (without refreshing it) and returns how many cells changed."""
+        cells = 0
+        for y, x, text, attr in self.diff():
+            try:
+                window.addstr(y, x, text, attr)
+            except curses.error:
+                # Writing the bottom-right cell moves the cursor off-screen; the text is still drawn
+                pass
+            cells += len(text)
+        return cells
@@ -1,23 +1,54 @@
+import os
+import sys
 import curses
 import time
+import threading
 import requests
-import re
 import locale
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace, asdict
+from typing import Dict, List, Optional, Tuple
 import argparse
 
-parser = argparse.ArgumentParser(description="GPU Monitor TUI")
-parser.add_argument("ip_port", type=str, help="Server address in the form IP:PORT")
-parser.add_argument("method", type=str, help="Metric method, e.g., sim")
-args = parser.parse_args()
+# The exposition parser and history buffers live in the repository-level `shared` package
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
 
-URL = f"http://{args.ip_port}/gpu/metric?method={args.method}"
+from shared import exposition
+from shared.history import RingBuffer
+import braille
+import recording
+from framebuffer import FrameBuffer
+
+BASE_URL = ""
+METHOD = "sim"
+URL = ""
+POLL_INTERVAL = 2.0
+TARGET_FPS = 10
+SEEK_SECONDS = 60.0  # Replay seek step (recording time)
 
-METRIC_LINE_RE = re.compile(r'^([\w:]+)\{([^}]*)\}\s+([0-9.eE+-]+)$')
 MAX_DATA_POINTS = 2000
 
+# Metrics kept as history, in the order the detailed view cycles through them:
+# name -> (title, unit, scale max or None to fit the data)
+HISTORY_METRICS = {
+    "gpu_utilization_percent": ("Utilization", "%", 100.0),
+    "gpu_temperature_celsius": ("Temperature", "C", 100.0),
+    "gpu_power_watts": ("Power", "W", None),
+    "gpu_clock_mhz": ("GPU Clock", "MHz", None),
+    "gpu_memory_clock_mhz": ("Memory Clock", "MHz", None),
+    "gpu_memory_usage_percent": ("Memory Usage", "%", 100.0),
+}
+
+# Metrics whose latest value is also kept as a GpuData field
+SCALAR_FIELDS = {
+    "gpu_temperature_celsius": "temperature_c",
+    "gpu_clock_mhz": "clock_mhz",
+    "gpu_memory_clock_mhz": "mem_clock_mhz",
+    "gpu_power_watts": "power_watts",
+    "gpu_memory_usage_percent": "memory_usage_percent",
+}
+
+EXPOSITION_PARSER = exposition.ExpositionParser()
+
 @dataclass
 class GpuProcess:
     pid: int
@@ -27,7 +58,9 @@ class GpuProcess:
 class GpuData:
     name: str = ""
     uuid: str = ""
-    utilization_history: List[float] = field(default_factory=list)
+    index: int = 0
+    history: Dict[str, RingBuffer] = field(
+        default_factory=lambda: {metric: RingBuffer(MAX_DATA_POINTS) for metric in HISTORY_METRICS})
     temperature_c: float = 0.0
     clock_mhz: float = 0.0
     mem_clock_mhz: float = 0.0
@@ -36,8 +69,47 @@ class GpuData:
     health: str = ""
     processes: List[GpuProcess] = field(default_factory=list)
 
-utilization_history = defaultdict(lambda: deque(maxlen=60))
-detailed_view_mode = False
+# GPU orderings and filters, in the order 's' and 'f' cycle through them
+HEALTH_SEVERITY = {"healthy": 0, "caution": 1, "warning": 2, "critical": 3}
+GPU_SORT_KEYS = {
+    "index": lambda gpu: gpu.index,
+    "utilization": lambda gpu: -gpu.history["gpu_utilization_percent"].latest(),
+    "temperature": lambda gpu: -gpu.temperature_c,
+    # Unknown health sorts between healthy and warning
+    "health": lambda gpu: -HEALTH_SEVERITY.get(gpu.health.lower(), 1),
+}
+GPU_FILTERS = {
+    "all": lambda gpu: True,
+    "active": lambda gpu: gpu.history["gpu_utilization_percent"].latest() >= 30,
+    "hot": lambda gpu: gpu.temperature_c > 80,
+    "unhealthy": lambda gpu: HEALTH_SEVERITY.get(gpu.health.lower(), 1) > 0,
+}
+
+@dataclass
+class ViewState:
+    """What the user is looking at; only the render loop touches it"""
+    mode: str = "standard"  # standard | detailed | table
+    metric: int = 0  # HISTORY_METRICS entry shown by the detailed view
+    sort: str = "index"
+    filter: str = "all"
+    offset: int = 0  # Position of the first drawn GPU in the sorted, filtered list
+    page_size: int = 1  # How many GPUs the last frame had room for
+
+    def cycle(self, attr: str, choices) -> None:
+        choices = list(choices)
+        setattr(self, attr, choices[(choices.index(getattr(self, attr)) + 1) % len(choices)])
+        self.offset = 0
+
+    def scroll(self, delta: int) -> None:
+        # The upper bound depends on the next frame, see visible_range()
+        self.offset = max(0, self.offset + delta)
+
+    def position(self, total: int) -> str:
+        if total == 0:
+            return f"no GPUs match '{self.filter}'"
+        return f"GPUs {self.offset + 1}-{min(total, self.offset + self.page_size)} of {total}"
+
+view = ViewState()
 
 SPARK_CHARS_DENSE = '⠀⡀⡄⡆⡇⣇⣧⣷⣿'
 SPARK_CHARS_NORMAL = '▁▂▃▄▅▆▇█'
@@ -125,18 +197,22 @@ def get_display_config(width, height):
             'show_processes': False
         }
 
-def fetch_data():
+def fetch_frame() -> recording.Frame:
+    """Poll the metrics endpoint; the processes are fetched once the frame's GPUs are known"""
+    frame = recording.Frame(time=time.time())
     try:
         response = requests.get(URL, timeout=5)
         if response.status_code != 200:
-            return {"error": f"HTTP {response.status_code}", "raw": ""}
-        return {"data": parse_prometheus_metrics(response.text), "raw": response.text}
+            frame.error = f"HTTP {response.status_code}"
+        else:
+            frame.metrics = response.text
     except Exception as e:
-        return {"error": str(e), "raw": ""}
+        frame.error = str(e)
+    return frame
 
 def fetch_gpu_processes(gpu_uuid: str) -> List[GpuProcess]:
     try:
-        url = f"http://{args.ip_port}/gpu/{gpu_uuid}/processes?method=sim"
+        url = f"{BASE_URL}/gpu/{gpu_uuid}/processes?method={METHOD}"
         response = requests.get(url, timeout=2)
         if response.status_code != 200:
             return []
@@ -152,81 +228,160 @@ def fetch_gpu_processes(gpu_uuid: str) -> List[GpuProcess]:
     except Exception:
         return []
 
-def parse_prometheus_metrics(text):
-    gpu_metrics = defaultdict(dict)
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-
-        match = METRIC_LINE_RE.match(line)
-        if match:
-            metric, labels_str, value = match.groups()
-            labels = dict(part.split('=') for part in labels_str.split(',') if '=' in part)
-            labels = {k.strip(): v.strip('"') for k, v in labels.items()}
-            gpu_name = labels.get("gpu_name", "Unknown")
-            gpu_index = labels.get("gpu_index", "?")
-            gpu_uuid = labels.get("uuid", f"gpu_{gpu_index}")
-            key = f"{gpu_index} - {gpu_name}"
-            gpu_metrics[key][metric] = value
-            gpu_metrics[key]["uuid"] = gpu_uuid
-            gpu_metrics[key]["gpu_health"] = labels.get("gpu_health", "")
+def standard_view_data(scrape: exposition.Snapshot) -> Dict[str, dict]:
+    """Latest metrics of each GPU plus its uuid and health, keyed "<index> - <name>" for the standard view"""
+    gpu_metrics = {}
+    for index, labels in scrape.gpus.items():
+        metrics = scrape.metrics(index)
+        metrics["uuid"] = labels.get("gpu_uuid", f"gpu_{index}")
+        metrics["gpu_health"] = labels.get("gpu_health", "")
+        gpu_metrics[f"{index} - {labels.get('gpu_name', 'Unknown')}"] = metrics
     return gpu_metrics
 
-def parse_all_gpu_data(raw_data: str, all_gpus: Dict[str, GpuData]) -> None:
-    """Parse all relevant metrics and populate the GpuData structs for detailed view"""
-    lines = raw_data.strip().split('\n')
-
-    metric_pattern = re.compile(r'([^\{]+)\{([^}]+)\}\s+([0-9.]+)')
-    name_pattern = re.compile(r'name="([^"]*)"')
-    uuid_pattern = re.compile(r'uuid="([^"]*)"')
-    gpu_index_pattern = re.compile(r'gpu_index="([^"]*)"')
-
-    for line in lines:
-        metric_match = metric_pattern.search(line)
-        if metric_match:
-            metric_name = metric_match.group(1)
-            labels_block = metric_match.group(2)
-            value = float(metric_match.group(3))
-
-            uuid_match = uuid_pattern.search(labels_block)
-            if uuid_match:
-                uuid = uuid_match.group(1)
+def update_gpu_data(scrape: exposition.Snapshot, all_gpus: Dict[str, GpuData]) -> None:
+    """Append a scrape to the GpuData history of each GPU and update its latest values"""
+    for index, labels in scrape.gpus.items():
+        uuid = labels.get("gpu_uuid", f"gpu_{index}")
+        gpu = all_gpus.get(uuid)
+        if gpu is None:
+            gpu = all_gpus[uuid] = GpuData(name=labels.get("gpu_name", f"GPU {index}"), uuid=uuid)
+        gpu.index = int(index) if index.isdigit() else len(all_gpus) - 1
+        gpu.health = labels.get("gpu_health", "")
+
+        for metric, value in scrape.metrics(index).items():
+            if metric in HISTORY_METRICS:
+                gpu.history[metric].append(value)
+            if metric in SCALAR_FIELDS:
+                setattr(gpu, SCALAR_FIELDS[metric], value)
+
+
+def apply_frame(frame: recording.Frame, all_gpus: Dict[str, GpuData]) -> Tuple[Dict[str, dict], str]:
+    """Feed a fetched or replayed frame into the GpuData of each GPU; returns the standard view data and a status line"""
+    if frame.metrics is None:
+        return {}, f"Error: {frame.error}"
+
+    scrape = EXPOSITION_PARSER.parse(frame.metrics)
+    data = standard_view_data(scrape)
+    status = f"OK. Fetched data for {len(data)} GPUs."
+    try:
+        update_gpu_data(scrape, all_gpus)
+        if frame.processes is None:
+            # A live frame: fetch the processes now, so a recording gets them too
+            frame.processes = {uuid: [asdict(proc) for proc in fetch_gpu_processes(uuid)] for uuid in all_gpus}
+        for uuid, gpu in all_gpus.items():
+            gpu.processes = [GpuProcess(**proc) for proc in frame.processes.get(uuid, [])]
+    except Exception as e:
+        status = f"Update Error: {str(e)}"
+
+    for metrics in data.values():
+        gpu = all_gpus.get(metrics.get("uuid"))
+        metrics["processes"] = list(gpu.processes) if gpu else []
+    return data, status
+
+def select_gpus(gpus: Dict[str, GpuData]) -> List[GpuData]:
+    """The GPUs passing the view's filter, in the view's sort order"""
+    keep, key = GPU_FILTERS[view.filter], GPU_SORT_KEYS[view.sort]
+    return sorted((gpu for gpu in gpus.values() if keep(gpu)), key=lambda gpu: (key(gpu), gpu.index))
+
+def visible_range(total: int, capacity: int) -> range:
+    """Positions of the GPUs to draw when `capacity` fit; clamps the scroll offset to keep the last page full"""
+    view.page_size = max(1, capacity)
+    view.offset = max(0, min(view.offset, total - view.page_size))
+    return range(view.offset, min(total, view.offset + view.page_size))
+
+@dataclass
+class Snapshot:
+    """Immutable view of the latest poll, handed from the fetch thread to the render loop"""
+    seq: int = 0
+    data: dict = field(default_factory=dict)
+    gpus: Dict[str, GpuData] = field(default_factory=dict)
+    status: str = "Initializing..."
+
+class DataFetcher(threading.Thread):
+    """
+    Polls the API every `interval` seconds, or plays back a recording, and
+    publishes a new Snapshot after each poll. With a `recorder`, every polled
+    frame is also appended to a recording.
+    """
+
+    def __init__(self, interval: float, recorder: Optional[recording.Recorder] = None,
+                 player: Optional[recording.Player] = None):
+        super().__init__(name="gpu-fetcher", daemon=True)
+        self.interval = interval
+        self.recorder = recorder
+        self.player = player
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Cuts the wait for the next poll short: set on stop and on replay seeks and speed changes
+        self._wake = threading.Event()
+        self._snapshot = Snapshot()
+        self._all_gpus: Dict[str, GpuData] = {}
+
+    def latest(self) -> Snapshot:
+        with self._lock:
+            return self._snapshot
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake.set()
+
+    def seek(self, seconds: float) -> None:
+        if self.player:
+            self.player.seek(seconds)
+            self._wake.set()
+
+    def set_speed(self, speed: float) -> None:
+        if self.player:
+            self.player.set_speed(speed)
+            self._wake.set()
+
+    def replay_status(self, frame: recording.Frame) -> str:
+        player = self.player
+        status = (f"Replay {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(frame.time))}"
+                  f" | frame {player.position}/{len(player.recording)} | {player.speed:g}x")
+        return status + " | end of recording" if player.finished() else status
+
+    def poll(self) -> Optional[Snapshot]:
+        if self.player is None:
+            restart, frames = False, [fetch_frame()]
+        else:
+            restart, frames = self.player.due()
+            if not frames:
+                return None
+        if restart:
+            self._all_gpus = {}
+
+        for frame in frames:
+            data, status = apply_frame(frame, self._all_gpus)
+            if self.recorder:
+                self.recorder.write(frame)
+        if self.player:
+            status = f"{self.replay_status(frames[-1])} | {status}"
+
+        # Hand the render loop what the fetch thread keeps mutating in a form it cannot race:
+        # read-only views of the history (no copy, appends never touch them) and the process list
+        return Snapshot(
+            seq=self._snapshot.seq + 1,
+            data=data,
+            gpus={uuid: replace(gpu, history={metric: buf.frozen() for metric, buf in gpu.history.items()},
+                                processes=list(gpu.processes))
+                  for uuid, gpu in self._all_gpus.items()},
+            status=status,
+        )
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            snapshot = self.poll()
+            if snapshot is not None:
+                with self._lock:
+                    self._snapshot = snapshot
+            if self.player:
+                timeout = self.player.delay()
             else:
-                index_match = gpu_index_pattern.search(labels_block)
-                if index_match:
-                    uuid = f"gpu_{index_match.group(1)}"
-                else:
-                    continue
-
-            if uuid not in all_gpus:
-                all_gpus[uuid] = GpuData()
-                all_gpus[uuid].uuid = uuid
-                name_match = name_pattern.search(labels_block)
-                if name_match:
-                    all_gpus[uuid].name = name_match.group(1)
-                else:
-                    index_match = gpu_index_pattern.search(labels_block)
-                    if index_match:
-                        all_gpus[uuid].name = f"GPU {index_match.group(1)}"
-
-            if metric_name == "gpu_utilization_percent":
-                all_gpus[uuid].utilization_history.append(value)
-                if len(all_gpus[uuid].utilization_history) > MAX_DATA_POINTS:
-                    all_gpus[uuid].utilization_history.pop(0)
-            elif metric_name == "gpu_temperature_celsius":
-                all_gpus[uuid].temperature_c = value
-            elif metric_name == "gpu_clock_mhz":
-                all_gpus[uuid].clock_mhz = value
-            elif metric_name == "gpu_memory_clock_mhz":
-                all_gpus[uuid].mem_clock_mhz = value
-            elif metric_name == "gpu_power_watts":
-                all_gpus[uuid].power_watts = value
-            elif metric_name == "gpu_memory_usage_percent":
-                all_gpus[uuid].memory_usage_percent = value
-
-    for uuid, gpu in all_gpus.items():
-        gpu.processes = fetch_gpu_processes(uuid)
+                timeout = max(0.0, self.interval - (time.monotonic() - started))
+            self._wake.wait(timeout)
+            self._wake.clear()
 
 def get_utilization_color(util):
     """Get color pair based on utilization percentage"""
@@ -241,7 +396,7 @@ def get_utilization_color(util):
 
 def draw_header(stdscr, width, config):
     """Draw header based on terminal size"""
-    mode_indicator = " [DETAILED]" if detailed_view_mode else " [STANDARD]"
+    mode_indicator = f" [{view.mode.upper()}]"
 
     if config['header_style'] == 'full':
         title = f" GPU MONITOR DASHBOARD - Real-time Performance{mode_indicator} "
@@ -263,12 +418,11 @@ def draw_header(stdscr, width, config):
         stdscr.addstr(0, 0, "GPU"[:width - 1])
         stdscr.attroff(curses.color_pair(4))
 
-def draw_utilization_graph(stdscr, row, col, gpu_id, util_percent, config):
+def draw_utilization_graph(stdscr, row, col, history, util_percent, config):
     """Draw utilization graph adapted to terminal size"""
     if not config['show_graphs']:
         return row
 
-    history = utilization_history[gpu_id]
     spark_chars = config['spark_chars']
     graph_width = config['graph_width']
 
@@ -348,7 +502,7 @@ def format_memory(memory_bytes: Optional[int]) -> str:
         return f"{memory_bytes / 1024:.1f} KB"
     return f"{memory_bytes} B"
 
-def draw_gpu_info(stdscr, row, col, gpu_id, metrics, config):
+def draw_gpu_info(stdscr, row, col, gpu_id, metrics, history, config):
     """Draw GPU information based on display configuration"""
     box_chars = BOX_CHARS[config['size']]
 
@@ -379,9 +533,7 @@ def draw_gpu_info(stdscr, row, col, gpu_id, metrics, config):
     clock = float(metrics.get("gpu_clock_mhz", 0))
     power = float(metrics.get("gpu_power_watts", 0))
     health = metrics.get("gpu_health", "unknown").lower()
-    gpu_uuid = metrics.get("uuid", "")
-
-    utilization_history[gpu_id].append(util)
+    processes = metrics.get("processes", [])
 
     if config['show_detailed_stats']:
         stdscr.addstr(row, col, prefix)
@@ -410,11 +562,10 @@ def draw_gpu_info(stdscr, row, col, gpu_id, metrics, config):
         stdscr.addstr(row, col, f"T:{temperature:3.0f}° M:{mem_util:3.0f}% ")
         row += 1
 
-    row = draw_utilization_graph(stdscr, row, col, gpu_id, util, config)
+    row = draw_utilization_graph(stdscr, row, col, history, util, config)
 
-    if config['show_processes'] and gpu_uuid:
+    if config['show_processes']:
         try:
-            processes = fetch_gpu_processes(gpu_uuid)
             if processes:
                 if config['size'] == 'large':
                     stdscr.addstr(row, col, f"{prefix}Processes:")
@@ -441,9 +592,15 @@ def draw_gpu_info(stdscr, row, col, gpu_id, metrics, config):
 
     return row + 1
 
+def format_axis_label(value: float, unit: str) -> str:
+    """Fit a y-axis label into the 7 columns left of the chart"""
+    if len(unit) == 1:
+        return f"{value:6.1f}{unit}"
+    return f"{value:4.0f}{unit}"[:7]
+
 def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -> None:
     """Draw the detailed Braille-based high-resolution charts"""
-    stdscr.clear()
+    stdscr.erase()
     rows, cols = stdscr.getmaxyx()
 
     try:
@@ -452,7 +609,13 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
         pass
     stdscr.box()
     stdscr.addstr(0, 2, "[ GPU High-Resolution Monitor - DETAILED VIEW ]")
-    stdscr.addstr(0, cols - 30, "[ Press 'o' for standard | 'q' quit ]")
+    stdscr.addstr(0, cols - 40, "[ 'o' standard | 'm' metric | 'q' quit ]")
+
+    selected = select_gpus(all_data)
+    available_rows = rows - 2
+    # Charts need at least 6 rows each; the rest of the GPUs are a scroll away
+    per_page = max(1, min(len(selected), available_rows // 6))
+    gpu_range = visible_range(len(selected), per_page)
     try:
         stdscr.attroff(curses.color_pair(1))
     except:
@@ -462,7 +625,7 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
         stdscr.attron(curses.color_pair(3))
     except:
         pass
-    status_text = f"Status: {last_status}"
+    status_text = f"Status: {last_status} | {view.position(len(selected))} | sort: {view.sort} | filter: {view.filter}"
     if len(status_text) > cols - 4:
         status_text = status_text[:cols - 4]
     stdscr.addstr(rows - 1, 2, status_text)
@@ -483,19 +646,21 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
             pass
         return
 
-    num_gpus = len(all_data)
-    available_rows = rows - 2
-    if num_gpus == 0:
+    if not selected:
+        stdscr.addstr(rows // 2, (cols - 30) // 2, f"No GPUs match '{view.filter}'")
         return
-    height_per_chart = available_rows // num_gpus
+    height_per_chart = available_rows // per_page
 
     if height_per_chart < 6:
-        stdscr.addstr(rows // 2, (cols - 35) // 2, f"Terminal too small for {num_gpus} charts!")
+        stdscr.addstr(rows // 2, (cols - 20) // 2, "Terminal too small!")
         return
 
+    metric = list(HISTORY_METRICS)[view.metric % len(HISTORY_METRICS)]
+    metric_title, unit, scale_max = HISTORY_METRICS[metric]
+
     chart_y_offset = 1
-    for uuid, gpu in all_data.items():
-        data = gpu.utilization_history
+    for position in gpu_range:
+        gpu = selected[position]
 
         plot_start_y = chart_y_offset
         plot_height = height_per_chart - 3
@@ -506,7 +671,7 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
             stdscr.attron(curses.color_pair(4))
         except:
             pass
-        title = gpu.name[:plot_width - 2] if len(gpu.name) > plot_width - 2 else gpu.name
+        title = f"{gpu.name} - {metric_title}"[:plot_width - 2]
         stdscr.addstr(plot_start_y, plot_start_x, title)
         try:
             stdscr.attroff(curses.color_pair(4))
@@ -547,8 +712,12 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
             except:
                 pass
 
+        data = gpu.history[metric].window(2 * plot_width)
         min_val = 0.0
-        max_val = 100.0
+        if scale_max is not None:
+            max_val = scale_max
+        else:
+            max_val = max(1.0, float(data.max()) * 1.1) if len(data) else 1.0
 
         try:
             stdscr.attron(curses.color_pair(3))
@@ -558,9 +727,9 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
             stdscr.vline(plot_start_y + 3, plot_start_x - 1, curses.ACS_VLINE, plot_height)
         except:
             pass
-        stdscr.addstr(plot_start_y + 3, 0, f"{max_val:6.1f}%")
-        stdscr.addstr(plot_start_y + 3 + plot_height // 2, 0, f"{(min_val + max_val) / 2.0:6.1f}%")
-        stdscr.addstr(plot_start_y + 3 + plot_height - 1, 0, f"{min_val:6.1f}%")
+        stdscr.addstr(plot_start_y + 3, 0, format_axis_label(max_val, unit))
+        stdscr.addstr(plot_start_y + 3 + plot_height // 2, 0, format_axis_label((min_val + max_val) / 2.0, unit))
+        stdscr.addstr(plot_start_y + 3 + plot_height - 1, 0, format_axis_label(min_val, unit))
         try:
             stdscr.attroff(curses.color_pair(3))
         except:
@@ -571,55 +740,20 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
         except:
             pass
 
-        braille_buffer = [[0 for _ in range(plot_width)] for _ in range(plot_height)]
-        data_offset = max(0, len(data) - plot_width)
-        value_range = max_val - min_val
-        if value_range < 1e-9:
-            value_range = 1.0
-
-        for i in range(plot_width):
-            if i + data_offset < len(data):
-                value = data[i + data_offset]
-                value = max(min_val, min(max_val, value))
-                high_res_y = int(((value - min_val) / value_range) * (plot_height * 4 - 1))
-                char_y = high_res_y // 4
-                dot_y = high_res_y % 4
-                if 0 <= char_y < plot_height:
-                    for j in range(char_y):
-                        braille_buffer[j][i] = 0b1111
-                    for j in range(dot_y + 1):
-                        braille_buffer[char_y][i] |= (1 << j)
-
-        for y in range(plot_height):
-            for x in range(plot_width):
-                bits = braille_buffer[plot_height - 1 - y][x]
-                if bits > 0:
-                    percentage = y / plot_height
-                    try:
-                        if percentage > 0.75:
-                            stdscr.attron(curses.color_pair(1))
-                        elif percentage > 0.4:
-                            stdscr.attron(curses.color_pair(2))
-                        else:
-                            stdscr.attron(curses.color_pair(3))
-                    except:
-                        pass
-
-                    braille_char = chr(0x2800 | bits)
-                    try:
-                        stdscr.addstr(plot_start_y + 3 + y, plot_start_x + x, braille_char)
-                    except:
-                        pass
-
-                    try:
-                        if percentage > 0.75:
-                            stdscr.attroff(curses.color_pair(6))
-                        elif percentage > 0.4:
-                            stdscr.attroff(curses.color_pair(5))
-                        else:
-                            stdscr.attroff(curses.color_pair(2))
-                    except:
-                        pass
+        # Rows are colored in bands: green at the bottom, yellow in the middle, red at the top
+        chart_rows = braille.to_rows(braille.rasterize(data, plot_width, plot_height, min_val, max_val))
+        for y, row_text in enumerate(chart_rows):
+            percentage = y / plot_height
+            if percentage > 0.75:
+                color = curses.color_pair(1)
+            elif percentage > 0.4:
+                color = curses.color_pair(2)
+            else:
+                color = curses.color_pair(3)
+            # Columns without samples yet stay untouched
+            text = row_text.lstrip(' ')
+            if text:
+                stdscr.addstr(plot_start_y + 3 + y, plot_start_x + len(row_text) - len(text), text, color)
 
         chart_y_offset += height_per_chart
 
@@ -628,11 +762,119 @@ def draw_detailed_view(stdscr, all_data: Dict[str, GpuData], last_status: str) -
     except:
         pass
 
-def draw_screen(stdscr):
-    global detailed_view_mode
+def draw_gpu_panels(stdscr, row, selected: List[GpuData], by_uuid, max_gpus, config) -> int:
+    """Draw panels from the scroll offset on until the screen is full; returns how many were drawn"""
+    max_y = stdscr.getmaxyx()[0]
+    gpus_displayed = 0
+    for position in range(view.offset, len(selected)):
+        if gpus_displayed >= max_gpus or row >= max_y - 3:
+            break
 
-    curses.curs_set(0)
-    stdscr.nodelay(True)
+        gpu = selected[position]
+        gpu_id, metrics = by_uuid[gpu.uuid]
+        history = gpu.history["gpu_utilization_percent"].window(config['graph_width'])
+        row = draw_gpu_info(stdscr, row, 0, gpu_id, metrics, history, config)
+        gpus_displayed += 1
+    return gpus_displayed
+
+def draw_standard_view(stdscr, data, gpus: Dict[str, GpuData], status: Optional[str] = None) -> None:
+    """Draw the standard per-GPU overview with sparklines; `status` (e.g. the replay position) replaces the update interval in the footer"""
+    max_y, max_x = stdscr.getmaxyx()
+    config = get_display_config(max_x, max_y)
+
+    stdscr.erase()
+    draw_header(stdscr, max_x, config)
+
+    if config['size'] == 'large':
+        stdscr.attron(curses.color_pair(5))
+        stdscr.addstr(1, 0, f" Terminal: {max_x}x{max_y} │ Mode: {config['size'].upper()} │ 'o' detailed │ 't' table │ 's' sort │ 'f' filter │ ↑↓/PgUp/PgDn scroll │ 'q' quit "[:max_x - 1])
+        stdscr.attroff(curses.color_pair(5))
+
+    # Panels of the GPUs scrolled past or below the screen are never drawn
+    by_uuid = {metrics.get("uuid"): (gpu_id, metrics) for gpu_id, metrics in data.items() if isinstance(metrics, dict)}
+    selected = [gpu for gpu in select_gpus(gpus) if gpu.uuid in by_uuid]
+
+    if isinstance(data, dict) and "error" in data:
+        stdscr.addstr(2, 0, f"Error: {data['error']}"[:max_x - 1])
+    else:
+        first_row = 2 if config['size'] != 'large' else 3
+        max_gpus = max(1, (max_y - 4) // (6 if config['size'] == 'large' else 4 if config['size'] == 'medium' else 3))
+
+        # Panels grow with the process list, so a page is however many fit last frame
+        view.offset = max(0, min(view.offset, len(selected) - view.page_size))
+        gpus_displayed = draw_gpu_panels(stdscr, first_row, selected, by_uuid, max_gpus, config)
+        if view.offset + gpus_displayed < len(selected) <= view.offset + view.page_size:
+            # Scrolled to the end but the last page holds fewer panels: pull it up to end on the last GPU
+            view.offset = len(selected) - gpus_displayed
+            for y in range(first_row, max_y - 1):
+                stdscr.addstr(y, 0, " " * (max_x - 1))
+            gpus_displayed = draw_gpu_panels(stdscr, first_row, selected, by_uuid, max_gpus, config)
+        view.page_size = max(1, gpus_displayed)
+
+    stdscr.attron(curses.color_pair(4))
+    position = view.position(len(selected))
+    if config['size'] == 'minimal':
+        footer = f"o:detail t:table q:quit {view.offset + 1}/{len(selected)}"
+    elif config['size'] == 'small':
+        footer = f" 'o' detailed | 't' table | 'q' quit | {position} "
+    else:
+        footer = f" {position} | sort: {view.sort} | filter: {view.filter} | 'o' detailed | 't' table | 'q' quit | "
+        footer += f"{status} " if status else f"Updates every {POLL_INTERVAL:g} seconds "
+
+    stdscr.addstr(max_y - 1, 0, footer.ljust(max_x)[:max_x - 1])
+    stdscr.attroff(curses.color_pair(4))
+
+TABLE_HEADER = f"{'IDX':>4} {'NAME':<20} {'UTIL':>6} {'TEMP':>6} {'MEM':>6} {'POWER':>7} {'CLOCK':>8} {'HEALTH':<9} HISTORY"
+
+def draw_table_view(stdscr, gpus: Dict[str, GpuData], last_status: str) -> None:
+    """Draw one line per GPU, for nodes with more GPUs than fit as panels"""
+    max_y, max_x = stdscr.getmaxyx()
+    config = get_display_config(max_x, max_y)
+
+    stdscr.erase()
+    draw_header(stdscr, max_x, config)
+
+    stdscr.attron(curses.color_pair(4) | curses.A_BOLD)
+    stdscr.addstr(1, 0, TABLE_HEADER[:max_x - 1])
+    stdscr.attroff(curses.color_pair(4) | curses.A_BOLD)
+
+    selected = select_gpus(gpus)
+    spark_chars = SPARK_CHARS_NORMAL
+    spark_col = len(TABLE_HEADER) - len("HISTORY")
+    spark_width = max(0, max_x - 1 - spark_col)
+    health_colors = {"healthy": curses.color_pair(1), "warning": curses.color_pair(2), "critical": curses.color_pair(3)}
+
+    for row, position in enumerate(visible_range(len(selected), max_y - 3), start=2):
+        gpu = selected[position]
+        util = gpu.history["gpu_utilization_percent"].latest()
+        temperature = gpu.temperature_c
+        temp_color = curses.color_pair(3) if temperature > 80 else curses.color_pair(2) if temperature > 60 else curses.color_pair(1)
+        health = gpu.health.lower() or "unknown"
+
+        stdscr.addstr(row, 0, f"{gpu.index:>4} {gpu.name[:20]:<20} ")
+        stdscr.addstr(f"{util:5.1f}%", get_utilization_color(util))
+        stdscr.addstr(" ")
+        stdscr.addstr(f"{temperature:5.1f}C", temp_color)
+        stdscr.addstr(" ")
+        stdscr.addstr(f"{gpu.memory_usage_percent:5.1f}%", get_utilization_color(gpu.memory_usage_percent))
+        stdscr.addstr(f" {gpu.power_watts:6.1f}W {gpu.clock_mhz:5.0f}MHz ")
+        stdscr.addstr(f"{health.capitalize():<9}", health_colors.get(health, curses.color_pair(0)))
+        stdscr.addstr(" ")
+
+        for value in gpu.history["gpu_utilization_percent"].window(spark_width):
+            idx = min(max(int(value / 100 * (len(spark_chars) - 1)), 0), len(spark_chars) - 1)
+            stdscr.addstr(spark_chars[idx], get_utilization_color(value))
+
+    if not selected:
+        stdscr.addstr(3, 1, f"No GPUs match '{view.filter}'"[:max_x - 2])
+
+    stdscr.attron(curses.color_pair(4))
+    footer = (f" {view.position(len(selected))} | sort: {view.sort} | filter: {view.filter}"
+              f" | 't' panels | 's' sort | 'f' filter | 'q' quit | {last_status} ")
+    stdscr.addstr(max_y - 1, 0, footer.ljust(max_x)[:max_x - 1])
+    stdscr.attroff(curses.color_pair(4))
+
+def init_colors():
     curses.start_color()
     curses.use_default_colors()
 
@@ -643,73 +885,153 @@ def draw_screen(stdscr):
     curses.init_pair(5, curses.COLOR_BLUE, -1)     # Idle/Low
     curses.init_pair(6, curses.COLOR_MAGENTA, -1)  # Additional color
 
-    all_gpu_data: Dict[str, GpuData] = {}
-    last_status = "Initializing..."
-
-    while True:
-        key = stdscr.getch()
-        if key == ord("q"):
-            break
-        elif key == ord("o") or key == ord("O"):
-            detailed_view_mode = not detailed_view_mode
-
-        result = fetch_data()
-        if "error" in result:
-            last_status = f"Error: {result['error']}"
-            data = {}
-        else:
-            data = result["data"]
-            raw_data = result["raw"]
-            last_status = f"OK. Fetched data for {len(data)} GPUs."
-
-            if raw_data:
-                try:
-                    parse_all_gpu_data(raw_data, all_gpu_data)
-                except Exception as e:
-                    last_status = f"Parse Error: {str(e)}"
-
-        if detailed_view_mode:
-            draw_detailed_view(stdscr, all_gpu_data, last_status)
-        else:
-            max_y, max_x = stdscr.getmaxyx()
-            config = get_display_config(max_x, max_y)
-
-            stdscr.clear()
-            draw_header(stdscr, max_x, config)
-
-            if config['size'] == 'large':
-                stdscr.attron(curses.color_pair(5))
-                stdscr.addstr(1, 0, f" Terminal: {max_x}x{max_y} │ Mode: {config['size'].upper()} │ Press 'o' for detailed view │ 'q' to quit "[:max_x - 1])
-                stdscr.attroff(curses.color_pair(5))
-
-            if isinstance(data, dict) and "error" in data:
-                stdscr.addstr(2, 0, f"Error: {data['error']}"[:max_x - 1])
-            else:
-                row = 2 if config['size'] != 'large' else 3
-                gpus_displayed = 0
-                max_gpus = max(1, (max_y - 4) // (6 if config['size'] == 'large' else 4 if config['size'] == 'medium' else 3))
-
-                for gpu_id, metrics in sorted(data.items()):
-                    if gpus_displayed >= max_gpus or row >= max_y - 3:
-                        break
+def draw_screen(stdscr, fetcher: DataFetcher):
+    curses.curs_set(0)
+    # getch() doubles as the frame limiter: it returns on a key press or after one frame
+    stdscr.timeout(max(1, int(1000 / TARGET_FPS)))
+    init_colors()
 
-                    row = draw_gpu_info(stdscr, row, 0, gpu_id, metrics, config)
-                    gpus_displayed += 1
+    fetcher.start()
 
-            stdscr.attron(curses.color_pair(4))
-            if config['size'] == 'minimal':
-                footer = "o:detail q:quit"
-            elif config['size'] == 'small':
-                footer = " 'o' detailed view | 'q' quit "
+    frame = FrameBuffer()
+    drawn_seq = None
+    drawn_size = None
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == ord("q"):
+                break
+            elif key == ord("o") or key == ord("O"):
+                view.mode = "standard" if view.mode == "detailed" else "detailed"
+            elif key == ord("t") or key == ord("T"):
+                view.mode = "standard" if view.mode == "table" else "table"
+            elif key == ord("m") or key == ord("M"):
+                view.metric = (view.metric + 1) % len(HISTORY_METRICS)
+            elif key == ord("s") or key == ord("S"):
+                view.cycle("sort", GPU_SORT_KEYS)
+            elif key == ord("f") or key == ord("F"):
+                view.cycle("filter", GPU_FILTERS)
+            elif key in (curses.KEY_DOWN, ord("j")):
+                view.scroll(1)
+            elif key in (curses.KEY_UP, ord("k")):
+                view.scroll(-1)
+            elif key in (curses.KEY_NPAGE, ord(" ")):
+                view.scroll(view.page_size)
+            elif key == curses.KEY_PPAGE:
+                view.scroll(-view.page_size)
+            elif key in (curses.KEY_HOME, ord("g")):
+                view.offset = 0
+            elif key in (curses.KEY_END, ord("G")):
+                view.scroll(sys.maxsize)
+            elif key == curses.KEY_LEFT:
+                fetcher.seek(-SEEK_SECONDS)
+            elif key == curses.KEY_RIGHT:
+                fetcher.seek(SEEK_SECONDS)
+            elif fetcher.player and key in (ord("+"), ord("="), ord("-")):
+                speeds = recording.Player.SPEEDS
+                faster = [speed for speed in speeds if speed > fetcher.player.speed]
+                slower = [speed for speed in speeds if speed < fetcher.player.speed]
+                if key == ord("-"):
+                    fetcher.set_speed(slower[-1] if slower else speeds[0])
+                else:
+                    fetcher.set_speed(faster[0] if faster else speeds[-1])
+            elif key == curses.KEY_RESIZE:
+                drawn_size = None
+            if key != -1:
+                drawn_seq = None
+
+            snapshot = fetcher.latest()
+            size = stdscr.getmaxyx()
+            if snapshot.seq == drawn_seq and size == drawn_size:
+                continue
+
+            if size != frame.getmaxyx():
+                frame.resize(*size)
+                stdscr.clear()
+
+            # Compose off-screen, then send only the cells that changed since the last frame
+            if view.mode == "detailed":
+                draw_detailed_view(frame, snapshot.gpus, snapshot.status)
+            elif view.mode == "table":
+                draw_table_view(frame, snapshot.gpus, snapshot.status)
             else:
-                footer = " Press 'o' for detailed view | 'q' to quit | Updates every 2 seconds "
+                draw_standard_view(frame, snapshot.data, snapshot.gpus, snapshot.status if fetcher.player else None)
+
+            frame.flush(stdscr)
+            stdscr.refresh()
+            drawn_seq, drawn_size = snapshot.seq, size
+    finally:
+        fetcher.stop()
+
+def record_headless(fetcher: DataFetcher) -> None:
+    """Poll and record without the UI until interrupted, printing one status line per poll"""
+    fetcher.start()
+    seq = 0
+    try:
+        while fetcher.is_alive():
+            snapshot = fetcher.latest()
+            if snapshot.seq != seq:
+                seq = snapshot.seq
+                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {snapshot.status}", flush=True)
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
 
-            stdscr.addstr(max_y - 1, 0, footer.ljust(max_x)[:max_x - 1])
-            stdscr.attroff(curses.color_pair(4))
+def main():
+    global BASE_URL, METHOD, URL, POLL_INTERVAL, TARGET_FPS
+
+    parser = argparse.ArgumentParser(description="GPU Monitor TUI")
+    parser.add_argument("ip_port", type=str, nargs="?", help="Server address in the form IP:PORT")
+    parser.add_argument("method", type=str, nargs="?", help="Metric method, e.g., sim")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="Seconds between API polls")
+    parser.add_argument("--fps", type=float, default=TARGET_FPS, help="Maximum redraws per second")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--record", metavar="FILE", help="Append every poll to a recording")
+    source.add_argument("--replay", metavar="FILE", help="Play a recording back instead of polling a server")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, e.g. 1, 10 or 100")
+    parser.add_argument("--seek", type=float, default=0.0, help="Start the replay this many seconds into the recording")
+    parser.add_argument("--headless", action="store_true", help="Record without the UI (with --record)")
+    args = parser.parse_args()
+
+    if not args.replay and not (args.ip_port and args.method):
+        parser.error("ip_port and method are required unless replaying a recording")
+    if args.headless and not args.record:
+        parser.error("--headless needs --record")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    if args.ip_port:
+        BASE_URL = f"http://{args.ip_port}"
+        METHOD = args.method
+        URL = f"{BASE_URL}/gpu/metric?method={METHOD}"
+    POLL_INTERVAL = max(0.1, args.interval)
+    TARGET_FPS = max(1.0, args.fps)
+
+    recorder = player = None
+    try:
+        if args.record:
+            recorder = recording.Recorder(args.record)
+        if args.replay:
+            # Enough frames before a seek target to refill the history buffers
+            player = recording.Player(recording.Recording(args.replay), args.speed, warmup=MAX_DATA_POINTS)
+            if args.seek:
+                player.seek(args.seek)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    fetcher = DataFetcher(POLL_INTERVAL, recorder=recorder, player=player)
 
-        stdscr.refresh()
-        # time.sleep(1)
+    try:
+        if args.headless:
+            record_headless(fetcher)
+        else:
+            locale.setlocale(locale.LC_ALL, "")
+            curses.wrapper(draw_screen, fetcher)
+    finally:
+        fetcher.stop()
+        if recorder:
+            # Let a poll in flight finish its frame
+            fetcher.join(timeout=10)
+            recorder.close()
 
 if __name__ == "__main__":
-    locale.setlocale(locale.LC_ALL, "")
-    curses.wrapper(draw_screen)
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+Recordings of what the dashboard fetched, for replaying incidents.
+
+A recording is a magic line followed by frames, one per poll. Each frame is
+a little-endian header of the poll's unix time (float64) and the payload size
+(uint32), then the payload: zlib-compressed JSON of the exposition text (or
+the error) and the process list of every GPU. Frames are only ever appended
+and flushed one by one, so a recording cut short by a crash or a kill is
+readable up to its last complete frame.
+"""
+import os
+import json
+import time
+import zlib
+import struct
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b"GPUMON-REC 1\n"
+FRAME_HEADER = struct.Struct("<dI")
+
+
+@dataclass
+class Frame:
+    """One poll of the API"""
+    time: float
+    metrics: Optional[str] = None  # Exposition text, None when the poll failed
+    error: str = ""
+    # uuid -> [{"pid": ..., "gpu_memory": ...}]; None until the processes are fetched
+    processes: Optional[Dict[str, List[dict]]] = None
+
+    def encode(self) -> bytes:
+        payload = zlib.compress(json.dumps(
+            {"metrics": self.metrics, "error": self.error, "processes": self.processes or {}},
+            separators=(",", ":")).encode())
+        return FRAME_HEADER.pack(self.time, len(payload)) + payload
+
+    @classmethod
+    def decode(cls, timestamp: float, payload: bytes) -> "Frame":
+        fields = json.loads(zlib.decompress(payload))
+        return cls(timestamp, fields["metrics"], fields["error"], fields["processes"])
+
+
+class Recorder:
+    """Appends frames to a recording, creating it if needed"""
+
+    def __init__(self, path: str):
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            existing = Recording(path)
+            existing.close()
+            self._file = open(path, "r+b")
+            # Drop a frame left half-written by a previous session
+            self._file.truncate(existing.end)
+            self._file.seek(existing.end)
+        else:
+            self._file = open(path, "wb")
+            self._file.write(MAGIC)
+
+    def write(self, frame: Frame) -> None:
+        self._file.write(frame.encode())
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Recording:
+    """Random access to the frames of a recording; only the frame headers are read up front"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"{path} is not a dashboard recording")
+
+        size = os.fstat(self._file.fileno()).st_size
+        self.times: List[float] = []
+        self._offsets: List[int] = []
+        self._sizes: List[int] = []
+        offset = self.end = len(MAGIC)  # `end`: where the next frame goes
+        while offset + FRAME_HEADER.size <= size:
+            timestamp, length = FRAME_HEADER.unpack(self._file.read(FRAME_HEADER.size))
+            offset += FRAME_HEADER.size
+            if offset + length > size:
+                break  # Truncated last frame
+            self.times.append(timestamp)
+            self._offsets.append(offset)
+            self._sizes.append(length)
+            offset = self.end = offset + length
+            self._file.seek(offset)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, index: int) -> Frame:
+        self._file.seek(self._offsets[index])
+        return Frame.decode(self.times[index], self._file.read(self._sizes[index]))
+
+    def index_at(self, timestamp: float) -> int:
+        """Index of the last frame recorded at or before `timestamp` (the first frame if none was)"""
+        return max(0, bisect_right(self.times, timestamp) - 1)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Player:
+    """
+    Plays a recording back `speed` times faster than it was recorded.
+
+    `due()` hands out the frames whose time has come since the previous call.
+    After a seek, playback restarts up to `warmup` frames before the target so
+    the consumer can rebuild its history from a clean slate.
+    """
+    SPEEDS = (1.0, 10.0, 100.0)
+
+    def __init__(self, recording: Recording, speed: float = 1.0, warmup: int = 0):
+        if not len(recording):
+            raise ValueError(f"{recording.path} has no frames")
+        self.recording = recording
+        self.speed = speed
+        self.warmup = warmup
+        self.position = 0  # Next frame to play
+        self._restart = False
+        self._lock = threading.Lock()
+        self._anchor(recording.times[0])
+
+    def _anchor(self, timestamp: float) -> None:
+        # The playback clock: recording time `timestamp` is now
+        self._anchor_wall = time.monotonic()
+        self._anchor_time = timestamp
+
+    def clock(self) -> float:
+        """The recording time being played"""
+        return self._anchor_time + (time.monotonic() - self._anchor_wall) * self.speed
+
+    def finished(self) -> bool:
+        return self.position >= len(self.recording)
+
+    def set_speed(self, speed: float) -> None:
+        with self._lock:
+            self._anchor(self.clock())
+            self.speed = speed
+
+    def seek(self, seconds: float) -> None:
+        """Jumps `seconds` of recording time forwards or backwards"""
+        with self._lock:
+            times = self.recording.times
+            # The clock runs on past the last frame; seek from where playback stopped
+            target = min(max(min(self.clock(), times[-1]) + seconds, times[0]), times[-1])
+            self.position = self.recording.index_at(target)
+            self._restart = True
+            self._anchor(times[self.position])
+
+    def due(self) -> Tuple[bool, List[Frame]]:
+        """`(restart, frames)`: the frames to feed now, and whether state from earlier frames must be dropped first"""
+        with self._lock:
+            start = self.position
+            restart, self._restart = self._restart, False
+            if restart:
+                start = max(0, start - self.warmup)
+            end = max(self.position, bisect_right(self.recording.times, self.clock()))
+            self.position = end
+        return restart, [self.recording[i] for i in range(start, end)]
+
+    def delay(self) -> Optional[float]:
+        """Wall-clock seconds until the next frame is due; None at the end of the recording"""
+        with self._lock:
+            if self.finished():
+                return None
+            return max(0.0, (self.recording.times[self.position] - self.clock()) / self.speed)